@@ -9,11 +9,15 @@ See also: http://developer.github.com/v3/actions/
 """
 
 from .secrets import OrganizationSecret
+from .secrets import PublicKey
 from .secrets import RepositorySecret
+from .secrets import SecretsManager
 from .secrets import SharedOrganizationSecret
 
 __all__ = (
     "OrganizationSecret",
+    "PublicKey",
     "RepositorySecret",
+    "SecretsManager",
     "SharedOrganizationSecret",
 )
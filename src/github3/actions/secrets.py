@@ -1,9 +1,28 @@
 """This module contains all the classes relating to GitHub Actions secrets."""
 
+import base64
+import functools
+import threading
 import typing
 
+from .. import crawler
+from .. import exceptions
 from .. import models
 
+if typing.TYPE_CHECKING:
+    from ..repos import repo as _repo
+
+
+@functools.lru_cache(maxsize=1024)
+def _sealed_box(key):
+    try:
+        from nacl import public
+    except ImportError:
+        raise ImportError(
+            "Encrypting secrets requires PyNaCl, install github3.py[secrets]"
+        )
+    return public.SealedBox(public.PublicKey(base64.b64decode(key)))
+
 
 class PublicKey(models.GitHubCore):
     """Object representing a Public Key for GitHub Actions secrets.
@@ -29,6 +48,29 @@ class PublicKey(models.GitHubCore):
     def __str__(self):
         return self.key
 
+    def encrypt(self, value: typing.Union[str, bytes]) -> str:
+        """Encrypt a secret's value with this key.
+
+        This requires PyNaCl, which is installed with
+        ``pip install github3.py[secrets]``.
+
+        .. versionadded:: 4.1.0
+
+        :param value:
+            the value of the secret
+        :type value:
+            str or bytes
+        :returns:
+            the sealed value encoded with base64, as expected by
+            ``create_or_update_secret``
+        :rtype:
+            str
+        """
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        sealed = _sealed_box(self.key).encrypt(value)
+        return base64.b64encode(sealed).decode("ascii")
+
 
 class _Secret(models.GitHubCore):
     """Base class for all secrets for GitHub Actions.
@@ -231,3 +273,173 @@ class OrganizationSecret(_Secret):
 
         url = "/".join([self.selected_repositories_url, str(repository_id)])
         return self._boolean(self._delete(url), 204, 409)
+
+
+class SecretsManager:
+    """Set a secret on many repositories concurrently.
+
+    The public key of each repository is fetched once and cached, values are
+    encrypted locally, and the requests are made by a
+    :class:`~github3.crawler.Crawler`, so they are spread out to stay within
+    the rate limit.
+
+    .. code-block:: python
+
+        manager = SecretsManager(gh)
+        results = manager.update_repositories(
+            org.repositories(), "DEPLOY_TOKEN", token, not_updated_since=start
+        )
+        failed = [name for name, result in results.items()
+                  if isinstance(result, Exception)]
+
+    Encrypting values requires PyNaCl, which is installed with
+    ``pip install github3.py[secrets]``.
+
+    .. versionadded:: 4.1.0
+
+    :param github:
+        the object whose session is used, usually a
+        :class:`~github3.github.GitHub` instance
+    :param int max_workers:
+        (optional), the number of repositories updated at once. Default: 8
+    :param int reserve:
+        (optional), the number of requests to leave unused. Default: 100
+    """
+
+    def __init__(
+        self,
+        github: models.GitHubCore,
+        max_workers: int = 8,
+        reserve: int = 100,
+    ) -> None:
+        self.github = github
+        self.max_workers = max_workers
+        self.reserve = reserve
+        self._keys: typing.Dict[str, PublicKey] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<SecretsManager [{len(self._keys)} keys]>"
+
+    def public_key(
+        self, owner: "_repo._Repository", refresh: bool = False
+    ) -> PublicKey:
+        """Retrieve the public key of a repository or organization.
+
+        :param owner:
+            the repository or organization
+        :param bool refresh:
+            (optional), fetch the key even if it is cached. Default: False
+        :returns:
+            the public key
+        :rtype:
+            :class:`~github3.actions.secrets.PublicKey`
+        """
+        url = owner._api
+        with self._lock:
+            key = self._keys.get(url)
+        if key is None or refresh:
+            key = owner.public_key()
+            with self._lock:
+                self._keys[url] = key
+        return key
+
+    def update_repository(
+        self,
+        repository: "_repo._Repository",
+        secret_name: str,
+        value: typing.Union[str, bytes],
+        not_updated_since=None,
+    ) -> str:
+        """Create or update a secret on one repository.
+
+        :param repository:
+            the repository
+        :param str secret_name:
+            the name of the secret
+        :param value:
+            the unencrypted value of the secret
+        :type value:
+            str or bytes
+        :param not_updated_since:
+            (optional), skip the repository if its secret was updated at or
+            after this timezone-aware time, e.g., when resuming a rotation
+        :type not_updated_since:
+            :class:`~datetime.datetime`
+        :returns:
+            ``"skipped"`` or ``"updated"``
+        :rtype:
+            str
+        """
+        url = repository._build_url(
+            "actions", "secrets", secret_name, base_url=repository._api
+        )
+        if not_updated_since is not None:
+            response = repository._get(url)
+            if response.status_code != 404:
+                secret = RepositorySecret(
+                    repository._json(response, 200), repository.session
+                )
+                if secret.updated_at >= not_updated_since:
+                    return "skipped"
+
+        for attempt in range(2):
+            key = self.public_key(repository, refresh=attempt > 0)
+            data = {
+                "encrypted_value": key.encrypt(value),
+                "key_id": key.key_id,
+            }
+            response = repository._put(url, json=data)
+            if response.status_code in (201, 204):
+                return "updated"
+            # The cached key may have been rotated
+            if response.status_code != 422:
+                break
+        raise exceptions.error_for(response)
+
+    def update_repositories(
+        self,
+        repositories: typing.Iterable["_repo._Repository"],
+        secret_name: str,
+        value: typing.Union[str, bytes],
+        not_updated_since=None,
+    ) -> typing.Dict[str, typing.Any]:
+        """Create or update a secret on many repositories concurrently.
+
+        :param repositories:
+            the repositories, e.g., from
+            :meth:`~github3.orgs.Organization.repositories`
+        :param str secret_name:
+            the name of the secret
+        :param value:
+            the unencrypted value of the secret
+        :type value:
+            str or bytes
+        :param not_updated_since:
+            (optional), skip repositories whose secret was updated at or
+            after this timezone-aware time
+        :type not_updated_since:
+            :class:`~datetime.datetime`
+        :returns:
+            the result of each repository keyed by full name: ``"updated"``,
+            ``"skipped"``, or the :class:`~github3.exceptions.GitHubError`
+            that was raised
+        :rtype:
+            dict
+        """
+        pusher = crawler.Crawler(
+            self.github, max_workers=self.max_workers, reserve=self.reserve
+        )
+        pusher.add_task(
+            lambda repository: self.update_repository(
+                repository, secret_name, value, not_updated_since
+            ),
+            name=secret_name,
+        )
+        pusher.run(repositories)
+        results: typing.Dict[str, typing.Any] = {
+            name: result for (name, _), result in pusher.results.items()
+        }
+        for (name, _), error in pusher.errors.items():
+            results[name] = error
+        return results
@@ -0,0 +1,212 @@
+"""Caching of immutable git objects addressed by their SHA."""
+
+import collections
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import typing as t
+
+#: Matches full SHA-1 (and SHA-256) object names
+FULL_SHA = re.compile(r"^(?:[0-9a-f]{40}|[0-9a-f]{64})$")
+
+
+def is_full_sha(sha: t.Any) -> bool:
+    """Check whether ``sha`` is a complete git object name.
+
+    Abbreviated SHAs, branch names, and tag names may all point at different
+    objects over time, so only complete object names can be cached.
+    """
+    return isinstance(sha, str) and FULL_SHA.match(sha) is not None
+
+
+class ObjectCache:
+    """A cache of the JSON for immutable objects keyed by their API URL.
+
+    Git blobs, trees, commits, and annotated tags never change once they are
+    addressed by their SHA, so the cached responses never need to be
+    revalidated with GitHub. Entries are kept in memory, up to
+    ``max_memory_size`` bytes, and optionally in ``directory`` on disk, up to
+    ``max_disk_size`` bytes. When either store grows past its limit, the least
+    recently used entries are evicted.
+
+    To have github3.py consult a cache, use
+    :meth:`~github3.github.GitHub.set_object_cache`:
+
+    .. code-block:: python
+
+        gh = github3.login(token=token)
+        gh.set_object_cache(
+            github3.cache.ObjectCache(directory="/var/cache/github3")
+        )
+
+    .. versionadded:: 4.1.0
+
+    :param int max_memory_size:
+        (optional), the number of bytes of JSON to keep in memory.
+        Default: 32 MiB
+    :param str directory:
+        (optional), the directory to persist entries to. Default: entries are
+        only kept in memory
+    :param int max_disk_size:
+        (optional), the number of bytes to keep in ``directory``.
+        Default: 1 GiB
+    """
+
+    def __init__(
+        self,
+        max_memory_size: int = 32 * 1024 * 1024,
+        directory: t.Optional[str] = None,
+        max_disk_size: int = 1024 * 1024 * 1024,
+    ) -> None:
+        self.max_memory_size = max_memory_size
+        self.max_disk_size = max_disk_size
+        self.directory = directory
+        #: Number of lookups answered from the cache
+        self.hits = 0
+        #: Number of lookups not answered from the cache
+        self.misses = 0
+        self._memory: "collections.OrderedDict[str, bytes]" = (
+            collections.OrderedDict()
+        )
+        self._memory_size = 0
+        self._disk_size = 0
+        self._lock = threading.RLock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._disk_size = sum(size for _, _, size in self._disk_entries())
+
+    def __repr__(self) -> str:
+        return "<ObjectCache [{} in memory, directory={!r}]>".format(
+            len(self._memory), self.directory
+        )
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._memory:
+                return True
+            path = self._path_for(key)
+            return path is not None and os.path.exists(path)
+
+    def get(self, key: str) -> t.Optional[bytes]:
+        """Retrieve the serialized JSON stored for ``key``.
+
+        :param str key:
+            the URL of the object
+        :returns:
+            the serialized JSON, or ``None`` if it is not cached
+        :rtype:
+            bytes
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return data
+
+            data = self._read_from_disk(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._store_in_memory(key, data)
+            self.hits += 1
+            return data
+
+    def set(self, key: str, data: bytes) -> None:
+        """Store the serialized JSON for ``key``.
+
+        :param str key:
+            the URL of the object
+        :param bytes data:
+            the serialized JSON of the object
+        """
+        with self._lock:
+            self._store_in_memory(key, data)
+            self._write_to_disk(key, data)
+
+    def clear(self) -> None:
+        """Remove every entry from memory and from disk."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            for path, _, _ in self._disk_entries():
+                self._remove(path)
+            self._disk_size = 0
+
+    def _store_in_memory(self, key, data):
+        if len(data) > self.max_memory_size:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_size -= len(old)
+        self._memory[key] = data
+        self._memory_size += len(data)
+        while self._memory_size > self.max_memory_size:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    def _path_for(self, key):
+        if self.directory is None:
+            return None
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + ".json")
+
+    def _read_from_disk(self, key):
+        path = self._path_for(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as fd:
+                data = fd.read()
+            # Track recency of use for eviction
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def _write_to_disk(self, key, data):
+        path = self._path_for(key)
+        if path is None or len(data) > self.max_disk_size:
+            return
+        if os.path.exists(path):
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_path, path)
+        self._disk_size += len(data)
+        if self._disk_size > self.max_disk_size:
+            self._evict_from_disk()
+
+    def _disk_entries(self):
+        entries = []
+        if self.directory is None:
+            return entries
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _evict_from_disk(self):
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[1])
+        self._disk_size = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if self._disk_size <= self.max_disk_size:
+                break
+            self._remove(path)
+            self._disk_size -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
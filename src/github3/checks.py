@@ -1,9 +1,52 @@
 """This module contains all the classes relating to Checks."""
 
+import datetime
+import email.utils
+import itertools
+import time
 from json import dumps
 
 from . import decorators
+from . import exceptions
 from . import models
+from . import utils
+
+#: Most annotations GitHub accepts in one request
+MAX_ANNOTATIONS_PER_REQUEST = 50
+
+
+def _retry_delay(response, attempt):
+    """Find how long to wait before retrying a rate limited request.
+
+    Returns None when the response is not a rate limit.
+    """
+    if response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+        # RFC 9110 also allows an HTTP date
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return 60.0 * 2**attempt
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+        return max(retry_at.timestamp() - time.time(), 1.0)
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset = float(response.headers.get("X-RateLimit-Reset", 0))
+        return max(reset - time.time(), 1.0)
+    try:
+        message = response.json().get("message", "")
+    except ValueError:
+        message = ""
+    if "secondary rate limit" in message.lower():
+        # GitHub asks for at least a minute, and longer when it persists
+        return 60.0 * 2**attempt
+    return None
 
 
 class CheckPullRequest(models.GitHubCore):
@@ -468,6 +511,82 @@ class CheckRun(models.GitHubCore):
     def _repr(self):
         return "<{s.class_name} [{s.name}:{s.status}]>".format(s=self)
 
+    @decorators.requires_app_installation_auth
+    def upload_annotations(
+        self,
+        annotations,
+        title=None,
+        summary=None,
+        max_workers=4,
+        max_retries=5,
+    ):
+        """Add any number of annotations to this check run.
+
+        GitHub accepts at most 50 annotations per request, so the annotations
+        are sent in batches of 50, up to ``max_workers`` batches at a time.
+        Batches which hit a rate limit are retried after the time GitHub
+        asks for.
+
+        .. versionadded:: 4.1.0
+
+        :param annotations:
+            the annotations, each a dictionary as described in GitHub's
+            documentation for the ``output`` of a check run
+        :type annotations:
+            iterable of dict
+        :param str title:
+            (optional), the title of the output. Default: the current title
+        :param str summary:
+            (optional), the summary of the output. Default: the current
+            summary
+        :param int max_workers:
+            (optional), the number of requests made at once. Default: 4
+        :param int max_retries:
+            (optional), the number of times a rate limited batch is retried.
+            Default: 5
+        :returns:
+            the total number of annotations on the check run
+        :rtype:
+            int
+        """
+        output = {
+            "title": self.output.title if title is None else title,
+            "summary": self.output.summary if summary is None else summary,
+        }
+        annotations = iter(annotations)
+        batches = iter(
+            lambda: list(
+                itertools.islice(annotations, MAX_ANNOTATIONS_PER_REQUEST)
+            ),
+            [],
+        )
+
+        def upload(batch):
+            data = dumps({"output": dict(output, annotations=batch)})
+            for attempt in range(max_retries + 1):
+                response = self._patch(
+                    self._api, data=data, headers=CheckSuite.CUSTOM_HEADERS
+                )
+                delay = _retry_delay(response, attempt)
+                if delay is None or attempt == max_retries:
+                    break
+                time.sleep(delay)
+            if response.status_code != 200:
+                raise exceptions.error_for(response)
+            return response.json()
+
+        latest = None
+        for _, json in utils.imap_unordered(upload, batches, max_workers):
+            count = json["output"]["annotations_count"]
+            if (
+                latest is None
+                or count > latest["output"]["annotations_count"]
+            ):
+                latest = json
+        if latest is not None:
+            self._update_attributes(latest)
+        return self.output.annotations_count
+
     @decorators.requires_app_installation_auth
     def update(
         self,
@@ -0,0 +1,234 @@
+"""Run per-repository tasks across an organization within the rate limit."""
+
+import heapq
+import json as jsonlib
+import logging
+import os
+import threading
+import time
+import typing as t
+from concurrent import futures
+
+from . import exceptions
+
+if t.TYPE_CHECKING:
+    from . import models
+    from .repos import repo as _repo
+
+LOG = logging.getLogger(__name__)
+
+
+class _Task:
+    __slots__ = ("name", "func", "priority")
+
+    def __init__(self, name, func, priority):
+        self.name = name
+        self.func = func
+        self.priority = priority
+
+
+class Crawler:
+    """Run registered tasks against many repositories concurrently.
+
+    Each registered task is called once per repository. Pending calls are
+    kept in a priority queue so that, e.g., cheap or urgent tasks finish
+    for every repository before expensive ones start. At most
+    ``max_workers`` calls run at once.
+
+    The crawler watches the rate limit headers of every response made
+    through the session of ``github``. When the remaining requests would
+    not cover the pending calls, new calls are spread evenly until the
+    limit resets, and when only ``reserve`` requests remain, it waits for
+    the reset.
+
+    .. code-block:: python
+
+        crawler = Crawler(gh, state_path="audit.jsonl")
+
+        @crawler.task(priority=0)
+        def hooks(repository):
+            return [hook.as_dict() for hook in repository.hooks()]
+
+        @crawler.task(priority=1)
+        def collaborators(repository):
+            return [user.login for user in repository.collaborators()]
+
+        results = crawler.run(org.repositories())
+        results[("octo-org/octo-repo", "hooks")]
+
+    .. versionadded:: 4.1.0
+
+    :param github:
+        the object whose session the tasks use, usually a
+        :class:`~github3.github.GitHub` instance
+    :param sink:
+        (optional), a callable accepting a repository, the name of a task,
+        and its result, called from the thread running :meth:`run`.
+        Default: results are collected in :attr:`results`
+    :param str state_path:
+        (optional), a file recording the completed calls. A crawler created
+        with the same file skips them, so an interrupted crawl can resume.
+        Default: nothing is recorded
+    :param int max_workers:
+        (optional), the number of calls run at once. Default: 8
+    :param int reserve:
+        (optional), the number of requests to leave unused. Default: 100
+    """
+
+    def __init__(
+        self,
+        github: "models.GitHubCore",
+        sink: t.Optional[t.Callable[..., None]] = None,
+        state_path: t.Optional[str] = None,
+        max_workers: int = 8,
+        reserve: int = 100,
+    ) -> None:
+        self.session = github.session
+        self.sink = sink
+        self.state_path = state_path
+        self.max_workers = max_workers
+        self.reserve = reserve
+        #: Results of each call, keyed by repository name and task name,
+        #: when no ``sink`` was given
+        self.results: t.Dict[t.Tuple[str, str], t.Any] = {}
+        #: Exceptions raised by each failed call, keyed like :attr:`results`
+        self.errors: t.Dict[t.Tuple[str, str], Exception] = {}
+        self._tasks: t.Dict[str, _Task] = {}
+        self._completed: t.Set[t.Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+        self._remaining: t.Optional[int] = None
+        self._reset: float = 0.0
+        if state_path is not None and os.path.exists(state_path):
+            with open(state_path) as fd:
+                for line in fd:
+                    if line.strip():
+                        self._completed.add(tuple(jsonlib.loads(line)))
+
+    def __repr__(self) -> str:
+        return f"<Crawler [{', '.join(self._tasks)}]>"
+
+    def add_task(
+        self,
+        func: t.Callable[["_repo._Repository"], t.Any],
+        name: t.Optional[str] = None,
+        priority: int = 0,
+    ) -> None:
+        """Register a task to call with each repository.
+
+        :param func:
+            a callable accepting a repository and returning the result
+        :param str name:
+            (optional), the name of the task. Default: the name of ``func``
+        :param int priority:
+            (optional), calls of tasks with lower priorities are made first.
+            Default: 0
+        """
+        name = name or func.__name__
+        self._tasks[name] = _Task(name, func, priority)
+
+    def task(self, name=None, priority=0):
+        """Register the decorated function as a task.
+
+        This is the decorator form of :meth:`add_task`.
+        """
+
+        def register(func):
+            self.add_task(func, name, priority)
+            return func
+
+        return register
+
+    def run(self, repositories):
+        """Call every task with every repository.
+
+        Calls which raise a :class:`~github3.exceptions.GitHubException`,
+        e.g., for an error response or a failed connection, are recorded in
+        :attr:`errors` and not marked completed, so they are retried when
+        the crawl is resumed.
+
+        :param repositories:
+            the repositories to crawl, e.g., from
+            :meth:`~github3.orgs.Organization.repositories`
+        :returns:
+            :attr:`results`
+        :rtype:
+            dict
+        """
+        queue = []
+        sequence = 0
+        for repository in repositories:
+            for task in self._tasks.values():
+                if (repository.full_name, task.name) in self._completed:
+                    continue
+                heapq.heappush(
+                    queue, (task.priority, sequence, task, repository)
+                )
+                sequence += 1
+
+        hooks = self.session.hooks["response"]
+        hooks.append(self._observe)
+        try:
+            with futures.ThreadPoolExecutor(self.max_workers) as executor:
+                pending = {}
+                while queue or pending:
+                    while queue and len(pending) < self.max_workers:
+                        self._pace(len(queue) + len(pending))
+                        _, _, task, repository = heapq.heappop(queue)
+                        future = executor.submit(task.func, repository)
+                        pending[future] = (task, repository)
+                    done, _ = futures.wait(
+                        pending, return_when=futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        self._finish(*pending.pop(future), future)
+        finally:
+            hooks.remove(self._observe)
+        return self.results
+
+    def _finish(self, task, repository, future):
+        key = (repository.full_name, task.name)
+        try:
+            result = future.result()
+        except exceptions.GitHubException as error:
+            LOG.warning("Task %s failed for %s: %s", task.name, key[0], error)
+            self.errors[key] = error
+            return
+        if self.sink is None:
+            self.results[key] = result
+        else:
+            self.sink(repository, task.name, result)
+        self._completed.add(key)
+        if self.state_path is not None:
+            with open(self.state_path, "a") as fd:
+                fd.write(jsonlib.dumps(key) + "\n")
+
+    def _observe(self, response, *args, **kwargs):
+        headers = response.headers
+        if headers.get("X-RateLimit-Resource", "core") != "core":
+            return response
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset = float(headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return response
+        with self._lock:
+            self._remaining = remaining
+            self._reset = reset
+        return response
+
+    def _pace(self, outstanding):
+        with self._lock:
+            remaining, reset = self._remaining, self._reset
+        if remaining is None:
+            return
+        wait = reset - time.time()
+        if wait <= 0:
+            return
+        usable = remaining - self.reserve
+        if usable <= 0:
+            LOG.info("Waiting %.0f seconds for the rate limit to reset", wait)
+            time.sleep(wait)
+            with self._lock:
+                self._remaining = None
+        elif usable < outstanding:
+            time.sleep(wait / usable)
@@ -0,0 +1,356 @@
+"""Incremental parsing of unified diffs returned by GitHub.
+
+The diffs for pull requests and comparisons can be hundreds of megabytes.
+The functions here read them a line at a time from a streamed response so
+that only the file currently being parsed is held in memory.
+"""
+
+import collections
+import re
+import typing as t
+
+if t.TYPE_CHECKING:
+    import requests.models
+
+HUNK_HEADER = re.compile(
+    rb"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@ ?(.*)$"
+)
+
+#: Totals for a whole diff as returned by :func:`summarize_diff`
+DiffSummary = collections.namedtuple(
+    "DiffSummary", ["files", "additions", "deletions"]
+)
+
+
+class Hunk:
+    """A contiguous block of changes within a file.
+
+    .. versionadded:: 4.1.0
+
+    This object has the following attributes:
+
+    .. attribute:: old_start
+
+        The first line of the hunk in the original file.
+
+    .. attribute:: old_count
+
+        The number of lines of the original file the hunk covers.
+
+    .. attribute:: new_start
+
+        The first line of the hunk in the new file.
+
+    .. attribute:: new_count
+
+        The number of lines of the new file the hunk covers.
+
+    .. attribute:: section
+
+        The text git shows after the hunk's line numbers, usually the
+        enclosing function or class.
+
+    .. attribute:: lines
+
+        The lines of the hunk, including their leading ``" "``, ``"+"``, or
+        ``"-"``, without line endings.
+    """
+
+    __slots__ = (
+        "old_start",
+        "old_count",
+        "new_start",
+        "new_count",
+        "section",
+        "lines",
+    )
+
+    def __init__(self, old_start, old_count, new_start, new_count, section):
+        self.old_start = old_start
+        self.old_count = old_count
+        self.new_start = new_start
+        self.new_count = new_count
+        self.section = section
+        self.lines: t.List[str] = []
+
+    def __repr__(self):
+        return "<Hunk [-{},{} +{},{}]>".format(
+            self.old_start, self.old_count, self.new_start, self.new_count
+        )
+
+
+class FileDiff:
+    """The changes made to a single file in a diff.
+
+    .. versionadded:: 4.1.0
+
+    This object has the following attributes:
+
+    .. attribute:: old_path
+
+        The path of the file before the change, ``None`` if it was added.
+
+    .. attribute:: new_path
+
+        The path of the file after the change, ``None`` if it was removed.
+
+    .. attribute:: status
+
+        One of ``"added"``, ``"removed"``, ``"modified"``, ``"renamed"``, or
+        ``"copied"``.
+
+    .. attribute:: old_mode
+
+        The mode of the file before the change, if git reported it.
+
+    .. attribute:: new_mode
+
+        The mode of the file after the change, if git reported it.
+
+    .. attribute:: is_binary
+
+        Whether git considered the file to be binary, in which case it has
+        no hunks.
+
+    .. attribute:: additions
+
+        The number of lines added.
+
+    .. attribute:: deletions
+
+        The number of lines removed.
+
+    .. attribute:: hunks
+
+        A list of :class:`~github3.diffs.Hunk` objects. This is empty if the
+        diff was parsed without hunks.
+    """
+
+    __slots__ = (
+        "old_path",
+        "new_path",
+        "status",
+        "old_mode",
+        "new_mode",
+        "is_binary",
+        "additions",
+        "deletions",
+        "hunks",
+    )
+
+    def __init__(self, old_path, new_path):
+        self.old_path = old_path
+        self.new_path = new_path
+        self.status = "modified"
+        self.old_mode = None
+        self.new_mode = None
+        self.is_binary = False
+        self.additions = 0
+        self.deletions = 0
+        self.hunks: t.List[Hunk] = []
+
+    def __repr__(self):
+        return f"<FileDiff [{self.status} {self.path}]>"
+
+    @property
+    def path(self):
+        """The path of the file after the change, or before if removed."""
+        return self.new_path or self.old_path
+
+
+def _decode(value):
+    return value.decode("utf-8", "replace")
+
+
+def _unquote(path):
+    """Remove the quoting git applies to paths with unusual characters."""
+    if path.startswith(b'"') and path.endswith(b'"'):
+        path = path[1:-1].decode("unicode_escape").encode("latin-1")
+    return _decode(path)
+
+
+def _strip_prefix(path):
+    """Strip the ``a/`` or ``b/`` git adds to paths in a diff."""
+    if path == b"/dev/null":
+        return None
+    unquoted = _unquote(path)
+    if unquoted[:2] in ("a/", "b/"):
+        return unquoted[2:]
+    return unquoted
+
+
+def _paths_from_git_header(rest):
+    """Split the paths out of a ``diff --git a/<path> b/<path>`` header."""
+    # Paths are ambiguous when they contain spaces but they are identical
+    # unless the file was renamed, in which case later lines name them.
+    half = (len(rest) - 1) // 2
+    if rest[:half] == b"a/" + rest[half + 3 :] and rest[half:].startswith(
+        b" b/"
+    ):
+        path = _decode(rest[2:half])
+        return path, path
+    old, sep, new = rest.rpartition(b" b/")
+    if not sep:
+        return None, None
+    return _strip_prefix(old), _decode(new)
+
+
+def iter_lines(response: "requests.models.Response", chunk_size=65536):
+    """Iterate over the lines of a streamed response.
+
+    Unlike :meth:`requests.models.Response.iter_lines`, this only splits on
+    ``\\n`` so carriage returns and form feeds within diffs are preserved.
+
+    :param response: A streamed Response object from requests
+    :type response: requests.models.Response
+    :param int chunk_size: (optional), number of bytes to read at a time
+    :returns: generator of lines without the trailing newline
+    :rtype: bytes
+    """
+    # Only each new chunk is split and the pieces of a line spanning many
+    # chunks are joined once, so very long lines take linear time
+    pending: t.List[bytes] = []
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        lines = chunk.split(b"\n")
+        pending.append(lines[0])
+        if len(lines) == 1:
+            continue
+        yield b"".join(pending)
+        yield from lines[1:-1]
+        pending = [lines[-1]]
+    last = b"".join(pending)
+    if last:
+        yield last
+
+
+def parse_diff(
+    lines: t.Iterable[bytes], include_hunks: bool = True
+) -> t.Iterator[FileDiff]:
+    """Parse a unified diff produced by git into per-file records.
+
+    Each file is yielded as soon as the diff moves on to the next one, so
+    only a single file's hunks are kept in memory at a time.
+
+    .. versionadded:: 4.1.0
+
+    :param lines:
+        the lines of the diff, without line endings
+    :type lines:
+        iterable of bytes
+    :param bool include_hunks:
+        (optional), whether to keep the hunks of each file. When False only
+        the line counts are computed. Default: True
+    :returns:
+        generator of the files in the diff
+    :rtype:
+        :class:`~github3.diffs.FileDiff`
+    :raises:
+        ValueError if a hunk comes before the first file header
+    """
+    current: t.Optional[FileDiff] = None
+    hunk = None
+    old_remaining = new_remaining = 0
+
+    for line in lines:
+        # Hunks are only counted once a file header has been seen
+        if current is not None and (old_remaining > 0 or new_remaining > 0):
+            marker = line[:1]
+            if marker == b"+":
+                current.additions += 1
+                new_remaining -= 1
+            elif marker == b"-":
+                current.deletions += 1
+                old_remaining -= 1
+            elif marker == b"\\":
+                # "\ No newline at end of file"
+                pass
+            else:
+                old_remaining -= 1
+                new_remaining -= 1
+            if hunk is not None:
+                hunk.lines.append(_decode(line))
+            continue
+
+        if line.startswith(b"diff --git "):
+            if current is not None:
+                yield current
+            current = FileDiff(*_paths_from_git_header(line[11:]))
+            hunk = None
+            continue
+
+        if current is None:
+            if line.startswith(b"@@ "):
+                raise ValueError("The diff has a hunk before any file header")
+            continue
+
+        if line.startswith(b"@@ "):
+            match = HUNK_HEADER.match(line)
+            if match is None:
+                continue
+            old_start, old_count, new_start, new_count, section = (
+                match.groups()
+            )
+            old_remaining = 1 if old_count is None else int(old_count)
+            new_remaining = 1 if new_count is None else int(new_count)
+            if include_hunks:
+                hunk = Hunk(
+                    int(old_start),
+                    old_remaining,
+                    int(new_start),
+                    new_remaining,
+                    _decode(section),
+                )
+                current.hunks.append(hunk)
+        elif line.startswith(b"--- "):
+            current.old_path = _strip_prefix(line[4:].split(b"\t")[0])
+        elif line.startswith(b"+++ "):
+            current.new_path = _strip_prefix(line[4:].split(b"\t")[0])
+        elif line.startswith(b"new file mode "):
+            current.status = "added"
+            current.old_path = None
+            current.new_mode = _decode(line[14:])
+        elif line.startswith(b"deleted file mode "):
+            current.status = "removed"
+            current.new_path = None
+            current.old_mode = _decode(line[18:])
+        elif line.startswith(b"old mode "):
+            current.old_mode = _decode(line[9:])
+        elif line.startswith(b"new mode "):
+            current.new_mode = _decode(line[9:])
+        elif line.startswith(b"rename from "):
+            current.status = "renamed"
+            current.old_path = _unquote(line[12:])
+        elif line.startswith(b"rename to "):
+            current.new_path = _unquote(line[10:])
+        elif line.startswith(b"copy from "):
+            current.status = "copied"
+            current.old_path = _unquote(line[10:])
+        elif line.startswith(b"copy to "):
+            current.new_path = _unquote(line[8:])
+        elif line.startswith(b"Binary files ") or line == b"GIT binary patch":
+            current.is_binary = True
+
+    if current is not None:
+        yield current
+
+
+def summarize_diff(lines: t.Iterable[bytes]) -> DiffSummary:
+    """Count the files, additions, and deletions in a unified diff.
+
+    .. versionadded:: 4.1.0
+
+    :param lines:
+        the lines of the diff, without line endings
+    :type lines:
+        iterable of bytes
+    :returns:
+        the totals for the whole diff
+    :rtype:
+        :class:`~github3.diffs.DiffSummary`
+    """
+    files = additions = deletions = 0
+    for file_diff in parse_diff(lines, include_hunks=False):
+        files += 1
+        additions += file_diff.additions
+        deletions += file_diff.deletions
+    return DiffSummary(files, additions, deletions)
@@ -0,0 +1,248 @@
+"""Consume the events of many repositories, organizations, and users."""
+
+import collections
+import heapq
+import json as jsonlib
+import logging
+import os
+import time
+import typing as t
+
+from . import exceptions
+from . import utils
+
+if t.TYPE_CHECKING:
+    from . import events
+
+LOG = logging.getLogger(__name__)
+
+
+class _Source:
+    __slots__ = ("key", "list_events", "etag", "cursor", "interval")
+
+    def __init__(self, key, list_events):
+        self.key = key
+        self.list_events = list_events
+        self.etag = None
+        self.cursor = None
+        self.interval = None
+
+
+def _event_id(event):
+    return int(event.id)
+
+
+def _source_key(list_events):
+    owner = getattr(list_events, "__self__", None)
+    url = getattr(owner, "_api", None)
+    if url is None:
+        raise ValueError(
+            "A key is required for sources which are not methods of "
+            "github3.py objects"
+        )
+    return f"{url}#{list_events.__name__}"
+
+
+class Firehose:
+    """A single stream of the events of many sources.
+
+    A source is a method listing events such as
+    :meth:`Repository.events <github3.repos.repo.Repository.events>`,
+    :meth:`Organization.public_events
+    <github3.orgs.Organization.public_events>`, or
+    :meth:`User.received_events <github3.users.User.received_events>`. Each
+    source is polled on its own schedule: never more often than GitHub's
+    ``X-Poll-Interval`` allows, and less often the longer it goes without
+    new events. Requests are conditional on the ETag of the previous poll,
+    so sources without new events cost no rate limit, and paging stops at
+    the newest event already seen from the source.
+
+    Events are emitted in the order GitHub created them and an event seen
+    through more than one source, e.g., through an organization and one of
+    its repositories, is emitted once.
+
+    .. code-block:: python
+
+        firehose = Firehose(state_path="firehose.json")
+        for repository in org.repositories():
+            firehose.add(repository.events)
+        firehose.add(org.public_events)
+
+        for event in firehose:
+            print(event.type, event.repo)
+
+    .. versionadded:: 4.1.0
+
+    :param str state_path:
+        (optional), the file the ETag and newest event of each source are
+        saved to, so that a restarted firehose does not emit events again.
+        Default: nothing is saved
+    :param float min_interval:
+        (optional), the fewest seconds between polls of a source.
+        Default: 60
+    :param float max_interval:
+        (optional), the most seconds between polls of a source. Default: 3600
+    :param int max_seen:
+        (optional), the number of event ids remembered to drop duplicates.
+        Default: 100000
+    :param int max_workers:
+        (optional), the number of sources polled at once. Default: 8
+    """
+
+    def __init__(
+        self,
+        state_path: t.Optional[str] = None,
+        min_interval: float = 60.0,
+        max_interval: float = 3600.0,
+        max_seen: int = 100000,
+        max_workers: int = 8,
+    ) -> None:
+        self.state_path = state_path
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_seen = max_seen
+        self.max_workers = max_workers
+        self._sources: t.Dict[str, _Source] = {}
+        self._schedule: t.List[t.Tuple[float, str]] = []
+        self._seen: "collections.OrderedDict[int, None]" = (
+            collections.OrderedDict()
+        )
+        self._state: t.Dict[str, t.Dict[str, t.Any]] = {}
+        if state_path is not None and os.path.exists(state_path):
+            with open(state_path, "rb") as fd:
+                self._state = jsonlib.loads(fd.read())
+
+    def __repr__(self) -> str:
+        return f"<Firehose [{len(self._sources)} sources]>"
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def add(
+        self,
+        list_events: t.Callable[..., t.Iterable["events.Event"]],
+        key: t.Optional[str] = None,
+    ) -> None:
+        """Add a source of events.
+
+        :param list_events:
+            a callable accepting ``etag`` and returning an iterator of
+            :class:`~github3.events.Event` like
+            :meth:`Repository.events <github3.repos.repo.Repository.events>`
+        :param str key:
+            (optional), the name of the source in the saved state. Default:
+            derived from the URL of the object ``list_events`` belongs to
+        """
+        key = key or _source_key(list_events)
+        if key in self._sources:
+            self._sources[key].list_events = list_events
+            return
+        source = _Source(key, list_events)
+        saved = self._state.get(key, {})
+        source.etag = saved.get("etag")
+        source.cursor = saved.get("cursor")
+        source.interval = saved.get("interval")
+        self._sources[key] = source
+        heapq.heappush(self._schedule, (time.monotonic(), key))
+
+    def poll(self) -> t.List["events.Event"]:
+        """Poll the sources that are due and return their new events.
+
+        :returns:
+            the new events, oldest first
+        :rtype:
+            [:class:`~github3.events.Event`]
+        """
+        now = time.monotonic()
+        due = []
+        while self._schedule and self._schedule[0][0] <= now:
+            _, key = heapq.heappop(self._schedule)
+            if key in self._sources:
+                due.append(self._sources[key])
+
+        new_events = []
+        polls = utils.imap_unordered(
+            self._poll_source, due, max_workers=self.max_workers
+        )
+        for source, (found, poll_interval) in polls:
+            new_events.extend(found)
+            self._reschedule(source, bool(found), poll_interval)
+
+        unique = []
+        for event in sorted(new_events, key=_event_id):
+            event_id = _event_id(event)
+            if event_id in self._seen:
+                continue
+            self._seen[event_id] = None
+            if len(self._seen) > self.max_seen:
+                self._seen.popitem(last=False)
+            unique.append(event)
+        return unique
+
+    def __iter__(self) -> t.Iterator["events.Event"]:
+        """Poll the sources forever, yielding their new events."""
+        while True:
+            yield from self.poll()
+            self.save()
+            if self._schedule:
+                delay = self._schedule[0][0] - time.monotonic()
+            else:
+                delay = self.min_interval
+            if delay > 0:
+                time.sleep(delay)
+
+    def save(self) -> None:
+        """Save the ETag and newest event of each source to ``state_path``."""
+        if self.state_path is None:
+            return
+        for key, source in self._sources.items():
+            self._state[key] = {
+                "etag": source.etag,
+                "cursor": source.cursor,
+                "interval": source.interval,
+            }
+        utils.write_file_atomically(
+            self.state_path, jsonlib.dumps(self._state).encode("utf-8")
+        )
+
+    def _poll_source(self, source):
+        found = []
+        try:
+            iterator = source.list_events(etag=source.etag)
+            for event in iterator:
+                if (
+                    source.cursor is not None
+                    and _event_id(event) <= source.cursor
+                ):
+                    break
+                found.append(event)
+        except exceptions.GitHubException as error:
+            # Backs off like a source without new events
+            LOG.warning("Unable to poll %s: %s", source.key, error)
+            return [], 0.0
+
+        source.etag = getattr(iterator, "etag", None) or source.etag
+        if found:
+            source.cursor = max(
+                [_event_id(event) for event in found] + [source.cursor or 0]
+            )
+        response = getattr(iterator, "last_response", None)
+        poll_interval = 0.0
+        if response is not None:
+            try:
+                poll_interval = float(
+                    response.headers.get("X-Poll-Interval", 0)
+                )
+            except ValueError:
+                pass
+        return found, poll_interval
+
+    def _reschedule(self, source, active, poll_interval):
+        if active or source.interval is None:
+            interval = self.min_interval
+        else:
+            interval = min(source.interval * 2, self.max_interval)
+        source.interval = max(interval, poll_interval)
+        heapq.heappush(
+            self._schedule, (time.monotonic() + source.interval, source.key)
+        )
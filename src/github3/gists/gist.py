@@ -143,7 +143,8 @@ class _Gist(models.GitHubCore):
             bool
         """
         url = self._build_url("star", base_url=self._api)
-        return self._boolean(self._get(url), 204, 404)
+        with self.session.no_token_retries():
+            return self._boolean(self._get(url), 204, 404)
 
     def comments(self, number=-1, etag=None):
         """Iterate over comments on this gist.
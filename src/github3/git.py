@@ -4,7 +4,15 @@ This module contains all the classes relating to Git Data.
 See also: http://developer.github.com/v3/git/
 """
 
+import array
 import base64
+import bisect
+import collections
+import functools
+import itertools
+import re
+import typing as t
+from concurrent import futures
 from json import dumps
 
 from . import models
@@ -315,11 +323,17 @@ class Tree(models.GitHubCore):
 
         A list that represents the nodes in the tree. If this list has members
         it will have instances of :class:`~github3.git.Hash`.
+
+    .. attribute:: truncated
+
+        Whether GitHub truncated the list of nodes in a recursive listing of
+        this tree. Use :meth:`walk` to list every node of large trees.
     """
 
     def _update_attributes(self, tree):
         self._api = tree["url"]
         self.sha = tree["sha"]
+        self.truncated = tree.get("truncated", False)
         self.tree = tree["tree"]
         if self.tree:
             self.tree = [Hash(t, self) for t in self.tree]
@@ -346,6 +360,45 @@ class Tree(models.GitHubCore):
         )
         return self._instance_or_null(Tree, json)
 
+    def walk(self, prune=None, max_workers=4):
+        """Iterate over every entry in this tree and its subtrees.
+
+        If GitHub truncates the recursive listing of this tree, the subtrees
+        are listed individually, ``max_workers`` at a time, so the result is
+        always complete.
+
+        .. versionadded:: 4.1.0
+
+        :param list prune:
+            (optional), paths to leave out of the listing along with
+            everything beneath them, e.g., ``["vendor"]``
+        :param int max_workers:
+            (optional), the number of subtrees to list concurrently if the
+            recursive listing was truncated. Default: 4
+        :returns:
+            generator of entries in no particular order
+        :rtype:
+            :class:`~github3.git.TreeEntry`
+        """
+        trees_url = self._api.rsplit("/", 1)[0]
+        return iter(
+            _TreeWalker(self, trees_url, self.sha, prune, max_workers)
+        )
+
+    def index(self):
+        """Build an index of the entries in this tree.
+
+        This is most useful on a tree retrieved recursively.
+
+        .. versionadded:: 4.1.0
+
+        :returns:
+            an index for looking up and matching paths
+        :rtype:
+            :class:`~github3.git.TreeIndex`
+        """
+        return TreeIndex(self.tree or [])
+
 
 class CommitTree(models.GitHubCore):
     """This object represents the abbreviated tree data in a commit.
@@ -429,3 +482,296 @@ class Hash(models.GitHubCore):
 
     def _repr(self):
         return f"<Hash [{self.sha}]>"
+
+
+#: A single entry yielded while walking a tree. ``size`` is ``None`` for
+#: anything other than blobs.
+TreeEntry = collections.namedtuple(
+    "TreeEntry", ["path", "mode", "type", "sha", "size"]
+)
+
+
+class _TreeWalker:
+    """List every entry of a tree, working around truncated listings."""
+
+    def __init__(
+        self,
+        core: models.GitHubCore,
+        trees_url: str,
+        sha: str,
+        prune: t.Optional[t.Iterable[str]] = None,
+        max_workers: int = 4,
+    ) -> None:
+        self.core = core
+        self.trees_url = trees_url.rstrip("/")
+        self.sha = sha
+        self.prune = tuple(p.strip("/") for p in (prune or ()) if p)
+        self.max_workers = max(1, int(max_workers))
+
+    def _is_pruned(self, path):
+        return any(
+            path == prefix or path.startswith(prefix + "/")
+            for prefix in self.prune
+        )
+
+    def _list(self, sha, recursive=False):
+        url = self.core._build_url(sha, base_url=self.trees_url)
+        params = {"recursive": "1"} if recursive else None
+        return self.core._immutable_json(url, sha, params=params)
+
+    def _entries(self, json, prefix=""):
+        for entry in json.get("tree") or []:
+            path = prefix + entry["path"]
+            if self._is_pruned(path):
+                continue
+            yield TreeEntry(
+                path,
+                entry["mode"],
+                entry["type"],
+                entry["sha"],
+                entry.get("size"),
+            )
+
+    def __iter__(self):
+        json = self._list(self.sha, recursive=True)
+        if not json:
+            return
+        if not json.get("truncated"):
+            yield from self._entries(json)
+            return
+
+        json = self._list(self.sha)
+        if not json:
+            return
+        with futures.ThreadPoolExecutor(self.max_workers) as executor:
+            pending = {}
+            listing = [(json, "")]
+            while listing or pending:
+                for json, prefix in listing:
+                    for entry in self._entries(json, prefix):
+                        yield entry
+                        if entry.type == "tree":
+                            future = executor.submit(self._list, entry.sha)
+                            pending[future] = entry.path + "/"
+                listing = []
+                if pending:
+                    done, _ = futures.wait(
+                        pending, return_when=futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        prefix = pending.pop(future)
+                        json = future.result()
+                        if json:
+                            listing.append((json, prefix))
+
+
+@functools.lru_cache(maxsize=1024)
+def _glob_to_regex(pattern):
+    """Translate a glob pattern into a regular expression.
+
+    ``*`` and ``?`` never match a ``/`` while ``**`` matches across any
+    number of directories.
+    """
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+        elif c == "[" and pattern.find("]", i + 2) != -1:
+            j = pattern.find("]", i + 2)
+            body = pattern[i + 1 : j].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body}]")
+            i = j
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return re.compile("(?s:{})\\Z".format("".join(parts)))
+
+
+class TreeIndex:
+    """A compact, sorted index of the entries in a git tree.
+
+    The index keeps the paths sorted alongside packed arrays of the other
+    attributes so that looking up a path, listing a directory, and totalling
+    the size of a directory take logarithmic time even for trees with
+    hundreds of thousands of entries.
+
+    .. code-block:: python
+
+        tree = repository.tree("main", recursive=True)
+        index = tree.index()
+        index.lookup("setup.py")
+        list(index.glob("src/**/*.py"))
+        index.directory_size("docs")
+
+    .. versionadded:: 4.1.0
+
+    :param entries:
+        the entries of the tree, e.g., :attr:`Tree.tree` from a recursive
+        listing or the result of :meth:`Tree.walk`
+    :type entries:
+        iterable of :class:`~github3.git.Hash` or
+        :class:`~github3.git.TreeEntry`
+    """
+
+    def __init__(self, entries: t.Iterable[t.Any]) -> None:
+        rows = sorted(
+            (e.path, e.mode, e.type, e.sha, e.size) for e in entries
+        )
+        self._paths = [row[0] for row in rows]
+        self._modes = [row[1] for row in rows]
+        types = sorted({row[2] for row in rows})
+        self._type_names = types
+        self._types = array.array("B", (types.index(row[2]) for row in rows))
+        self._shas = b"".join(bytes.fromhex(row[3]) for row in rows)
+        self._sha_length = len(self._shas) // len(rows) if rows else 20
+        self._sizes = array.array(
+            "q", (-1 if row[4] is None else row[4] for row in rows)
+        )
+        cumulative = array.array("q", [0])
+        total = 0
+        for size in self._sizes:
+            total += max(size, 0)
+            cumulative.append(total)
+        # Running totals let us sum the sizes of any range in constant time
+        self._cumulative_sizes = cumulative
+
+    def __repr__(self) -> str:
+        return f"<TreeIndex [{len(self)} entries]>"
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __contains__(self, path: str) -> bool:
+        return self._find(path.strip("/")) is not None
+
+    def __iter__(self) -> t.Iterator[TreeEntry]:
+        return (self._entry(i) for i in range(len(self._paths)))
+
+    def _entry(self, i):
+        size = self._sizes[i]
+        start = i * self._sha_length
+        return TreeEntry(
+            self._paths[i],
+            self._modes[i],
+            self._type_names[self._types[i]],
+            self._shas[start : start + self._sha_length].hex(),
+            None if size < 0 else size,
+        )
+
+    def _find(self, path):
+        i = bisect.bisect_left(self._paths, path)
+        if i < len(self._paths) and self._paths[i] == path:
+            return i
+        return None
+
+    def _prefix_range(self, prefix):
+        if not prefix:
+            return 0, len(self._paths)
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return (
+            bisect.bisect_left(self._paths, prefix),
+            bisect.bisect_left(self._paths, upper),
+        )
+
+    def _directory_range(self, path):
+        path = path.strip("/")
+        return self._prefix_range(path + "/" if path else "")
+
+    def lookup(self, path: str) -> t.Optional[TreeEntry]:
+        """Find the entry for ``path``.
+
+        :param str path:
+            the path of the entry relative to the root of the tree
+        :returns:
+            the entry or ``None`` if the tree has no such path
+        :rtype:
+            :class:`~github3.git.TreeEntry`
+        """
+        i = self._find(path.strip("/"))
+        return None if i is None else self._entry(i)
+
+    def listdir(
+        self, path: str = "", recursive: bool = False
+    ) -> t.Iterator[TreeEntry]:
+        """Iterate over the entries in the directory at ``path``.
+
+        :param str path:
+            (optional), the directory to list. Default: the root of the tree
+        :param bool recursive:
+            (optional), whether to include the entries of subdirectories as
+            well. Default: False
+        :returns:
+            generator of entries sorted by path
+        :rtype:
+            :class:`~github3.git.TreeEntry`
+        """
+        lo, hi = self._directory_range(path)
+        start = len(path.strip("/")) + 1 if path.strip("/") else 0
+        for i in range(lo, hi):
+            if recursive or "/" not in self._paths[i][start:]:
+                yield self._entry(i)
+
+    def glob(self, pattern: str) -> t.Iterator[TreeEntry]:
+        """Iterate over the entries whose path matches ``pattern``.
+
+        ``*`` and ``?`` match within a single path component, ``**`` matches
+        any number of directories, and ``[...]`` matches a set of characters.
+
+        :param str pattern:
+            the pattern to match, relative to the root of the tree, e.g.,
+            ``"src/**/*.py"``
+        :returns:
+            generator of matching entries sorted by path
+        :rtype:
+            :class:`~github3.git.TreeEntry`
+        """
+        pattern = pattern.lstrip("/")
+        regex = _glob_to_regex(pattern)
+        literal = "".join(
+            itertools.takewhile(lambda c: c not in "*?[", pattern)
+        )
+        lo, hi = self._prefix_range(literal)
+        for i in range(lo, hi):
+            if regex.match(self._paths[i]):
+                yield self._entry(i)
+
+    def directory_size(self, path: str = "") -> int:
+        """Total the sizes of the blobs beneath the directory at ``path``.
+
+        :param str path:
+            (optional), the directory to total. Default: the root of the tree
+        :returns:
+            the size in bytes
+        :rtype:
+            int
+        """
+        lo, hi = self._directory_range(path)
+        return self._cumulative_sizes[hi] - self._cumulative_sizes[lo]
+
+    def directory_sizes(self) -> t.Dict[str, int]:
+        """Total the sizes of the blobs beneath every directory in the tree.
+
+        :returns:
+            a mapping of each directory's path to its size in bytes
+        :rtype:
+            dict
+        """
+        return {
+            path: self.directory_size(path)
+            for i, path in enumerate(self._paths)
+            if self._type_names[self._types[i]] == "tree"
+        }
@@ -608,7 +608,8 @@ class GitHub(models.GitHubCore):
             bool
         """
         url = self._build_url("user", "blocks", str(username))
-        return self._boolean(self._get(url), 204, 404)
+        with self.session.no_token_retries():
+            return self._boolean(self._get(url), 204, 404)
 
     def check_authorization(self, access_token):
         """Check an authorization created by a registered application.
@@ -1173,7 +1174,8 @@ class GitHub(models.GitHubCore):
         json = False
         if username:
             url = self._build_url("user", "following", username)
-            json = self._boolean(self._get(url), 204, 404)
+            with self.session.no_token_retries():
+                json = self._boolean(self._get(url), 204, 404)
         return json
 
     @requires_auth
@@ -1192,7 +1194,8 @@ class GitHub(models.GitHubCore):
         json = False
         if username and repo:
             url = self._build_url("user", "starred", username, repo)
-            json = self._boolean(self._get(url), 204, 404)
+            with self.session.no_token_retries():
+                json = self._boolean(self._get(url), 204, 404)
         return json
 
     def issue(self, username, repository, number):
@@ -1469,7 +1472,12 @@ class GitHub(models.GitHubCore):
         self.session.app_bearer_token_auth(token, expire_in)
 
     def login_as_app_installation(
-        self, private_key_pem, app_id, installation_id, expire_in=30
+        self,
+        private_key_pem,
+        app_id,
+        installation_id,
+        expire_in=30,
+        auto_renew=False,
     ):
         """Login using your GitHub App's installation credentials.
 
@@ -1479,6 +1487,10 @@ class GitHub(models.GitHubCore):
 
             Added ``expire_in`` parameter.
 
+        .. versionchanged:: 4.1.0
+
+            Added ``auto_renew`` parameter.
+
         .. seealso::
 
             `Authenticating as an Installation`_
@@ -1492,7 +1504,8 @@ class GitHub(models.GitHubCore):
 
         .. warning::
 
-            This method expires after 1 hour.
+            This method expires after 1 hour, unless ``auto_renew`` is
+            ``True``.
 
         :param bytes private_key_pem:
             The bytes of the private key for this GitHub Application.
@@ -1507,6 +1520,12 @@ class GitHub(models.GitHubCore):
             the event that clock drift is significant between your machine and
             GitHub's servers, you can set this higher than 30.
             Default: 30
+        :param bool auto_renew:
+            (Optional) Keep the private key and request a new installation
+            token shortly before the current one expires, or when a request
+            is refused with a 401, instead of raising
+            :class:`~github3.exceptions.AppInstallationTokenExpired`.
+            Default: False
 
         .. _Authenticating as an Installation:
             https://developer.github.com/apps/building-github-apps/authenticating-with-github-apps/#authenticating-as-an-installation
@@ -1526,7 +1545,12 @@ class GitHub(models.GitHubCore):
             )
             json = self._json(response, 201)
 
-        self.session.app_installation_token_auth(json)
+        if auto_renew:
+            self.session.renewing_app_installation_token_auth(
+                private_key_pem, app_id, installation_id, json, expire_in
+            )
+        else:
+            self.session.app_installation_token_auth(json)
 
     def markdown(self, text, mode="", context="", raw=False):
         """Render an arbitrary markdown document.
@@ -1629,6 +1653,31 @@ class GitHub(models.GitHubCore):
         url = self._build_url("meta")
         return self._json(self._get(url), 200) or {}
 
+    @requires_auth
+    def notification_sync(
+        self, participating=False, last_modified=None, since=None
+    ):
+        """Create a sync of the user's unread notifications.
+
+        .. versionadded:: 4.1.0
+
+        :param bool participating:
+            (optional), only sync the notifications the user is participating
+            in directly. Default: False
+        :param str last_modified:
+            (optional), the ``last_modified`` of a previous sync to resume
+        :param str since:
+            (optional), the ``since`` of a previous sync to resume
+        :returns:
+            the sync, which has not fetched anything yet
+        :rtype:
+            :class:`~github3.notifications.NotificationSync`
+        """
+        url = self._build_url("notifications")
+        return notifications.NotificationSync(
+            url, self.session, participating, last_modified, since
+        )
+
     @requires_auth
     def notifications(
         self, all=False, participating=False, number=-1, etag=None
@@ -2623,6 +2672,22 @@ class GitHub(models.GitHubCore):
         """
         self.session.params = {"client_id": id, "client_secret": secret}
 
+    def set_object_cache(self, object_cache):
+        """Cache git objects which are requested by their SHA.
+
+        Blobs, trees, git commits, commits, and annotated tags requested by
+        their full SHA are immutable so, once retrieved, they will be served
+        from ``object_cache`` without making a request.
+
+        .. versionadded:: 4.1.0
+
+        :param object_cache:
+            the cache to use, or ``None`` to stop caching
+        :type object_cache:
+            :class:`~github3.cache.ObjectCache`
+        """
+        self.session.object_cache = object_cache
+
     def set_user_agent(self, user_agent):
         """Allow the user to set their own user agent string.
 
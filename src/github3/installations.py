@@ -0,0 +1,194 @@
+"""Clients for the many installations of a GitHub App."""
+
+import collections
+import json as jsonlib
+import logging
+import os
+import threading
+import typing as t
+
+from . import apps
+from . import github as _github
+from . import session as _session
+from . import utils
+
+LOG = logging.getLogger(__name__)
+
+
+class InstallationBroker:
+    """Hand out clients authenticated as any installation of an App.
+
+    The client of each installation is kept, with its token, in a least
+    recently used cache of ``max_size`` installations. Tokens are renewed
+    shortly before they expire, or when GitHub refuses them, by one thread
+    at a time. The App's token used to request them is shared and signed
+    only every few minutes. Every client shares the connection pool of
+    ``github``, so switching installations does not open new connections.
+
+    .. code-block:: python
+
+        broker = InstallationBroker(private_key_pem, app_id)
+
+        def handle(delivery):
+            installation_id = delivery.json["installation"]["id"]
+            gh = broker.client(installation_id)
+            gh.repository("octo-org", "octo-repo").create_issue("Hello")
+
+    .. versionadded:: 4.1.0
+
+    :param bytes private_key_pem:
+        The bytes of the private key for this GitHub Application.
+    :param int|str app_id:
+        The identifier for this GitHub Application.
+    :param github:
+        (optional), the client whose session's connection pool, base URL,
+        and timeouts the installations' clients use, e.g., a
+        :class:`~github3.github.GitHubEnterprise` instance. Default: a new
+        client for https://api.github.com
+    :param int max_size:
+        (optional), the number of installations whose clients are kept.
+        Default: 1024
+    :param str state_path:
+        (optional), a file where :meth:`save` writes the tokens so another
+        broker created with it reuses them. Default: tokens are not saved
+    :param int renew_before:
+        (optional), the number of seconds before a token expires when it
+        is renewed. Default: 300
+    """
+
+    def __init__(
+        self,
+        private_key_pem: bytes,
+        app_id: t.Union[int, str],
+        github: t.Optional["_github.GitHub"] = None,
+        max_size: int = 1024,
+        state_path: t.Optional[str] = None,
+        renew_before: int = 300,
+    ) -> None:
+        self.session = (github or _github.GitHub()).session
+        self.jwt_provider = apps.JWTProvider(private_key_pem, app_id)
+        self.private_key_pem = private_key_pem
+        self.app_id = app_id
+        self.max_size = max_size
+        self.state_path = state_path
+        self.renew_before = renew_before
+        self._clients: "collections.OrderedDict[int, _github.GitHub]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        if state_path is not None and os.path.exists(state_path):
+            with open(state_path) as fd:
+                # Expired tokens are renewed when their clients are used
+                for installation_id, json in jsonlib.load(fd).items():
+                    self._add(int(installation_id), json)
+
+    def __repr__(self) -> str:
+        return f"<InstallationBroker [{len(self)} installations]>"
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, installation_id) -> bool:
+        return int(installation_id) in self._clients
+
+    def client(self, installation_id: int) -> "_github.GitHub":
+        """Return a client authenticated as the installation.
+
+        No request is made until the client is used. Its token is then
+        requested if the broker does not have a valid one.
+
+        :param int installation_id:
+            the identifier of the installation
+        :returns:
+            a client authenticated as the installation
+        :rtype:
+            :class:`~github3.github.GitHub`
+        """
+        installation_id = int(installation_id)
+        with self._lock:
+            client = self._clients.get(installation_id)
+            if client is not None:
+                self._clients.move_to_end(installation_id)
+                return client
+        return self._add(installation_id)
+
+    def token(self, installation_id: int) -> str:
+        """Return a valid token for the installation.
+
+        :param int installation_id:
+            the identifier of the installation
+        :returns:
+            the installation's token, requesting a new one if necessary
+        :rtype:
+            str
+        :raises:
+            ValueError if the authentication of the installation's client was
+            replaced
+        """
+        auth = self.client(installation_id).session.auth
+        if not isinstance(auth, _session.RenewingAppInstallationTokenAuth):
+            raise ValueError(
+                f"The client of installation {installation_id} is not "
+                "authenticated by the broker"
+            )
+        auth.renew()
+        return auth.token
+
+    def discard(self, installation_id: int) -> None:
+        """Forget the client and token of the installation.
+
+        Use this when the App is uninstalled or the installation suspended.
+
+        :param int installation_id:
+            the identifier of the installation
+        """
+        with self._lock:
+            self._clients.pop(int(installation_id), None)
+
+    def save(self) -> None:
+        """Write the unexpired tokens to ``state_path``.
+
+        The file is only readable by its owner.
+        """
+        if self.state_path is None:
+            return
+        with self._lock:
+            auths = [(i, c.session.auth) for i, c in self._clients.items()]
+        state = {
+            str(installation_id): {
+                "token": auth.token,
+                "expires_at": auth.expires_at_str,
+            }
+            for installation_id, auth in auths
+            if isinstance(auth, _session.RenewingAppInstallationTokenAuth)
+            and auth.token is not None
+            and not auth.expired
+        }
+        utils.write_file_atomically(
+            self.state_path, jsonlib.dumps(state).encode(), mode=0o600
+        )
+
+    def _add(self, installation_id, json=None):
+        auth = _session.RenewingAppInstallationTokenAuth(
+            self.session,
+            self.private_key_pem,
+            self.app_id,
+            installation_id,
+            json,
+            renew_before=self.renew_before,
+            jwt_provider=self.jwt_provider,
+        )
+        client = _github.GitHub(session=self._new_session(auth))
+        with self._lock:
+            # Another thread may have added it while the lock was released
+            client = self._clients.setdefault(installation_id, client)
+            self._clients.move_to_end(installation_id)
+            while len(self._clients) > self.max_size:
+                evicted, _ = self._clients.popitem(last=False)
+                LOG.debug("Evicted the client of installation %s", evicted)
+        return client
+
+    def _new_session(self, auth):
+        new = self.session.clone()
+        new.auth = auth
+        return new
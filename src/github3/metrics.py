@@ -0,0 +1,537 @@
+"""Metrics and tracing of the requests made by a session.
+
+Every request made through a :class:`~github3.session.GitHubSession` can be
+reported to observers added with
+:meth:`~github3.session.GitHubSession.add_request_observer` and traced by
+tracers added with :meth:`~github3.session.GitHubSession.add_request_tracer`.
+Requests are identified by their URL template, e.g.,
+``/repos/{owner}/{repo}/issues/{number}``, rather than their URL so that
+the metrics of thousands of repositories stay a handful of series.
+"""
+
+import bisect
+import re
+import threading
+import typing as t
+from urllib.parse import urlsplit
+
+#: Matches full SHA-1 (and SHA-256) object names
+_SHA = re.compile(r"^(?:[0-9a-f]{40}|[0-9a-f]{64})$")
+
+# Segments followed by the owner and name of a repository
+_REPOSITORIES = {"networks", "repos", "starred"}
+# The placeholder for the segment after each of these segments
+_PLACEHOLDERS = {
+    "apps": "{app_slug}",
+    "assignees": "{assignee}",
+    "branches": "{branch}",
+    "collaborators": "{username}",
+    "commits": "{ref}",
+    "compare": "{basehead}",
+    "enterprises": "{enterprise}",
+    "environments": "{environment}",
+    "events": "{id}",
+    "following": "{username}",
+    "gists": "{gist_id}",
+    "gitignore": "{name}",
+    "labels": "{name}",
+    "licenses": "{license}",
+    "members": "{username}",
+    "memberships": "{username}",
+    "orgs": "{org}",
+    "public_members": "{username}",
+    "secrets": "{secret_name}",
+    "tags": "{tag}",
+    "teams": "{team_slug}",
+    "users": "{username}",
+    "variables": "{name}",
+}
+# Segments which are a path of their own, e.g., a file or a reference
+_REST_PLACEHOLDERS = {
+    "contents": "{path}",
+    "matching-refs": "{ref}",
+    "ref": "{ref}",
+    "refs": "{ref}",
+    "tarball": "{ref}",
+    "trees": "{ref}",
+    "zipball": "{ref}",
+}
+# Segments which follow one of the above but are part of the API itself
+_FIXED = {
+    "events": {"public", "orgs"},
+    "gists": {"public", "starred"},
+    "gitignore": {"templates"},
+    "secrets": {"public-key"},
+}
+# Segments followed by a name which may contain slashes, e.g., a branch,
+# and the segments of the API which may come after the name
+_SLASHED = {
+    "branches": {"protection", "rename"},
+    "commits": {
+        "branches-where-head",
+        "check-runs",
+        "check-suites",
+        "comments",
+        "pulls",
+        "status",
+        "statuses",
+    },
+}
+
+
+def url_template(url: str, base_url: str = "https://api.github.com") -> str:
+    """Replace the identifiers in the path of ``url`` with placeholders.
+
+    The host, the API prefix of a GitHub Enterprise ``base_url``, and the
+    query are removed.
+
+    .. code-block:: python
+
+        >>> url_template("https://api.github.com/repos/o/r/issues/1?page=2")
+        '/repos/{owner}/{repo}/issues/{number}'
+
+    :param str url:
+        the URL of a request
+    :param str base_url:
+        (optional), the URL of the API. Default: https://api.github.com
+    :returns:
+        the path of the URL with placeholders
+    :rtype:
+        str
+    """
+    path = urlsplit(url).path
+    prefix = urlsplit(base_url).path.rstrip("/")
+    if prefix and path.startswith(prefix + "/"):
+        path = path[len(prefix) :]
+    segments = [s for s in path.split("/") if s]
+    template: t.List[str] = []
+    i = 0
+    while i < len(segments):
+        segment = segments[i]
+        previous = segments[i - 1] if i else None
+        if previous in _REST_PLACEHOLDERS and template[-1] == previous:
+            template.append(_REST_PLACEHOLDERS[previous])
+            break
+        if previous in _REPOSITORIES and template[-1] == previous:
+            template.extend(["{owner}", "{repo}"])
+            i += 2
+            continue
+        if previous in _SLASHED and template[-1] == previous:
+            # The name runs until the last of the API's own segments
+            rest = segments[i + 1 :]
+            ends = [
+                j
+                for j, name in enumerate(rest, 1)
+                if name in _SLASHED[previous]
+            ]
+            template.append(_PLACEHOLDERS[previous])
+            i += ends[-1] if ends else len(rest) + 1
+            continue
+        if segment.isdigit():
+            template.append("{number}" if previous != "events" else "{id}")
+        elif _SHA.match(segment):
+            template.append("{sha}")
+        elif (
+            previous in _PLACEHOLDERS
+            and template[-1] == previous
+            and segment not in _FIXED.get(previous, ())
+        ):
+            template.append(_PLACEHOLDERS[previous])
+        else:
+            template.append(segment)
+        i += 1
+    return "/" + "/".join(template)
+
+
+class RequestEvent:
+    """The outcome of a request made through a session.
+
+    .. versionadded:: 4.1.0
+
+    This object has the following attributes:
+
+    .. attribute:: method
+
+        The HTTP method, e.g., ``'GET'``.
+
+    .. attribute:: template
+
+        The path of the URL with placeholders, see :func:`url_template`.
+
+    .. attribute:: status
+
+        The status code of the final response, or ``None`` if the request
+        failed without one.
+
+    .. attribute:: duration
+
+        The number of seconds from sending the request until the response
+        headers, or the error, were received.
+
+    .. attribute:: bytes_sent
+
+        The size of the request body.
+
+    .. attribute:: bytes_received
+
+        The size of the response body, or its ``Content-Length`` for
+        streamed responses.
+
+    .. attribute:: retries
+
+        The number of responses which preceded the final one, e.g.,
+        redirects, two-factor authentication prompts, and requests sent
+        again with a renewed or another token.
+
+    .. attribute:: cache
+
+        ``'hit'`` if a conditional request was answered with a 304,
+        ``'miss'`` if a conditional request was not, otherwise ``None``.
+
+    .. attribute:: rate_limit_resource
+
+        The rate limit the request counted against, e.g., ``'core'`` or
+        ``'search'``, or ``None`` if the response did not say.
+
+    .. attribute:: rate_limit_remaining
+
+        The number of requests remaining in that rate limit, or ``None``.
+
+    .. attribute:: error
+
+        The exception raised by the request, or ``None``.
+    """
+
+    __slots__ = (
+        "method",
+        "template",
+        "status",
+        "duration",
+        "bytes_sent",
+        "bytes_received",
+        "retries",
+        "cache",
+        "rate_limit_resource",
+        "rate_limit_remaining",
+        "error",
+    )
+
+    def __init__(self, method, template, duration, response=None, error=None):
+        self.method = method.upper()
+        self.template = template
+        self.duration = duration
+        self.error = error
+        self.status = self.cache = None
+        self.rate_limit_resource = self.rate_limit_remaining = None
+        self.bytes_sent = self.bytes_received = self.retries = 0
+        if response is not None:
+            self._update(response)
+
+    def __repr__(self):
+        return "<RequestEvent [{s.method} {s.template} {s.status}]>".format(
+            s=self
+        )
+
+    def _update(self, response):
+        self.status = response.status_code
+        self.retries = len(response.history)
+        request_headers = response.request.headers
+        if (
+            "If-None-Match" in request_headers
+            or "If-Modified-Since" in request_headers
+        ):
+            self.cache = "hit" if response.status_code == 304 else "miss"
+        body = response.request.body
+        if isinstance(body, str):
+            body = body.encode()
+        if isinstance(body, bytes):
+            self.bytes_sent = len(body)
+        headers = response.headers
+        if response._content_consumed:
+            self.bytes_received = len(response.content or b"")
+        elif headers.get("Content-Length", "").isdigit():
+            self.bytes_received = int(headers["Content-Length"])
+        if "X-RateLimit-Remaining" in headers:
+            self.rate_limit_resource = headers.get(
+                "X-RateLimit-Resource", "core"
+            )
+            try:
+                self.rate_limit_remaining = int(
+                    headers["X-RateLimit-Remaining"]
+                )
+            except ValueError:
+                pass
+
+
+#: The upper bounds, in seconds, of the buckets of request durations
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (
+        (
+            name,
+            str(value)
+            .replace("\\", r"\\")
+            .replace('"', r"\"")
+            .replace("\n", r"\n"),
+        )
+        for name, value in pairs
+    )
+    return "{" + ",".join(f'{n}="{v}"' for n, v in escaped) + "}"
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} requires the labels {self.labelnames}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _render(self):
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_name}"
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield from self._render_value(key, value)
+
+    def _render_value(self, key, value):
+        labels = _format_labels(self.labelnames, key)
+        yield f"{self.name}{labels} {value!r}"
+
+
+class Counter(_Metric):
+    """A value which only increases, e.g., a number of requests."""
+
+    type_name = "counter"
+
+    def inc(self, amount=1, **labels):
+        """Increase the value with the given labels by ``amount``."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        """Return the value with the given labels."""
+        return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """A value which can go up and down, e.g., a remaining rate limit."""
+
+    type_name = "gauge"
+
+    def set(self, value, **labels):
+        """Set the value with the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels):
+        """Return the value with the given labels."""
+        return self._values.get(self._key(labels))
+
+
+class Histogram(_Metric):
+    """The distribution of observed values, e.g., request durations."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        """Count ``value`` in its bucket of the given labels."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(
+                key, ([0] * (len(self.buckets) + 1), 0.0)
+            )
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels):
+        """Return the number of values observed with the given labels."""
+        counts, _ = self._values.get(self._key(labels), ((), 0.0))
+        return sum(counts)
+
+    def _render_value(self, key, value):
+        counts, total = value
+        cumulative = 0
+        bounds = [repr(float(b)) for b in self.buckets] + ["+Inf"]
+        for bound, count in zip(bounds, counts):
+            cumulative += count
+            labels = _format_labels(self.labelnames, key, [("le", bound)])
+            yield f"{self.name}_bucket{labels} {cumulative}"
+        labels = _format_labels(self.labelnames, key)
+        yield f"{self.name}_sum{labels} {total!r}"
+        yield f"{self.name}_count{labels} {cumulative}"
+
+
+class Registry:
+    """A collection of metrics which can be rendered for Prometheus.
+
+    .. versionadded:: 4.1.0
+    """
+
+    def __init__(self) -> None:
+        self._metrics: t.Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<Registry [{', '.join(self._metrics)}]>"
+
+    def _register(self, cls, name, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"{name} is already a {metric.type_name}")
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        """Return the counter called ``name``, creating it if necessary."""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, labelnames=()):
+        """Return the gauge called ``name``, creating it if necessary."""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS
+    ):
+        """Return the histogram called ``name``, creating it if necessary."""
+        return self._register(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format.
+
+        :returns:
+            the metrics, e.g., to serve at ``/metrics``
+        :rtype:
+            str
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        lines = []
+        for _, metric in metrics:
+            lines.extend(metric._render())
+        return "\n".join(lines) + "\n"
+
+
+class RequestMetrics:
+    """Record the requests of sessions in a :class:`Registry`.
+
+    Add it to each session whose requests should be recorded. Sessions
+    given different ``labels``, e.g., the name of the job using them, are
+    recorded separately, so it is clear which job uses up a shared rate
+    limit.
+
+    .. code-block:: python
+
+        registry = metrics.Registry()
+        gh.session.add_request_observer(
+            metrics.RequestMetrics(registry, labels={"job": "crawler"})
+        )
+        ...
+        print(registry.render())
+
+    .. versionadded:: 4.1.0
+
+    :param registry:
+        (optional), the registry to record the metrics in. Default: a new
+        registry, available as :attr:`registry`
+    :type registry:
+        :class:`Registry`
+    :param dict labels:
+        (optional), labels added to every metric. Every instance using the
+        same registry must use the same label names. Default: none
+    :param str prefix:
+        (optional), the prefix of the metrics' names. Default: 'github3'
+    """
+
+    def __init__(self, registry=None, labels=None, prefix="github3"):
+        self.registry = registry or Registry()
+        self.labels = dict(labels or {})
+        names = tuple(self.labels)
+        request_names = names + ("method", "template")
+        self.requests = self.registry.counter(
+            f"{prefix}_requests_total",
+            "Requests made, by response status",
+            request_names + ("status",),
+        )
+        self.duration = self.registry.histogram(
+            f"{prefix}_request_duration_seconds",
+            "Time until the response headers were received",
+            request_names,
+        )
+        self.bytes_sent = self.registry.counter(
+            f"{prefix}_request_bytes_total",
+            "Bytes of request bodies sent",
+            request_names,
+        )
+        self.bytes_received = self.registry.counter(
+            f"{prefix}_response_bytes_total",
+            "Bytes of response bodies received",
+            request_names,
+        )
+        self.retries = self.registry.counter(
+            f"{prefix}_request_retries_total",
+            "Responses which were followed by another request",
+            request_names,
+        )
+        self.conditional = self.registry.counter(
+            f"{prefix}_conditional_requests_total",
+            "Conditional requests, by whether they were answered with a 304",
+            request_names + ("cache",),
+        )
+        self.rate_limit_remaining = self.registry.gauge(
+            f"{prefix}_rate_limit_remaining",
+            "Requests remaining in the rate limit at the latest response",
+            names + ("resource",),
+        )
+
+    def __repr__(self):
+        return f"<RequestMetrics [{self.labels}]>"
+
+    def __call__(self, event):
+        """Record a :class:`RequestEvent`."""
+        labels = dict(
+            self.labels, method=event.method, template=event.template
+        )
+        status = event.status if event.status is not None else "error"
+        self.requests.inc(status=status, **labels)
+        self.duration.observe(event.duration, **labels)
+        self.bytes_sent.inc(event.bytes_sent, **labels)
+        self.bytes_received.inc(event.bytes_received, **labels)
+        if event.retries:
+            self.retries.inc(event.retries, **labels)
+        if event.cache is not None:
+            self.conditional.inc(cache=event.cache, **labels)
+        if event.rate_limit_remaining is not None:
+            self.rate_limit_remaining.set(
+                event.rate_limit_remaining,
+                resource=event.rate_limit_resource,
+                **self.labels,
+            )
@@ -7,6 +7,7 @@ import typing as t
 import dateutil.parser
 import requests.compat
 
+from . import cache
 from . import exceptions
 from . import session
 
@@ -183,6 +184,30 @@ class GitHubCore:
         LOG.info("JSON was %sreturned", "not " if ret is None else "")
         return ret
 
+    def _immutable_json(self, url, sha, **kwargs):
+        """Retrieve the JSON for an object addressed by ``sha``.
+
+        If the session has an object cache and ``sha`` is a complete object
+        name, the cache is consulted first and successful responses are
+        stored in it.
+        """
+        object_cache = getattr(self.session, "object_cache", None)
+        if object_cache is None or not cache.is_full_sha(sha):
+            return self._json(self._get(url, **kwargs), 200)
+
+        key = url
+        params = kwargs.get("params")
+        if params:
+            key += "?" + requests.compat.urlencode(sorted(params.items()))
+        data = object_cache.get(key)
+        if data is not None:
+            return jsonlib.loads(data)
+
+        json = self._json(self._get(url, **kwargs), 200)
+        if json:
+            object_cache.set(key, jsonlib.dumps(json).encode("utf-8"))
+        return json
+
     def _boolean(self, response, true_code, false_code):
         if response is not None:
             status_code = response.status_code
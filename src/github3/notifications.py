@@ -282,3 +282,198 @@ class RepositorySubscription(_Subscription):
     def _update_subscription(self, sub):
         super()._update_attributes(sub)
         self.repository_url = sub.get("repository_url")
+
+
+class NotificationSync(models.GitHubCore):
+    """A local mirror of notification threads kept up to date incrementally.
+
+    Each call to :meth:`fetch` asks GitHub only for the threads updated since
+    the newest one already seen and sends the ``Last-Modified`` date of the
+    previous response, so polling when nothing has changed costs no rate
+    limit. :meth:`mark_read` marks threads read with as few requests as
+    possible.
+
+    Do not create this directly, use
+    :meth:`~github3.github.GitHub.notification_sync` or
+    :meth:`~github3.repos.repo.Repository.notification_sync`. To resume a
+    sync, e.g., in another process, pass the :attr:`last_modified` and
+    :attr:`since` of the previous one.
+
+    .. versionadded:: 4.1.0
+
+    This object has the following attributes:
+
+    .. attribute:: threads
+
+        A dictionary of the unread :class:`~github3.notifications.Thread`
+        objects seen so far, keyed by their ``id``.
+
+    .. attribute:: last_modified
+
+        The ``Last-Modified`` header of the last response.
+
+    .. attribute:: since
+
+        The ``updated_at`` of the most recently updated thread seen so far,
+        as an ISO 8601 string.
+
+    .. attribute:: poll_interval
+
+        The number of seconds GitHub asked clients to wait between polls.
+    """
+
+    def __init__(
+        self,
+        url,
+        session,
+        participating=False,
+        last_modified=None,
+        since=None,
+    ):
+        super().__init__({}, session)
+        self._api = url
+        self.participating = participating
+        self.last_modified = last_modified
+        self.since = since
+        self.poll_interval = 60
+        self.threads = {}
+        # Whether threads holds every unread thread, i.e., a fetch listed
+        # them all rather than only those updated since a previous sync
+        self._complete = False
+
+    def _repr(self):
+        return f"<NotificationSync [{self._api}]>"
+
+    def fetch(self):
+        """Retrieve the threads updated since the last fetch.
+
+        Threads which are read elsewhere are not reported by GitHub. They
+        stay in :attr:`threads` until they are next updated or marked read.
+
+        :returns:
+            the threads which are new or were updated, in the order GitHub
+            returned them
+        :rtype:
+            [:class:`~github3.notifications.Thread`]
+        """
+        complete = self._complete or (
+            not self.participating
+            and self.since is None
+            and self.last_modified is None
+        )
+        params = {}
+        if self.participating:
+            params["participating"] = "true"
+        if self.since:
+            params["since"] = self.since
+        headers = {}
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        changed = []
+        response = self._get(self._api, params=params, headers=headers)
+        if response.status_code != 304:
+            self.last_modified = response.headers.get(
+                "Last-Modified", self.last_modified
+            )
+        self.poll_interval = int(
+            response.headers.get("X-Poll-Interval", self.poll_interval)
+        )
+        while True:
+            json = self._json(response, 200)
+            if json is None:
+                break
+            for thread_json in json:
+                thread = Thread(thread_json, self)
+                known = self.threads.get(thread.id)
+                if known is not None and (
+                    known.updated_at == thread.updated_at
+                ):
+                    continue
+                updated_at = thread_json["updated_at"]
+                if self.since is None or updated_at > self.since:
+                    self.since = updated_at
+                if thread.unread:
+                    self.threads[thread.id] = thread
+                else:
+                    self.threads.pop(thread.id, None)
+                changed.append(thread)
+            next_url = response.links.get("next", {}).get("url")
+            if not next_url:
+                break
+            response = self._get(next_url)
+        self._complete = complete
+        return changed
+
+    def mark_read(self, threads):
+        """Mark threads as read using as few requests as possible.
+
+        When every unread thread seen in a repository is being marked, the
+        repository's notifications are marked read up to the newest of them
+        with one request; when that is true of every thread, all
+        notifications are. Threads updated after that point stay unread.
+        Otherwise, threads are marked one at a time. Syncs limited to
+        participating threads or resumed from a previous one always mark
+        one at a time since they do not see every thread.
+
+        :param threads:
+            the threads to mark read
+        :type threads:
+            iterable of :class:`~github3.notifications.Thread`
+        :returns:
+            True if every request succeeded, False otherwise
+        :rtype:
+            bool
+        """
+        threads = {thread.id: thread for thread in threads}
+        if not threads:
+            return True
+
+        if self._complete and self._covers(threads, self.threads):
+            success = self._mark_up_to(self._api, threads.values())
+            return self._forget(threads, success)
+
+        by_repository = {}
+        for thread in threads.values():
+            by_repository.setdefault(thread.repository._api, {})[
+                thread.id
+            ] = thread
+        unread_by_repository = {}
+        for thread in self.threads.values():
+            unread_by_repository.setdefault(thread.repository._api, {})[
+                thread.id
+            ] = thread
+
+        success = True
+        for repository_url, marking in by_repository.items():
+            if self._complete and self._covers(
+                marking, unread_by_repository.get(repository_url, {})
+            ):
+                url = self._build_url(
+                    "notifications", base_url=repository_url
+                )
+                marked = self._mark_up_to(url, marking.values())
+            else:
+                marked = all([thread.mark() for thread in marking.values()])
+            success = self._forget(marking, marked) and success
+        return success
+
+    @staticmethod
+    def _covers(marking, unread):
+        return all(thread_id in marking for thread_id in unread)
+
+    def _mark_up_to(self, url, threads):
+        last_read_at = max(
+            thread.as_dict()["updated_at"] for thread in threads
+        )
+        response = self._put(url, data=dumps({"last_read_at": last_read_at}))
+        # GitHub marks large numbers of notifications in the background
+        return self._boolean(response, 205, 404) or (
+            response is not None and response.status_code == 202
+        )
+
+    def _forget(self, threads, marked):
+        if marked:
+            for thread_id in threads:
+                self.threads.pop(thread_id, None)
+        return marked
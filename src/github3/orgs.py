@@ -8,12 +8,14 @@ from uritemplate import URITemplate  # type: ignore
 from . import exceptions
 from . import models
 from . import users
+from . import utils
 from .actions import secrets as actionsecrets
 from .decorators import requires_auth
 from .events import Event
 from .projects import Project
 from .repos import Repository
 from .repos import ShortRepository
+from .repos import traffic
 
 if t.TYPE_CHECKING:
     from . import users as _users
@@ -172,7 +174,8 @@ class _Team(models.GitHubCore):
             bool
         """
         url = self._build_url("repos", repository, base_url=self._api)
-        return self._boolean(self._get(url), 204, 404)
+        with self.session.no_token_retries():
+            return self._boolean(self._get(url), 204, 404)
 
     @requires_auth
     def members(self, role=None, number=-1, etag=None):
@@ -382,6 +385,161 @@ class ShortTeam(_Team):
     _refresh_to = Team
 
 
+#: Repository permissions from least to most privileged
+PERMISSIONS = ("pull", "triage", "push", "maintain", "admin")
+
+
+def _highest_permission(permissions):
+    """Find the most privileged permission granted in a permissions dict."""
+    highest = None
+    for permission in PERMISSIONS:
+        if permissions.get(permission):
+            highest = permission
+    return highest
+
+
+class PermissionMatrix:
+    """The permission every team has on every repository of an organization.
+
+    Permissions are stored as one byte per team and repository, so even
+    matrices of thousands of teams and repositories are compact.
+
+    Do not create this directly, use
+    :meth:`~github3.orgs.Organization.permission_matrix`.
+
+    .. versionadded:: 4.1.0
+
+    This object has the following attributes:
+
+    .. attribute:: teams
+
+        The sorted slugs of the teams.
+
+    .. attribute:: repositories
+
+        The sorted full names of the repositories any team can access.
+
+    .. attribute:: members
+
+        A dictionary of the logins of the members of each team, keyed by
+        slug. This is empty unless members were requested.
+    """
+
+    def __init__(self, team_repositories, members=None):
+        self.teams = sorted(team_repositories)
+        self.repositories = sorted(
+            {name for repos in team_repositories.values() for name in repos}
+        )
+        self.members = dict(members or {})
+        self._team_index = {slug: i for i, slug in enumerate(self.teams)}
+        self._repository_index = {
+            name: i for i, name in enumerate(self.repositories)
+        }
+        width = len(self.repositories)
+        self._levels = bytearray(len(self.teams) * width)
+        for slug, repos in team_repositories.items():
+            row = self._team_index[slug] * width
+            for name, permission in repos.items():
+                if permission is not None:
+                    level = PERMISSIONS.index(permission) + 1
+                    self._levels[row + self._repository_index[name]] = level
+
+    def __repr__(self):
+        return "<PermissionMatrix [{} teams x {} repositories]>".format(
+            len(self.teams), len(self.repositories)
+        )
+
+    def permission(self, team, repository):
+        """Return the permission of a team on a repository.
+
+        :param str team:
+            the slug of the team
+        :param str repository:
+            the full name of the repository, e.g., ``octo-org/octo-repo``
+        :returns:
+            the permission, e.g., ``"push"``, or None if the team has no
+            access
+        :rtype:
+            str
+        """
+        team_index = self._team_index.get(team)
+        repository_index = self._repository_index.get(repository)
+        if team_index is None or repository_index is None:
+            return None
+        level = self._levels[
+            team_index * len(self.repositories) + repository_index
+        ]
+        return PERMISSIONS[level - 1] if level else None
+
+    def repositories_for(self, team):
+        """Return the repositories a team can access.
+
+        :param str team:
+            the slug of the team
+        :returns:
+            the permission of the team keyed by repository full name
+        :rtype:
+            dict
+        """
+        team_index = self._team_index.get(team)
+        if team_index is None:
+            return {}
+        width = len(self.repositories)
+        row = self._levels[team_index * width : (team_index + 1) * width]
+        return {
+            self.repositories[i]: PERMISSIONS[level - 1]
+            for i, level in enumerate(row)
+            if level
+        }
+
+    def teams_for(self, repository):
+        """Return the teams which can access a repository.
+
+        :param str repository:
+            the full name of the repository
+        :returns:
+            the permission of each team keyed by slug
+        :rtype:
+            dict
+        """
+        repository_index = self._repository_index.get(repository)
+        if repository_index is None:
+            return {}
+        column = self._levels[repository_index :: len(self.repositories)]
+        return {
+            self.teams[i]: PERMISSIONS[level - 1]
+            for i, level in enumerate(column)
+            if level
+        }
+
+    def permissions_for_user(self, login):
+        """Return the repositories a user can access through their teams.
+
+        This requires the matrix to have been built with members.
+
+        :param str login:
+            the login of the user
+        :returns:
+            the most privileged permission granted by any of the user's teams
+            keyed by repository full name
+        :rtype:
+            dict
+        """
+        width = len(self.repositories)
+        levels = bytearray(width)
+        for slug, logins in self.members.items():
+            if login not in logins:
+                continue
+            team_index = self._team_index[slug]
+            row = self._levels[team_index * width : (team_index + 1) * width]
+            levels = bytearray(map(max, levels, row))
+        return {
+            self.repositories[i]: PERMISSIONS[level - 1]
+            for i, level in enumerate(levels)
+            if level
+        }
+
+
 class _Organization(models.GitHubCore):
     """The :class:`Organization <Organization>` object.
 
@@ -558,7 +716,8 @@ class _Organization(models.GitHubCore):
             bool
         """
         url = self._build_url("blocks", str(username), base_url=self._api)
-        return self._boolean(self._get(url), 204, 404)
+        with self.session.no_token_retries():
+            return self._boolean(self._get(url), 204, 404)
 
     @requires_auth
     def create_hook(self, name, config, events=["push"], active=True):
@@ -957,7 +1116,8 @@ class _Organization(models.GitHubCore):
             bool
         """
         url = self._build_url("members", username, base_url=self._api)
-        return self._boolean(self._get(url), 204, 404)
+        with self.session.no_token_retries():
+            return self._boolean(self._get(url), 204, 404)
 
     def is_public_member(self, username):
         """Check if the user named ``username`` is a public member.
@@ -970,7 +1130,8 @@ class _Organization(models.GitHubCore):
             bool
         """
         url = self._build_url("public_members", username, base_url=self._api)
-        return self._boolean(self._get(url), 204, 404)
+        with self.session.no_token_retries():
+            return self._boolean(self._get(url), 204, 404)
 
     def all_events(self, username, number=-1, etag=None):
         """Iterate over all org events visible to the authenticated user.
@@ -1166,6 +1327,34 @@ class _Organization(models.GitHubCore):
             params["type"] = type
         return self._iter(int(number), url, ShortRepository, params, etag)
 
+    def traffic(self, kind="views", per="day", type="", max_workers=8):
+        """Collect the views or clones of every repository in this org.
+
+        The traffic of the repositories is requested concurrently and
+        aligned on a common timeline.
+
+        .. versionadded:: 4.1.0
+
+        :param str kind:
+            (optional), ('views', 'clones'). Default: 'views'
+        :param str per:
+            (optional), ('day', 'week'). Default: 'day'
+        :param str type:
+            (optional), the type of repositories to include, accepted values:
+            ('all', 'public', 'member', 'private', 'forks', 'sources'),
+            API default: 'all'
+        :param int max_workers:
+            (optional), the number of repositories to request concurrently.
+            Default: 8
+        :returns:
+            the traffic of each repository
+        :rtype:
+            :class:`~github3.repos.traffic.TrafficTable`
+        """
+        return traffic.fetch_traffic(
+            self.repositories(type), kind, per, max_workers
+        )
+
     @requires_auth
     def teams(self, number=-1, etag=None):
         """Iterate over teams that are part of this organization.
@@ -1183,6 +1372,48 @@ class _Organization(models.GitHubCore):
         url = self._build_url("teams", base_url=self._api)
         return self._iter(int(number), url, ShortTeam, etag=etag)
 
+    @requires_auth
+    def permission_matrix(self, members=False, max_workers=8):
+        """Build a matrix of the permission of every team on every repository.
+
+        The repositories of each team, and optionally its members, are
+        listed concurrently, which takes one request per page of results
+        instead of one request per team and repository.
+
+        .. versionadded:: 4.1.0
+
+        :param bool members:
+            (optional), also list the members of each team so the access of
+            users can be computed. Default: False
+        :param int max_workers:
+            (optional), the number of teams to list concurrently. Default: 8
+        :returns:
+            the permissions of every team
+        :rtype:
+            :class:`~github3.orgs.PermissionMatrix`
+        """
+
+        def list_team(team):
+            repositories = {
+                repository.full_name: _highest_permission(
+                    repository.permissions
+                )
+                for repository in team.repositories()
+            }
+            logins = []
+            if members:
+                logins = [member.login for member in team.members()]
+            return repositories, logins
+
+        team_repositories = {}
+        team_members = {}
+        listings = utils.imap_unordered(list_team, self.teams(), max_workers)
+        for team, (repositories, logins) in listings:
+            team_repositories[team.slug] = repositories
+            if members:
+                team_members[team.slug] = frozenset(logins)
+        return PermissionMatrix(team_repositories, team_members)
+
     @requires_auth
     def publicize_member(self, username: str) -> bool:
         """Make ``username``'s membership in this organization public.
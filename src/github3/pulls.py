@@ -4,6 +4,7 @@ from json import dumps
 
 from uritemplate import URITemplate  # type: ignore
 
+from . import diffs
 from . import models
 from . import users
 from .decorators import requires_auth
@@ -410,6 +411,52 @@ class _PullRequest(models.GitHubCore):
         )
         return resp.content if self._boolean(resp, 200, 404) else b""
 
+    def diff_files(self, include_hunks=True):
+        """Iterate over the files changed in the diff for this pull request.
+
+        The diff is parsed as it is downloaded so only one file is held in
+        memory at a time.
+
+        .. versionadded:: 4.1.0
+
+        :param bool include_hunks:
+            (optional), whether to keep the hunks of each file. When False
+            only the line counts are computed. Default: True
+        :returns:
+            generator of changed files
+        :rtype:
+            :class:`~github3.diffs.FileDiff`
+        """
+        resp = self._get(
+            self._api,
+            headers={"Accept": "application/vnd.github.diff"},
+            stream=True,
+        )
+        if self._boolean(resp, 200, 404):
+            yield from diffs.parse_diff(diffs.iter_lines(resp), include_hunks)
+
+    def diff_summary(self):
+        """Count the files, additions, and deletions in the pull request's diff.
+
+        The diff is streamed and only counted, so this uses very little
+        memory regardless of the size of the diff.
+
+        .. versionadded:: 4.1.0
+
+        :returns:
+            the totals for the diff
+        :rtype:
+            :class:`~github3.diffs.DiffSummary`
+        """
+        resp = self._get(
+            self._api,
+            headers={"Accept": "application/vnd.github.diff"},
+            stream=True,
+        )
+        if self._boolean(resp, 200, 404):
+            return diffs.summarize_diff(diffs.iter_lines(resp))
+        return diffs.DiffSummary(0, 0, 0)
+
     def is_merged(self):
         """Check to see if the pull request was merged.
 
@@ -424,7 +471,8 @@ class _PullRequest(models.GitHubCore):
             bool
         """
         url = self._build_url("merge", base_url=self._api)
-        return self._boolean(self._get(url), 204, 404)
+        with self.session.no_token_retries():
+            return self._boolean(self._get(url), 204, 404)
 
     def issue(self):
         """Retrieve the issue associated with this pull request.
@@ -3,7 +3,9 @@
 import typing as t
 
 from .. import decorators
+from .. import exceptions
 from .. import models
+from .. import utils
 from . import commit
 
 if t.TYPE_CHECKING:
@@ -1351,3 +1353,376 @@ class ProtectionRequiredConversationResolution(models.GitHubCore):
 
     def _update_attributes(self, protection):
         self.enabled = protection["enabled"]
+
+
+#: Protections which are only enabled or disabled
+_TOGGLES = (
+    "required_linear_history",
+    "allow_force_pushes",
+    "allow_deletions",
+    "required_conversation_resolution",
+    "lock_branch",
+    "block_creations",
+    "allow_fork_syncing",
+)
+
+#: Settings which list the users, teams, and apps they apply to
+_ACTORS = frozenset(
+    [
+        "restrictions",
+        "dismissal_restrictions",
+        "bypass_pull_request_allowances",
+    ]
+)
+
+#: The policy in effect on a branch which is not protected
+_UNPROTECTED = dict(
+    {
+        "required_status_checks": None,
+        "enforce_admins": False,
+        "required_pull_request_reviews": None,
+        "restrictions": None,
+        "required_signatures": False,
+    },
+    **{name: False for name in _TOGGLES},
+)
+
+
+def _actor_names(actors):
+    """Reduce lists of users, teams, and apps to sorted names."""
+    if actors is None:
+        return None
+    return {
+        "users": sorted(user["login"] for user in actors.get("users", [])),
+        "teams": sorted(team["slug"] for team in actors.get("teams", [])),
+        "apps": sorted(app["slug"] for app in actors.get("apps", [])),
+    }
+
+
+def effective_protection(protection):
+    """Reduce the JSON of a branch's protection to a policy.
+
+    The policy has the shape of the body of
+    :meth:`~github3.repos.branch.Branch.protect`, with the names of users,
+    teams, and apps in place of objects, plus ``required_signatures``,
+    ``lock_branch``, ``block_creations``, and ``allow_fork_syncing``. The
+    required status checks which must be set by a particular app have the
+    app's id under ``apps``, keyed by their context.
+
+    .. versionadded:: 4.1.0
+
+    :param dict protection:
+        the JSON returned by GitHub for a branch's protection, or None if the
+        branch is not protected
+    :returns:
+        the policy in effect, or None if the branch is not protected
+    :rtype:
+        dict
+    """
+    if protection is None:
+        return None
+    policy = {}
+    checks = protection.get("required_status_checks")
+    if checks is not None:
+        apps = {
+            check["context"]: check["app_id"]
+            for check in checks.get("checks", [])
+            if check.get("app_id") is not None
+        }
+        checks = {
+            "strict": checks.get("strict", False),
+            "contexts": sorted(checks.get("contexts", [])),
+        }
+        if apps:
+            checks["apps"] = apps
+    policy["required_status_checks"] = checks
+    reviews = protection.get("required_pull_request_reviews")
+    if reviews is not None:
+        reviews = {
+            key: value
+            for key, value in reviews.items()
+            if key not in ("url", "dismissal_restrictions_url")
+        }
+        for key in (
+            "dismissal_restrictions",
+            "bypass_pull_request_allowances",
+        ):
+            if key in reviews:
+                reviews[key] = _actor_names(reviews[key])
+    policy["required_pull_request_reviews"] = reviews
+    policy["restrictions"] = _actor_names(protection.get("restrictions"))
+    for name in ("enforce_admins", "required_signatures") + _TOGGLES:
+        policy[name] = (protection.get(name) or {}).get("enabled", False)
+    return policy
+
+
+def _normalize(value, actors=False):
+    """Sort lists and fill in omitted kinds of actors for comparison."""
+    if isinstance(value, list):
+        return sorted(value)
+    if not isinstance(value, dict):
+        return value
+    if actors:
+        value = dict({"users": [], "teams": [], "apps": []}, **value)
+    return {
+        key: _normalize(item, key in _ACTORS) for key, item in value.items()
+    }
+
+
+def _desired_protection(current, policy):
+    """Overlay a policy on the protection currently in effect."""
+    desired = dict(current or _UNPROTECTED)
+    for name, value in policy.items():
+        existing = desired.get(name)
+        if isinstance(value, dict) and name != "restrictions":
+            value = dict(existing or {}, **value)
+        desired[name] = _normalize(value, name in _ACTORS)
+    return desired
+
+
+def _status_checks_body(checks):
+    """Turn required status checks into the body GitHub accepts."""
+    apps = checks.get("apps")
+    if not apps:
+        return checks
+    body = {"strict": checks.get("strict", False), "checks": []}
+    for context in checks.get("contexts", []):
+        check = {"context": context}
+        # Checks without an app may be set by any app
+        if context in apps:
+            check["app_id"] = apps[context]
+        body["checks"].append(check)
+    return body
+
+
+def _plan_requests(url, current, desired):
+    """Find the fewest requests that change current protection to desired.
+
+    Most protections can be changed through their own endpoint with one
+    request but any number of them can be changed at once by replacing the
+    whole protection, which is what is done when more than one, or one
+    without its own endpoint, changes.
+    """
+    existing = current or _UNPROTECTED
+    changes = {
+        name: (existing.get(name), value)
+        for name, value in desired.items()
+        if existing.get(name) != value
+    }
+    requests = []
+    replace = current is None
+    for name, (old, new) in changes.items():
+        if name == "required_signatures":
+            continue
+        endpoint = f"{url}/{name}"
+        if name == "enforce_admins":
+            requests.append(("post" if new else "delete", endpoint, None))
+        elif name in (
+            "required_status_checks",
+            "required_pull_request_reviews",
+        ):
+            if new is None:
+                requests.append(("delete", endpoint, None))
+            elif old is None:
+                replace = True
+            elif name == "required_status_checks":
+                requests.append(("patch", endpoint, _status_checks_body(new)))
+            else:
+                requests.append(("patch", endpoint, new))
+        elif name == "restrictions":
+            if new is None:
+                requests.append(("delete", endpoint, None))
+                continue
+            kinds = [
+                kind
+                for kind in ("users", "teams", "apps")
+                if old is None or old.get(kind) != new.get(kind)
+            ]
+            if old is None or len(kinds) > 1:
+                replace = True
+            else:
+                kind = kinds[0]
+                requests.append(
+                    ("put", f"{endpoint}/{kind}", {kind: new[kind]})
+                )
+        else:
+            replace = True
+
+    if replace or len(requests) > 1:
+        body = {
+            name: value
+            for name, value in desired.items()
+            if name != "required_signatures"
+        }
+        if body.get("required_status_checks"):
+            body["required_status_checks"] = _status_checks_body(
+                body["required_status_checks"]
+            )
+        requests = [("put", url, body)]
+    if "required_signatures" in changes:
+        method = "post" if desired["required_signatures"] else "delete"
+        requests.append((method, f"{url}/required_signatures", None))
+    return changes, requests
+
+
+class ProtectionAudit:
+    """The result of comparing a branch's protection with a policy.
+
+    .. versionadded:: 4.1.0
+
+    This object has the following attributes:
+
+    .. attribute:: repository
+
+        The repository the branch belongs to.
+
+    .. attribute:: branch
+
+        The name of the branch.
+
+    .. attribute:: current
+
+        The protection in effect, as returned by
+        :func:`~github3.repos.branch.effective_protection`, or None if the
+        branch is not protected.
+
+    .. attribute:: changes
+
+        A dictionary of the protections which differ from the policy, mapping
+        each name to a tuple of the current and desired values.
+
+    .. attribute:: requests
+
+        The requests which make the branch's protection match the policy, as
+        tuples of HTTP method, URL, and JSON body.
+
+    .. attribute:: applied
+
+        Whether the requests were made successfully.
+
+    .. attribute:: error
+
+        The :class:`~github3.exceptions.GitHubError` raised while reading or
+        changing the protection, if any.
+    """
+
+    __slots__ = (
+        "repository",
+        "branch",
+        "current",
+        "changes",
+        "requests",
+        "applied",
+        "error",
+    )
+
+    def __init__(self, repository, branch):
+        self.repository = repository
+        self.branch = branch
+        self.current = None
+        self.changes = {}
+        self.requests = []
+        self.applied = False
+        self.error = None
+
+    def __repr__(self):
+        return "<ProtectionAudit [{}@{}, {} changes]>".format(
+            self.repository.full_name, self.branch, len(self.changes)
+        )
+
+    @property
+    def compliant(self):
+        """Whether the branch's protection already matched the policy."""
+        return self.error is None and not self.changes
+
+
+def _fetch_protection(repository, url):
+    response = repository._get(url)
+    if response.status_code == 404:
+        try:
+            message = response.json().get("message")
+        except ValueError:
+            message = None
+        if message == "Branch not protected":
+            return None
+    return repository._json(response, 200)
+
+
+def _audit_branch(target, policy, apply):
+    repository, branch = target
+    audit = ProtectionAudit(repository, branch)
+    url = repository._build_url(
+        "branches", branch, "protection", base_url=repository._api
+    )
+    try:
+        audit.current = effective_protection(
+            _fetch_protection(repository, url)
+        )
+        desired = _desired_protection(audit.current, policy)
+        audit.changes, audit.requests = _plan_requests(
+            url, audit.current, desired
+        )
+        if apply:
+            for method, request_url, body in audit.requests:
+                response = repository._request(method, request_url, json=body)
+                if response.status_code >= 400:
+                    raise exceptions.error_for(response)
+            audit.applied = True
+    except exceptions.GitHubError as error:
+        audit.error = error
+    return audit
+
+
+def audit_protection(targets, policy, apply=False, max_workers=8):
+    """Compare, and optionally enforce, the protection of many branches.
+
+    The protection of each branch is fetched concurrently and compared with
+    ``policy``. With ``apply``, only the protections which differ are
+    changed, using the fewest requests: one to the endpoint of a single
+    protection, or one replacing the whole protection when more than one
+    differs, plus one for ``required_signatures``.
+
+    .. code-block:: python
+
+        policy = {
+            "enforce_admins": True,
+            "required_pull_request_reviews": {
+                "required_approving_review_count": 2,
+            },
+            "allow_force_pushes": False,
+        }
+        targets = [
+            (repository, repository.default_branch)
+            for repository in org.repositories()
+        ]
+        for audit in audit_protection(targets, policy, apply=True):
+            if audit.changes:
+                print(audit.repository, audit.changes)
+
+    .. versionadded:: 4.1.0
+
+    :param targets:
+        pairs of a :class:`~github3.repos.repo.Repository` and the name of
+        one of its branches
+    :param dict policy:
+        the protections to enforce, using the keys of the body of
+        :meth:`~github3.repos.branch.Branch.protect` plus
+        ``required_signatures``. Protections not named are left as they are.
+        Dictionaries other than ``restrictions`` are merged with the current
+        settings, so only the keys they name are enforced. Use ``None`` to
+        remove a protection.
+    :param bool apply:
+        (optional), change the protections which differ. Default: False
+    :param int max_workers:
+        (optional), the number of branches handled concurrently. Default: 8
+    :returns:
+        generator of audits in the order they complete
+    :rtype:
+        :class:`~github3.repos.branch.ProtectionAudit`
+    """
+    for _, audit in utils.imap_unordered(
+        lambda target: _audit_branch(target, policy, apply),
+        targets,
+        max_workers,
+    ):
+        yield audit
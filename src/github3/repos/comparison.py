@@ -1,5 +1,6 @@
 """This module contains the Comparison object."""
 
+from .. import diffs
 from .. import models
 from . import commit
 
@@ -99,6 +100,52 @@ class Comparison(models.GitHubCore):
         )
         return resp.content if self._boolean(resp, 200, 404) else b""
 
+    def diff_files(self, include_hunks=True):
+        """Iterate over the files changed in the diff for this comparison.
+
+        The diff is parsed as it is downloaded so only one file is held in
+        memory at a time.
+
+        .. versionadded:: 4.1.0
+
+        :param bool include_hunks:
+            (optional), whether to keep the hunks of each file. When False
+            only the line counts are computed. Default: True
+        :returns:
+            generator of changed files
+        :rtype:
+            :class:`~github3.diffs.FileDiff`
+        """
+        resp = self._get(
+            self._api,
+            headers={"Accept": "application/vnd.github.diff"},
+            stream=True,
+        )
+        if self._boolean(resp, 200, 404):
+            yield from diffs.parse_diff(diffs.iter_lines(resp), include_hunks)
+
+    def diff_summary(self):
+        """Count the files, additions, and deletions in this comparison's diff.
+
+        The diff is streamed and only counted, so this uses very little
+        memory regardless of the size of the diff.
+
+        .. versionadded:: 4.1.0
+
+        :returns:
+            the totals for the diff
+        :rtype:
+            :class:`~github3.diffs.DiffSummary`
+        """
+        resp = self._get(
+            self._api,
+            headers={"Accept": "application/vnd.github.diff"},
+            stream=True,
+        )
+        if self._boolean(resp, 200, 404):
+            return diffs.summarize_diff(diffs.iter_lines(resp))
+        return diffs.DiffSummary(0, 0, 0)
+
     def patch(self):
         """Retrieve the patch formatted diff for this commit.
 
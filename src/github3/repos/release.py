@@ -5,6 +5,7 @@ import json
 from uritemplate import URITemplate  # type: ignore
 
 from .. import models
+from .. import session
 from .. import users
 from .. import utils
 from ..decorators import requires_auth
@@ -145,6 +146,64 @@ class Release(models.GitHubCore):
             return True
         return False
 
+    def archive_members(self, paths=None):
+        """Iterate over the files in the tarball archive for this release.
+
+        The archive is decompressed as it is downloaded so it never needs to
+        be written to disk first.
+
+        .. versionadded:: 4.1.0
+
+        .. note::
+
+            The file object yielded for a member must be consumed before
+            advancing to the next member.
+
+        :param list paths:
+            (optional), repository paths (files or directories) to restrict
+            the members to. Default: all members
+        :returns:
+            generator of tuples of the member (named relative to the root of
+            the repository) and a file object for its content, ``None`` if
+            the member is not a regular file
+        :rtype:
+            tuple(:class:`tarfile.TarInfo`, file)
+        """
+        resp = self._get(
+            self._tarball_url(), allow_redirects=True, stream=True
+        )
+        if resp and self._boolean(resp, 200, 404):
+            yield from utils.iter_tarball_members(resp, paths)
+
+    def extract_archive(self, directory, paths=None):
+        """Extract the tarball archive for this release into directory.
+
+        The archive is decompressed and extracted as it is downloaded so it
+        never needs to be written to disk first.
+
+        .. versionadded:: 4.1.0
+
+        :param str directory:
+            (required), directory to extract the files into
+        :param list paths:
+            (optional), repository paths (files or directories) to restrict
+            the extraction to. Default: extract everything
+        :returns:
+            the paths, relative to ``directory``, that were extracted
+        :rtype:
+            list
+        """
+        resp = self._get(
+            self._tarball_url(), allow_redirects=True, stream=True
+        )
+        if resp and self._boolean(resp, 200, 404):
+            return utils.extract_tarball_response(resp, directory, paths)
+        return []
+
+    def _tarball_url(self):
+        repo_url = self._api[: self._api.rfind("/releases")]
+        return self._build_url("tarball", self.tag_name, base_url=repo_url)
+
     def asset(self, asset_id):
         """Retrieve the asset from this release with ``asset_id``.
 
@@ -394,10 +453,12 @@ class Asset(models.GitHubCore):
             # certain request headers
             headers.update({"Content-Type": None})
 
-            with self.session.no_auth():
-                resp = self._get(
-                    resp.headers["location"], stream=True, headers=headers
-                )
+            resp = self._get(
+                resp.headers["location"],
+                stream=True,
+                headers=headers,
+                auth=session.NoAuth(),
+            )
 
         if self._boolean(resp, 200, 404):
             return utils.stream_response_to_file(resp, path)
@@ -7,7 +7,9 @@ returned by GitHub.
 
 import base64
 import json as jsonlib
+import os
 import typing
+from concurrent import futures
 
 import uritemplate as urit  # type: ignore
 
@@ -112,6 +114,15 @@ class _Repository(models.GitHubCore):
     def __str__(self):
         return self.full_name
 
+    def _raw_blob(self, sha):
+        url = self._build_url("git", "blobs", sha, base_url=self._api)
+        resp = self._get(
+            url, headers={"Accept": "application/vnd.github.raw"}
+        )
+        if resp.status_code != 200:
+            raise exceptions.error_for(resp)
+        return resp.content
+
     def _create_pull(self, data):
         self._remove_none(data)
         json = None
@@ -180,6 +191,62 @@ class _Repository(models.GitHubCore):
             return True
         return False
 
+    def archive_members(self, ref="master", paths=None):
+        """Iterate over the files in the tarball archive for this repo at ref.
+
+        The archive is decompressed as it is downloaded so it never needs to
+        be written to disk first.
+
+        .. versionadded:: 4.1.0
+
+        .. note::
+
+            The file object yielded for a member must be consumed before
+            advancing to the next member.
+
+        :param str ref:
+            (optional)
+        :param list paths:
+            (optional), repository paths (files or directories) to restrict
+            the members to. Default: all members
+        :returns:
+            generator of tuples of the member (named relative to the root of
+            the repository) and a file object for its content, ``None`` if
+            the member is not a regular file
+        :rtype:
+            tuple(:class:`tarfile.TarInfo`, file)
+        """
+        url = self._build_url("tarball", ref, base_url=self._api)
+        resp = self._get(url, allow_redirects=True, stream=True)
+        if resp and self._boolean(resp, 200, 404):
+            yield from utils.iter_tarball_members(resp, paths)
+
+    def extract_archive(self, directory, ref="master", paths=None):
+        """Extract the tarball archive for this repo at ref into directory.
+
+        The archive is decompressed and extracted as it is downloaded so it
+        never needs to be written to disk first.
+
+        .. versionadded:: 4.1.0
+
+        :param str directory:
+            (required), directory to extract the files into
+        :param str ref:
+            (optional)
+        :param list paths:
+            (optional), repository paths (files or directories) to restrict
+            the extraction to. Default: extract everything
+        :returns:
+            the paths, relative to ``directory``, that were extracted
+        :rtype:
+            list
+        """
+        url = self._build_url("tarball", ref, base_url=self._api)
+        resp = self._get(url, allow_redirects=True, stream=True)
+        if resp and self._boolean(resp, 200, 404):
+            return utils.extract_tarball_response(resp, directory, paths)
+        return []
+
     def asset(self, id):
         """Return a single asset.
 
@@ -225,7 +292,7 @@ class _Repository(models.GitHubCore):
             :class:`~github3.git.Blob`
         """
         url = self._build_url("git", "blobs", sha, base_url=self._api)
-        json = self._json(self._get(url), 200)
+        json = self._immutable_json(url, sha)
         return self._instance_or_null(git.Blob, json)
 
     def branch(self, name):
@@ -400,7 +467,7 @@ class _Repository(models.GitHubCore):
             :class:`~github3.repos.commit.RepoCommit`
         """
         url = self._build_url("commits", sha, base_url=self._api)
-        json = self._json(self._get(url), 200)
+        json = self._immutable_json(url, sha)
         return self._instance_or_null(commit.RepoCommit, json)
 
     def commit_activity(self, number=-1, etag=None):
@@ -1529,6 +1596,66 @@ class _Repository(models.GitHubCore):
             (j.get("name"), contents.Contents(j, self)) for j in json
         )
 
+    def download_tree(self, ref, directory, paths=None, max_workers=8):
+        """Write the files of this repository at ``ref`` into ``directory``.
+
+        The tree is resolved once and the blobs are then downloaded
+        concurrently. Files already present in ``directory`` with the same
+        content, as determined by their git blob SHA, are not downloaded
+        again. Each file is written atomically. Symbolic links which point
+        outside ``directory`` are skipped.
+
+        .. versionadded:: 4.1.0
+
+        :param str ref:
+            (required), the commit, branch, tag, or tree to download
+        :param str directory:
+            (required), the directory to write the files into
+        :param list paths:
+            (optional), repository paths (files or directories) to restrict
+            the download to. Default: download everything
+        :param int max_workers:
+            (optional), the number of blobs to download concurrently.
+            Default: 8
+        :returns:
+            the paths, relative to ``directory``, that were written
+        :rtype:
+            list
+        """
+        root = os.path.realpath(directory)
+        wanted = []
+        for entry in self.walk_tree(ref):
+            if entry.type != "blob":
+                continue
+            if not utils.path_is_selected(entry.path, paths):
+                continue
+            # Only the directories are resolved: the file itself may be a
+            # symbolic link written by a previous download, which is
+            # replaced rather than followed
+            target = os.path.join(root, entry.path)
+            parent = os.path.realpath(os.path.dirname(target))
+            if parent != root and not parent.startswith(root + os.sep):
+                continue
+            is_link = entry.mode == "120000"
+            if _local_blob_sha(target, is_link) != entry.sha:
+                wanted.append((entry, target))
+
+        def download(item):
+            entry, target = item
+            content = self._raw_blob(entry.sha)
+            if entry.mode == "120000":
+                link_target = os.fsdecode(content)
+                if not utils.symlink_is_contained(entry.path, link_target):
+                    return None
+                _replace_with_symlink(link_target, target)
+            else:
+                mode = 0o755 if entry.mode == "100755" else 0o644
+                utils.write_file_atomically(target, content, mode)
+            return entry.path
+
+        with futures.ThreadPoolExecutor(max(1, max_workers)) as executor:
+            return sorted(p for p in executor.map(download, wanted) if p)
+
     @decorators.requires_auth
     def edit(
         self,
@@ -1742,7 +1869,7 @@ class _Repository(models.GitHubCore):
         json = {}
         if sha:
             url = self._build_url("git", "commits", sha, base_url=self._api)
-            json = self._json(self._get(url), 200)
+            json = self._immutable_json(url, sha)
         return self._instance_or_null(git.Commit, json)
 
     @decorators.requires_auth
@@ -1951,7 +2078,8 @@ class _Repository(models.GitHubCore):
         if not username:
             return False
         url = self._build_url("assignees", str(username), base_url=self._api)
-        return self._boolean(self._get(url), 204, 404)
+        with self.session.no_token_retries():
+            return self._boolean(self._get(url), 204, 404)
 
     @decorators.requires_auth
     def is_collaborator(self, username):
@@ -1971,7 +2099,8 @@ class _Repository(models.GitHubCore):
         url = self._build_url(
             "collaborators", str(username), base_url=self._api
         )
-        return self._boolean(self._get(url), 204, 404)
+        with self.session.no_token_retries():
+            return self._boolean(self._get(url), 204, 404)
 
     def issue(self, number):
         """Get the issue specified by ``number``.
@@ -2322,6 +2451,31 @@ class _Repository(models.GitHubCore):
         url = self._build_url("events", base_url=base)
         return self._iter(int(number), url, events.Event, etag)
 
+    @decorators.requires_auth
+    def notification_sync(
+        self, participating=False, last_modified=None, since=None
+    ):
+        """Create a sync of the unread notifications for this repository.
+
+        .. versionadded:: 4.1.0
+
+        :param bool participating:
+            (optional), only sync the notifications the user is participating
+            in directly. Default: False
+        :param str last_modified:
+            (optional), the ``last_modified`` of a previous sync to resume
+        :param str since:
+            (optional), the ``since`` of a previous sync to resume
+        :returns:
+            the sync, which has not fetched anything yet
+        :rtype:
+            :class:`~github3.notifications.NotificationSync`
+        """
+        url = self._build_url("notifications", base_url=self._api)
+        return notifications.NotificationSync(
+            url, self.session, participating, last_modified, since
+        )
+
     @decorators.requires_auth
     def notifications(
         self, all=False, participating=False, since=None, number=-1, etag=None
@@ -2764,7 +2918,7 @@ class _Repository(models.GitHubCore):
         json = None
         if sha:
             url = self._build_url("git", "tags", sha, base_url=self._api)
-            json = self._json(self._get(url), 200)
+            json = self._immutable_json(url, sha)
         return self._instance_or_null(git.Tag, json)
 
     def tags(self, number=-1, etag=None):
@@ -2830,9 +2984,37 @@ class _Repository(models.GitHubCore):
         if sha:
             url = self._build_url("git", "trees", sha, base_url=self._api)
             params = {"recursive": 1} if recursive else None
-            json = self._json(self._get(url, params=params), 200)
+            json = self._immutable_json(url, sha, params=params)
         return self._instance_or_null(git.Tree, json)
 
+    def walk_tree(self, sha, prune=None, max_workers=4):
+        """Iterate over every entry in a tree and its subtrees.
+
+        If GitHub truncates the recursive listing of the tree, the subtrees
+        are listed individually, ``max_workers`` at a time, so the result is
+        always complete.
+
+        .. versionadded:: 4.1.0
+
+        :param str sha:
+            (required), sha of the tree, or of a commit, branch, or tag
+            pointing at it
+        :param list prune:
+            (optional), paths to leave out of the listing along with
+            everything beneath them, e.g., ``["vendor"]``
+        :param int max_workers:
+            (optional), the number of subtrees to list concurrently if the
+            recursive listing was truncated. Default: 4
+        :returns:
+            generator of entries in no particular order
+        :rtype:
+            :class:`~github3.git.TreeEntry`
+        """
+        if not sha:
+            return iter([])
+        url = self._build_url("git", "trees", base_url=self._api)
+        return iter(git._TreeWalker(self, url, sha, prune, max_workers))
+
     @decorators.requires_auth
     def unignore(self):
         """Unignore notifications from this repository for the user.
@@ -3565,6 +3747,33 @@ class StarredRepository(models.GitHubCore):
         return f"<StarredRepository [{self.repository!r}]>"
 
 
+def _local_blob_sha(path, is_link=False):
+    """Compute the git blob SHA of the file or link at ``path``.
+
+    None is returned if ``path`` does not exist or is not of the kind
+    expected, so that it is replaced.
+    """
+    try:
+        if os.path.islink(path) != is_link:
+            return None
+        if is_link:
+            return utils.git_blob_sha(os.fsencode(os.readlink(path)))
+        with open(path, "rb") as fd:
+            return utils.git_blob_sha(fd.read())
+    except OSError:
+        return None
+
+
+def _replace_with_symlink(target, path):
+    """Atomically replace ``path`` with a symbolic link to ``target``."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".github3-link"
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    os.symlink(target, tmp_path)
+    os.replace(tmp_path, path)
+
+
 def repo_issue_params(
     milestone=None,
     state=None,
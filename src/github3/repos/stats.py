@@ -1,12 +1,31 @@
 """Repository and contributor stats logic."""
 
+import array
+import bisect
 import datetime
+import heapq
+import itertools
+import logging
+import operator
+import time
+from concurrent import futures
 
 import dateutil.tz
 
+from .. import exceptions
 from .. import models
 from .. import users
 
+LOG = logging.getLogger(__name__)
+
+#: The statistics :func:`fetch_statistics` can retrieve
+STATISTICS = (
+    "contributors",
+    "code_frequency",
+    "commit_activity",
+    "participation",
+)
+
 
 def alternate_week(week):
     """Map GitHub 'short' data to usable data.
@@ -56,6 +75,12 @@ class ContributorStats(models.GitHubCore):
             :mod:`github3` generates this data for a more humane interface
             to the data in :attr:`weeks`.
 
+        .. versionchanged:: 4.1.0
+
+            This is now generated the first time it is accessed. For
+            aggregating many contributors' statistics see
+            :class:`~github3.repos.stats.ContributorStatsTable`.
+
         A list of dictionaries that provide an easier to remember set of
         keys as well as a :class:`~datetime.datetime` object representing the
         start of the week. The dictionary looks vaguely like:
@@ -75,10 +100,320 @@ class ContributorStats(models.GitHubCore):
         self.author = users.ShortUser(stats_object["author"], self)
         self.total = stats_object["total"]
         self.weeks = stats_object["weeks"]
-        alt_weeks = self.weeks
-        if alt_weeks:
-            alt_weeks = [alternate_week(w) for w in self.weeks]
-        self.alternate_weeks = self.alt_weeks = alt_weeks
+        self._alternate_weeks = None
 
     def _repr(self):
         return f"<Contributor Statistics [{self.author}]>"
+
+    @property
+    def alternate_weeks(self):
+        # Built on first access since most callers only need ``weeks``
+        if self._alternate_weeks is None:
+            alt_weeks = self.weeks
+            if alt_weeks:
+                alt_weeks = [alternate_week(w) for w in self.weeks]
+            self._alternate_weeks = alt_weeks
+        return self._alternate_weeks
+
+    alt_weeks = alternate_weeks
+
+
+class ContributorStatsTable:
+    """A columnar view of the contributor statistics of one or more repos.
+
+    Rather than a dictionary per contributor per week, the statistics are
+    stored in flat :class:`array.array` columns with one row per author and
+    one column per week. The arrays support the buffer protocol, so they can
+    be handed to NumPy without copying:
+
+    .. code-block:: python
+
+        table = ContributorStatsTable(repository.contributor_statistics())
+        additions = numpy.frombuffer(table.additions, dtype=numpy.int64)
+        additions = additions.reshape(len(table.authors), len(table.weeks))
+
+    Statistics for the same author from several repositories, e.g., every
+    repository in an organization, are summed together.
+
+    .. versionadded:: 4.1.0
+
+    :param contributor_stats:
+        the statistics to tabulate
+    :type contributor_stats:
+        iterable of :class:`~github3.repos.stats.ContributorStats`
+
+    This object has the following attributes:
+
+    .. attribute:: authors
+
+        The logins of the contributors, in the order of the rows.
+
+    .. attribute:: weeks
+
+        An array of the start of each week, in seconds since the epoch,
+        sorted in ascending order.
+
+    .. attribute:: additions
+
+        An array of the lines added by each author in each week, stored row
+        by row, i.e., ``additions[row * len(weeks) + column]``.
+
+    .. attribute:: deletions
+
+        An array of the lines deleted, laid out like :attr:`additions`.
+
+    .. attribute:: commits
+
+        An array of the number of commits, laid out like :attr:`additions`.
+    """
+
+    def __init__(self, contributor_stats):
+        rows = {}
+        timestamps = set()
+        for contributor in contributor_stats:
+            login = contributor.author.login
+            rows.setdefault(login, []).append(contributor.weeks or [])
+            for week in contributor.weeks or []:
+                timestamps.add(int(week["w"]))
+
+        self.authors = list(rows)
+        self.weeks = array.array("q", sorted(timestamps))
+        column = {week: i for i, week in enumerate(self.weeks)}
+        width = len(self.weeks)
+        size = len(self.authors) * width
+        self.additions = array.array("q", bytes(8 * size))
+        self.deletions = array.array("q", bytes(8 * size))
+        self.commits = array.array("q", bytes(8 * size))
+        for row, login in enumerate(self.authors):
+            offset = row * width
+            for weeks in rows[login]:
+                for week in weeks:
+                    i = offset + column[int(week["w"])]
+                    self.additions[i] += week["a"]
+                    self.deletions[i] += week["d"]
+                    self.commits[i] += week["c"]
+
+    def __repr__(self):
+        return "<ContributorStatsTable [{} authors, {} weeks]>".format(
+            len(self.authors), len(self.weeks)
+        )
+
+    def _columns(self, since, until):
+        """Find the range of columns for weeks starting in [since, until)."""
+        lo = 0 if since is None else bisect.bisect_left(self.weeks, since)
+        hi = (
+            len(self.weeks)
+            if until is None
+            else bisect.bisect_left(self.weeks, until)
+        )
+        return lo, max(lo, hi)
+
+    def _row(self, values, row, lo, hi):
+        offset = row * len(self.weeks)
+        return values[offset + lo : offset + hi]
+
+    def totals_by_author(self, since=None, until=None):
+        """Total each author's additions, deletions, and commits.
+
+        :param int since:
+            (optional), only count weeks starting at or after this timestamp
+        :param int until:
+            (optional), only count weeks starting before this timestamp
+        :returns:
+            a mapping of login to a tuple of additions, deletions, and commits
+        :rtype:
+            dict
+        """
+        lo, hi = self._columns(since, until)
+        return {
+            login: (
+                sum(self._row(self.additions, row, lo, hi)),
+                sum(self._row(self.deletions, row, lo, hi)),
+                sum(self._row(self.commits, row, lo, hi)),
+            )
+            for row, login in enumerate(self.authors)
+        }
+
+    def totals_by_week(self, values):
+        """Sum one of the columns across every author for each week.
+
+        :param values:
+            one of :attr:`additions`, :attr:`deletions`, or :attr:`commits`
+        :type values:
+            :class:`array.array`
+        :returns:
+            the total for each week, aligned with :attr:`weeks`
+        :rtype:
+            :class:`array.array`
+        """
+        width = len(self.weeks)
+        totals = array.array("q", bytes(8 * width))
+        for offset in range(0, len(values), width or 1):
+            row = values[offset : offset + width]
+            totals = array.array("q", map(operator.add, totals, row))
+        return totals
+
+    def churn(self, since=None, until=None):
+        """Total the lines added and deleted by everyone.
+
+        :param int since:
+            (optional), only count weeks starting at or after this timestamp
+        :param int until:
+            (optional), only count weeks starting before this timestamp
+        :returns:
+            the number of lines added plus the number of lines deleted
+        :rtype:
+            int
+        """
+        lo, hi = self._columns(since, until)
+        width = len(self.weeks)
+        if lo == 0 and hi == width:
+            return sum(self.additions) + sum(self.deletions)
+        return sum(
+            sum(self._row(self.additions, row, lo, hi))
+            + sum(self._row(self.deletions, row, lo, hi))
+            for row in range(len(self.authors))
+        )
+
+
+def _request_statistic(repository, statistic):
+    """Request a statistic, returning whether it was ready and its value."""
+    url = repository._build_url("stats", statistic, base_url=repository._api)
+    resp = repository._get(url)
+    if resp is not None and resp.status_code == 202:
+        return False, None
+    if resp is not None and resp.status_code == 204:
+        # Repositories without commits have no statistics
+        return True, {} if statistic == "participation" else []
+    json = repository._json(resp, 200)
+    if statistic == "participation":
+        json = json or {}
+        json.pop("ETag", None)
+        json.pop("Last-Modified", None)
+        return True, json
+    json = json or []
+    if statistic == "contributors":
+        return True, [ContributorStats(c, repository) for c in json]
+    return True, json
+
+
+def fetch_statistics(
+    repositories,
+    statistic="contributors",
+    max_workers=8,
+    initial_delay=1.0,
+    max_delay=60.0,
+    timeout=600.0,
+    errors=None,
+):
+    """Retrieve a statistic for many repositories, waiting for GitHub.
+
+    GitHub computes statistics in the background and answers with a 202
+    until they are ready. This requests the statistic for every repository
+    up front so GitHub can compute them all at once, then polls each pending
+    repository with exponential backoff, yielding results as they become
+    available.
+
+    .. versionadded:: 4.1.0
+
+    .. code-block:: python
+
+        repos = gh.organization("github3py").repositories()
+        for repo, contributors in fetch_statistics(repos):
+            print(repo, len(contributors))
+
+    :param repositories:
+        the repositories to retrieve the statistic for
+    :type repositories:
+        iterable of :class:`~github3.repos.repo.ShortRepository`
+    :param str statistic:
+        (optional), one of ``"contributors"``, ``"code_frequency"``,
+        ``"commit_activity"``, or ``"participation"``.
+        Default: ``"contributors"``
+    :param int max_workers:
+        (optional), the number of requests to make concurrently. Default: 8
+    :param float initial_delay:
+        (optional), seconds to wait before polling a pending repository for
+        the first time. Default: 1
+    :param float max_delay:
+        (optional), the longest to wait between polls of a repository.
+        Default: 60
+    :param float timeout:
+        (optional), seconds after which to stop polling. Default: 600
+    :param dict errors:
+        (optional), a dictionary in which the exception raised for each
+        repository whose statistic could not be requested is stored, keyed
+        by the repository. Those repositories are not yielded and the
+        others are still retrieved. Default: the exceptions are only logged
+    :returns:
+        generator of tuples of the repository and its statistic, in the same
+        form as returned by the corresponding
+        :class:`~github3.repos.repo.Repository` method, or ``None`` if it
+        was still not ready when ``timeout`` elapsed
+    :rtype:
+        tuple
+    :raises:
+        ValueError if statistic is not a valid choice
+    """
+    if statistic not in STATISTICS:
+        raise ValueError(
+            "statistic must be one of {}".format(", ".join(STATISTICS))
+        )
+
+    deadline = time.monotonic() + timeout
+    order = itertools.count()
+    waiting = []
+    pending = {}
+    with futures.ThreadPoolExecutor(max(1, max_workers)) as executor:
+
+        def submit(repository, delay):
+            future = executor.submit(
+                _request_statistic, repository, statistic
+            )
+            pending[future] = (repository, delay)
+
+        for repository in repositories:
+            submit(repository, initial_delay)
+
+        while pending or waiting:
+            now = time.monotonic()
+            while waiting and waiting[0][0] <= now:
+                _, _, repository, delay = heapq.heappop(waiting)
+                submit(repository, delay)
+
+            wait_for = max(0, waiting[0][0] - now) if waiting else None
+            if not pending:
+                time.sleep(wait_for)
+                continue
+
+            done, _ = futures.wait(
+                pending, timeout=wait_for, return_when=futures.FIRST_COMPLETED
+            )
+            for future in done:
+                repository, delay = pending.pop(future)
+                try:
+                    ready, result = future.result()
+                except exceptions.GitHubException as error:
+                    LOG.warning(
+                        "Failed to retrieve the %s of %s: %s",
+                        statistic,
+                        repository,
+                        error,
+                    )
+                    if errors is not None:
+                        errors[repository] = error
+                    continue
+                if ready:
+                    yield repository, result
+                elif time.monotonic() + delay > deadline:
+                    yield repository, None
+                else:
+                    heapq.heappush(
+                        waiting,
+                        (
+                            time.monotonic() + delay,
+                            next(order),
+                            repository,
+                            min(delay * 2, max_delay),
+                        ),
+                    )
@@ -1,7 +1,13 @@
 """This module contains the Status object for GitHub's commit status API."""
 
+import collections
+import typing as t
+
+from .. import checks
+from .. import exceptions
 from .. import models
 from .. import users
+from .. import utils
 from ..models import GitHubCore
 
 
@@ -152,3 +158,176 @@ class CombinedStatus(GitHubCore):
     def _repr(self):
         f = "<CombinedStatus [{s.state}:{s.total_count} sub-statuses]>"
         return f.format(s=self)
+
+
+#: The check run conclusions which fail a commit
+FAILED_CONCLUSIONS = frozenset(
+    [
+        "action_required",
+        "cancelled",
+        "failure",
+        "startup_failure",
+        "timed_out",
+    ]
+)
+
+#: The state of a commit as returned by :meth:`StatusPoller.poll`
+CommitSummary = collections.namedtuple(
+    "CommitSummary", ["repository", "sha", "state", "statuses", "check_runs"]
+)
+
+
+def _summarize(repository, sha, combined, check_runs):
+    statuses = {s["context"]: s["state"] for s in combined["statuses"]}
+    runs = {r["name"]: r["conclusion"] or r["status"] for r in check_runs}
+    states = set(statuses.values())
+    run_states = {
+        (
+            "failure"
+            if r["conclusion"] in FAILED_CONCLUSIONS
+            else "success" if r["status"] == "completed" else "pending"
+        )
+        for r in check_runs
+    }
+    if "failure" in run_states or states & {"error", "failure"}:
+        state = "failure"
+    elif (
+        "pending" in run_states
+        or "pending" in states
+        or not (statuses or runs)
+    ):
+        state = "pending"
+    else:
+        state = "success"
+    return CommitSummary(repository.full_name, sha, state, statuses, runs)
+
+
+class StatusPoller:
+    """Summarize the statuses and check runs of many commits at once.
+
+    The combined status and the check runs of each commit are requested
+    concurrently. Every response's ``ETag`` is kept, so when the same
+    commits are polled again only the commits whose statuses or check runs
+    changed count against the rate limit.
+
+    .. code-block:: python
+
+        poller = StatusPoller()
+        while queue:
+            summaries = poller.poll(
+                (repository, pull.head.sha) for pull in queue
+            )
+            for pull in queue:
+                summary = summaries[(repository.full_name, pull.head.sha)]
+                if summary.state == "success":
+                    ...
+
+    .. versionadded:: 4.1.0
+
+    :param int max_workers:
+        (optional), the number of commits to request concurrently.
+        Default: 8
+    """
+
+    def __init__(self, max_workers: int = 8) -> None:
+        self.max_workers = max_workers
+        #: Exceptions raised requesting commits in the last poll, keyed
+        #: like the summaries
+        self.errors: t.Dict[t.Tuple[str, str], Exception] = {}
+        self._cache: t.Dict[str, t.Tuple[str, t.Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"<StatusPoller [{len(self._cache)} responses]>"
+
+    def poll(self, targets):
+        """Summarize the state of each commit.
+
+        Each commit is requested once, however many times it appears in
+        ``targets``. The cached responses of commits not in ``targets`` are
+        discarded. Commits which could not be requested are left out and
+        the exceptions recorded in :attr:`errors`.
+
+        :param targets:
+            pairs of a repository and the SHA of a commit in it
+        :type targets:
+            iterable of tuples of
+            :class:`~github3.repos.repo.ShortRepository` and str
+        :returns:
+            the summary of each commit keyed by the full name of its
+            repository and its SHA
+        :rtype:
+            dict of :class:`~github3.repos.status.CommitSummary`
+        """
+        commits = {}
+        for repository, sha in targets:
+            commits.setdefault((repository.full_name, sha), (repository, sha))
+
+        summaries, self.errors = {}, {}
+        for (repository, sha), summary in utils.imap_unordered(
+            self._summarize_commit, commits.values(), self.max_workers
+        ):
+            if isinstance(summary, Exception):
+                self.errors[(repository.full_name, sha)] = summary
+            else:
+                summaries[(repository.full_name, sha)] = summary
+
+        urls = set()
+        for repository, sha in commits.values():
+            urls.add(self._status_url(repository, sha))
+            urls.add(self._check_runs_url(repository, sha))
+        for url in [url for url in self._cache if url not in urls]:
+            del self._cache[url]
+        return summaries
+
+    def _summarize_commit(self, target):
+        repository, sha = target
+        try:
+            return self._summarize_fetched(repository, sha)
+        except exceptions.GitHubException as error:
+            return error
+
+    def _summarize_fetched(self, repository, sha):
+        combined = self._fetch(repository, self._status_url(repository, sha))
+        check_runs = self._fetch(
+            repository,
+            self._check_runs_url(repository, sha),
+            checks.CheckRun.CUSTOM_HEADERS,
+        )
+        return _summarize(repository, sha, combined, check_runs)
+
+    @staticmethod
+    def _status_url(repository, sha):
+        return repository._build_url(
+            "commits", sha, "status", base_url=repository._api
+        )
+
+    @staticmethod
+    def _check_runs_url(repository, sha):
+        return repository._build_url(
+            "commits", sha, "check-runs", base_url=repository._api
+        )
+
+    def _fetch(self, repository, url, headers=None):
+        headers = headers or {}
+        cached = self._cache.get(url)
+        conditional = dict(headers)
+        if cached is not None:
+            conditional["If-None-Match"] = cached[0]
+        response = repository._get(
+            url, params={"per_page": 100}, headers=conditional
+        )
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+        json = repository._json(response, 200)
+        etag = response.headers.get("ETag")
+        key = "check_runs" if "check_runs" in json else "statuses"
+        while "next" in response.links:
+            response = repository._get(
+                response.links["next"]["url"], headers=headers
+            )
+            json[key].extend(repository._json(response, 200)[key])
+        if key == "check_runs":
+            json = json["check_runs"]
+        if etag:
+            self._cache[url] = (etag, json)
+        return json
@@ -1,6 +1,10 @@
 """Repository traffic stats logic."""
 
+import array
+
+from .. import exceptions
 from .. import models
+from .. import utils
 
 
 class ViewsStats(models.GitHubCore):
@@ -83,3 +87,163 @@ class ClonesStats(models.GitHubCore):
         return (
             "<Clones Statistics " "[{s.count}, {s.uniques} unique]>"
         ).format(s=self)
+
+
+class TrafficTable:
+    """Views or clones of many repositories aligned on a common timeline.
+
+    The counts are stored in flat :class:`array.array` columns with one row
+    per repository and one column per day (or week), so they can be handed to
+    NumPy without copying. Days on which a repository had no traffic are
+    zero.
+
+    Use :meth:`~github3.orgs.Organization.traffic` or
+    :func:`~github3.repos.traffic.fetch_traffic` to build one.
+
+    .. versionadded:: 4.1.0
+
+    This object has the following attributes:
+
+    .. attribute:: repositories
+
+        The full names of the repositories, in the order of the rows.
+
+    .. attribute:: timestamps
+
+        An array of the start of each day or week, in seconds since the
+        epoch, sorted in ascending order.
+
+    .. attribute:: counts
+
+        An array of the number of views or clones of each repository for
+        each timestamp, stored row by row, i.e.,
+        ``counts[row * len(timestamps) + column]``.
+
+    .. attribute:: uniques
+
+        An array of the unique visitors or cloners, laid out like
+        :attr:`counts`.
+
+    .. attribute:: total_counts
+
+        An array of the total reported by GitHub for each repository.
+
+    .. attribute:: total_uniques
+
+        An array of the total unique visitors or cloners reported by GitHub
+        for each repository. Unlike the daily values these cannot be summed.
+
+    .. attribute:: failed
+
+        The full names of the repositories whose traffic could not be
+        retrieved, e.g., because the user lacks push access to them.
+    """
+
+    def __init__(self, stats, failed=()):
+        stats = sorted(stats, key=lambda item: str(item[0]))
+        self.repositories = [str(repository) for repository, _ in stats]
+        self.failed = sorted(str(repository) for repository in failed)
+        timestamps = set()
+        for _, stat in stats:
+            for point in _points(stat):
+                timestamps.add(int(point["timestamp"].timestamp()))
+        self.timestamps = array.array("q", sorted(timestamps))
+        column = {timestamp: i for i, timestamp in enumerate(self.timestamps)}
+        width = len(self.timestamps)
+        size = len(self.repositories) * width
+        self.counts = array.array("q", bytes(8 * size))
+        self.uniques = array.array("q", bytes(8 * size))
+        self.total_counts = array.array("q", (s.count for _, s in stats))
+        self.total_uniques = array.array("q", (s.uniques for _, s in stats))
+        for row, (_, stat) in enumerate(stats):
+            for point in _points(stat):
+                timestamp = int(point["timestamp"].timestamp())
+                i = row * width + column[timestamp]
+                self.counts[i] = point["count"]
+                self.uniques[i] = point["uniques"]
+
+    def __repr__(self):
+        return "<TrafficTable [{} repositories, {} timestamps]>".format(
+            len(self.repositories), len(self.timestamps)
+        )
+
+    def row(self, repository):
+        """Retrieve the counts and uniques of a single repository.
+
+        :param str repository:
+            the full name of the repository
+        :returns:
+            the counts and uniques for each timestamp
+        :rtype:
+            tuple(:class:`array.array`, :class:`array.array`)
+        """
+        width = len(self.timestamps)
+        offset = self.repositories.index(str(repository)) * width
+        return (
+            self.counts[offset : offset + width],
+            self.uniques[offset : offset + width],
+        )
+
+    def totals_by_timestamp(self):
+        """Sum the counts of every repository for each timestamp.
+
+        :returns:
+            the total for each timestamp, aligned with :attr:`timestamps`
+        :rtype:
+            :class:`array.array`
+        """
+        width = len(self.timestamps)
+        totals = [0] * width
+        for offset in range(0, len(self.counts), width or 1):
+            row = self.counts[offset : offset + width]
+            totals = [a + b for a, b in zip(totals, row)]
+        return array.array("q", totals)
+
+
+def _points(stat):
+    return getattr(stat, "views", None) or getattr(stat, "clones", None) or []
+
+
+def fetch_traffic(repositories, kind="views", per="day", max_workers=8):
+    """Retrieve the views or clones of many repositories concurrently.
+
+    .. versionadded:: 4.1.0
+
+    :param repositories:
+        the repositories to retrieve the traffic of
+    :type repositories:
+        iterable of :class:`~github3.repos.repo.ShortRepository`
+    :param str kind:
+        (optional), ('views', 'clones'). Default: 'views'
+    :param str per:
+        (optional), ('day', 'week'). Default: 'day'
+    :param int max_workers:
+        (optional), the number of repositories to request concurrently.
+        Default: 8
+    :returns:
+        the traffic aligned by timestamp
+    :rtype:
+        :class:`~github3.repos.traffic.TrafficTable`
+    :raises:
+        ValueError if kind or per is not a valid choice
+    """
+    if kind not in ("views", "clones"):
+        raise ValueError("kind must be 'views' or 'clones'")
+    if per not in ("day", "week"):
+        raise ValueError("per must be 'day' or 'week'")
+
+    def fetch(repository):
+        try:
+            return getattr(repository, kind)(per=per)
+        except (exceptions.ForbiddenError, exceptions.NotFoundError):
+            return None
+
+    stats, failed = [], []
+    for repository, stat in utils.imap_unordered(
+        fetch, repositories, max_workers
+    ):
+        if stat is None:
+            failed.append(repository)
+        else:
+            stats.append((repository, stat))
+    return TrafficTable(stats, failed)
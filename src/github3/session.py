@@ -1,7 +1,12 @@
 """Module containing session and auth logic."""
 
+import collections
 import collections.abc as abc_collections
+import copy
 import datetime
+import functools
+import threading
+import time
 from contextlib import contextmanager
 from logging import getLogger
 
@@ -10,6 +15,7 @@ import requests
 
 from . import __version__
 from . import exceptions as exc
+from . import metrics
 
 __url_cache__ = {}
 __logs__ = getLogger(__package__)
@@ -63,6 +69,93 @@ class TokenAuth(requests.auth.AuthBase):
         return request
 
 
+class NoAuth(requests.auth.AuthBase):
+    """Send a request without any authentication."""
+
+    def __repr__(self):
+        """Return a nice view of the lack of authentication."""
+        return "no auth"
+
+    def __call__(self, request):
+        """Remove the authorization header."""
+        request.headers.pop("Authorization", None)
+        return request
+
+
+class Transport:
+    """Connection pools which many sessions can share.
+
+    Each :class:`GitHubSession` otherwise opens its own connections, so a
+    process acting as many users or installations makes a TLS handshake
+    per client. Sessions created with the same transport reuse the same
+    kept-alive connections while keeping their own authentication,
+    headers, and base URL.
+
+    .. code-block:: python
+
+        transport = session.Transport(pool_maxsize=32)
+        clients = {
+            tenant: github.GitHub(
+                token=token,
+                session=session.GitHubSession(transport=transport),
+            )
+            for tenant, token in tokens.items()
+        }
+
+    .. versionadded:: 4.1.0
+
+    :param int pool_connections:
+        (optional), the number of hosts whose connections are kept.
+        Default: 10
+    :param int pool_maxsize:
+        (optional), the number of connections kept open to each host.
+        Default: 10
+    :param bool pool_block:
+        (optional), whether a request waits for a connection to a host with
+        ``pool_maxsize`` connections in use instead of opening another one
+        which is discarded afterwards. Default: False
+    :param int max_retries:
+        (optional), the number of times a failed connection is retried.
+        Default: 0
+    """
+
+    def __init__(
+        self,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        max_retries=0,
+    ):
+        """Create the adapter managing the connection pools."""
+        self.adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            pool_block=pool_block,
+        )
+
+    def __repr__(self):
+        """Return a nice view of the transport."""
+        return "<Transport [{} connections per host]>".format(
+            self.adapter._pool_maxsize
+        )
+
+    def mount(self, session):
+        """Send the requests of ``session`` through this transport.
+
+        :param session:
+            the session to use the connection pools
+        :type session:
+            :class:`requests.Session`
+        """
+        for prefix in ("https://", "http://"):
+            session.mount(prefix, self.adapter)
+
+    def close(self):
+        """Close every connection of the transport."""
+        self.adapter.close()
+
+
 class GitHubSession(requests.Session):
     """Our slightly specialized Session object.
 
@@ -85,9 +178,40 @@ class GitHubSession(requests.Session):
        the number of seconds to wait for a response from GitHub
     :type default_read_timeout:
        float
+    :param pool_maxsize:
+       (optional), the number of connections to GitHub kept open for reuse.
+       Default: 10, as in Requests
+    :type pool_maxsize:
+       int
+    :param transport:
+       (optional), connection pools shared with other sessions, instead of
+       ones of its own. Closing the session leaves them open.
+    :type transport:
+       :class:`~github3.session.Transport`
+
+    A session may be used by several threads at once, e.g., by passing
+    objects from one :class:`~github3.github.GitHub` instance to a thread
+    pool. Requests are counted atomically, and :meth:`no_auth` and
+    :meth:`temporary_basic_auth` only affect requests from the thread
+    using them. Give the session at least one connection per thread so
+    threads do not wait for each other's connections, or discard them:
+
+    .. code-block:: python
+
+       gh = github.GitHub(session=session.GitHubSession(pool_maxsize=32))
+
+    Changing the authentication, headers, or attributes of a session while
+    other threads make requests with it is not safe.
+
+    .. versionchanged:: 4.1.0
+
+       Added ``pool_maxsize`` and ``transport``, and made the session safe
+       to share between threads.
     """
 
     auth = None
+    # Whether closing the session closes its connection pools
+    _owns_adapters = True
     __attrs__ = requests.Session.__attrs__ + [
         "base_url",
         "two_factor_auth_cb",
@@ -96,9 +220,20 @@ class GitHubSession(requests.Session):
         "request_counter",
     ]
 
-    def __init__(self, default_connect_timeout=4, default_read_timeout=10):
+    def __init__(
+        self,
+        default_connect_timeout=4,
+        default_read_timeout=10,
+        pool_maxsize=None,
+        transport=None,
+    ):
         """Slightly modify how we initialize our session."""
         super().__init__()
+        if transport is not None:
+            transport.mount(self)
+            self._owns_adapters = False
+        elif pool_maxsize is not None:
+            Transport(pool_maxsize=pool_maxsize).mount(self)
         self.default_connect_timeout = default_connect_timeout
         self.default_read_timeout = default_read_timeout
         self.headers.update(
@@ -116,6 +251,62 @@ class GitHubSession(requests.Session):
         self.base_url = "https://api.github.com"
         self.two_factor_auth_cb = None
         self.request_counter = 0
+        #: Optional :class:`~github3.cache.ObjectCache` for git objects
+        self.object_cache = None
+        #: Callables reporting each :class:`~github3.metrics.RequestEvent`
+        self.request_observers = []
+        #: Callables starting a span for each request
+        self.request_tracers = []
+        self._init_thread_state()
+
+    def __setstate__(self, state):
+        """Restore the session and recreate its locks."""
+        super().__setstate__(state)
+        self.request_observers = []
+        self.request_tracers = []
+        self._init_thread_state()
+
+    def _init_thread_state(self):
+        self._counter_lock = threading.Lock()
+        # Authentication overridden by no_auth or temporary_basic_auth for
+        # the current thread only
+        self._local = threading.local()
+
+    def clone(self):
+        """Create a session sharing this one's connections and settings.
+
+        The new session has the same base URL, headers, timeouts, and TLS
+        settings but no authentication, e.g., to log in as another user
+        without opening new connections. Closing it leaves the
+        connections open.
+
+        .. versionadded:: 4.1.0
+
+        :returns:
+            a new session using this session's connection pools
+        :rtype:
+            :class:`~github3.session.GitHubSession`
+        """
+        clone = type(self)(
+            self.default_connect_timeout, self.default_read_timeout
+        )
+        clone.adapters = self.adapters.copy()
+        clone._owns_adapters = False
+        clone.headers.update(self.headers)
+        clone.headers.pop("Authorization", None)
+        clone.base_url = self.base_url
+        clone.verify = self.verify
+        clone.cert = self.cert
+        clone.proxies = self.proxies.copy()
+        clone.trust_env = self.trust_env
+        clone.request_observers = list(self.request_observers)
+        clone.request_tracers = list(self.request_tracers)
+        return clone
+
+    def close(self):
+        """Close the connections unless they are shared."""
+        if self._owns_adapters:
+            super().close()
 
     @property
     def timeout(self):
@@ -147,7 +338,8 @@ class GitHubSession(requests.Session):
 
     def handle_two_factor_auth(self, args, kwargs):
         """Handler for when the user has 2FA turned on."""
-        headers = kwargs.pop("headers", {})
+        # Copy the headers, which may be shared with other threads
+        headers = dict(kwargs.pop("headers", None) or {})
         headers.update({"X-GitHub-OTP": str(self.two_factor_auth_cb())})
         kwargs.update(headers=headers)
         return super().request(*args, **kwargs)
@@ -166,11 +358,69 @@ class GitHubSession(requests.Session):
         """
         raise NotImplementedError("These features are not implemented yet")
 
-    def request(self, *args, **kwargs):
+    def add_request_observer(self, observer):
+        """Report the outcome of every request to ``observer``.
+
+        .. versionadded:: 4.1.0
+
+        :param observer:
+            a callable accepting a :class:`~github3.metrics.RequestEvent`,
+            e.g., a :class:`~github3.metrics.RequestMetrics`. It is called
+            from the thread which made the request.
+        """
+        self.request_observers.append(observer)
+
+    def add_request_tracer(self, tracer):
+        """Start a span with ``tracer`` for every request.
+
+        .. versionadded:: 4.1.0
+
+        :param tracer:
+            a callable accepting the method, the URL template, and the
+            headers of a request, which it may add to, e.g., to propagate
+            a trace context. It may return a callable which is called with
+            the :class:`~github3.metrics.RequestEvent` when the request
+            finishes, e.g., to end the span. Exceptions raised by either are
+            logged rather than failing the request.
+        """
+        self.request_tracers.append(tracer)
+
+    def request(self, method, url, *args, **kwargs):
         """Make a request, count it, and handle 2FA if necessary."""
         kwargs.setdefault("timeout", self.timeout)
+        if not (self.request_observers or self.request_tracers):
+            return self._count_request(method, url, *args, **kwargs)
+
+        template = metrics.url_template(url, self.base_url)
+        finishers = []
+        if self.request_tracers:
+            headers = kwargs["headers"] = dict(kwargs.get("headers") or {})
+            for tracer in self.request_tracers:
+                try:
+                    finishers.append(tracer(method, template, headers))
+                except Exception:
+                    __logs__.exception("Failed to trace a request")
+        start = time.perf_counter()
+        try:
+            response = self._count_request(method, url, *args, **kwargs)
+        except Exception as error:
+            duration = time.perf_counter() - start
+            event = metrics.RequestEvent(
+                method, template, duration, error=error
+            )
+            self._report(event, finishers)
+            raise
+        duration = time.perf_counter() - start
+        self._report(
+            metrics.RequestEvent(method, template, duration, response),
+            finishers,
+        )
+        return response
+
+    def _count_request(self, *args, **kwargs):
         response = super().request(*args, **kwargs)
-        self.request_counter += 1
+        with self._counter_lock:
+            self.request_counter += 1
         if requires_2fa(response) and self.two_factor_auth_cb:
             # No need to flatten and re-collect the args in
             # handle_two_factor_auth
@@ -179,6 +429,26 @@ class GitHubSession(requests.Session):
             response = new_response
         return response
 
+    def _report(self, event, finishers):
+        for callback in finishers + self.request_observers:
+            if callback is None:
+                continue
+            try:
+                callback(event)
+            except Exception:
+                __logs__.exception("Failed to report a request")
+
+    def prepare_request(self, request):
+        """Prepare a request using this thread's authentication override."""
+        override = getattr(self._local, "auth", None)
+        if override is not None and request.auth is None:
+            request = copy.copy(request)
+            request.auth = override
+        prepared = super().prepare_request(request)
+        if not getattr(self._local, "token_retries", True):
+            prepared.retry_with_other_tokens = False
+        return prepared
+
     def retrieve_client_credentials(self):
         """Return the client credentials.
 
@@ -225,30 +495,82 @@ class GitHubSession(requests.Session):
             json["token"], json["expires_at"]
         )
 
+    def token_pool_auth(self, tokens):
+        """Spread requests over several tokens.
+
+        :param tokens:
+            the tokens as strings or other authentication handlers
+        """
+        if not tokens:
+            return
+
+        self.auth = TokenPoolAuth(tokens)
+
+    def renewing_app_installation_token_auth(
+        self,
+        private_key_pem,
+        app_id,
+        installation_id,
+        json=None,
+        expire_in=30,
+    ):
+        """Use an App's installation tokens, renewing them as they expire."""
+        self.auth = RenewingAppInstallationTokenAuth(
+            self, private_key_pem, app_id, installation_id, json, expire_in
+        )
+
+    @contextmanager
+    def _override_auth(self, auth):
+        previous = getattr(self._local, "auth", None)
+        self._local.auth = auth
+        try:
+            yield
+        finally:
+            self._local.auth = previous
+
     @contextmanager
     def temporary_basic_auth(self, *auth):
-        """Allow us to temporarily swap out basic auth credentials."""
-        old_basic_auth = self.auth
-        old_token_auth = self.headers.get("Authorization")
+        """Temporarily use basic auth credentials for this thread's requests.
+
+        .. versionchanged:: 4.1.0
+
+            Only requests made by the current thread use the credentials.
+        """
+        username, password = auth
+        if not (username and password):
+            yield
+            return
 
-        self.basic_auth(*auth)
-        yield
+        with self._override_auth(BasicAuth(username, password)):
+            yield
 
-        self.auth = old_basic_auth
-        if old_token_auth:
-            self.headers["Authorization"] = old_token_auth
+    @contextmanager
+    def no_token_retries(self):
+        """Send this thread's requests with a single token temporarily.
+
+        Requests refused with the token chosen by a :class:`TokenPoolAuth`
+        are not sent again with its other tokens, e.g., to check whether
+        a user starred a repository, which GitHub answers with a 404.
+
+        .. versionadded:: 4.1.0
+        """
+        previous = getattr(self._local, "token_retries", True)
+        self._local.token_retries = False
+        try:
+            yield
+        finally:
+            self._local.token_retries = previous
 
     @contextmanager
     def no_auth(self):
-        """Unset authentication temporarily as a context manager."""
-        old_basic_auth, self.auth = self.auth, None
-        old_token_auth = self.headers.pop("Authorization", None)
+        """Send this thread's requests without authentication temporarily.
 
-        yield
+        .. versionchanged:: 4.1.0
 
-        self.auth = old_basic_auth
-        if old_token_auth:
-            self.headers["Authorization"] = old_token_auth
+            Only requests made by the current thread are unauthenticated.
+        """
+        with self._override_auth(NoAuth()):
+            yield
 
 
 def _utcnow():
@@ -287,6 +609,125 @@ class AppInstallationTokenAuth(TokenAuth):
         return super().__call__(request)
 
 
+class RenewingAppInstallationTokenAuth(AppInstallationTokenAuth):
+    """Use an app installation token and renew it before it expires.
+
+    A new token is requested with the app's private key when the current
+    one expires within ``renew_before`` seconds. Only one thread requests
+    it; the others wait for and then use the new token. A request refused
+    with a 401 is sent once more with a new token.
+    """
+
+    def __init__(
+        self,
+        session,
+        private_key_pem,
+        app_id,
+        installation_id,
+        json=None,
+        expire_in=30,
+        renew_before=300,
+        jwt_provider=None,
+    ):
+        """Set-up our authentication handler."""
+        self.session = session
+        self.private_key_pem = private_key_pem
+        self.app_id = app_id
+        self.installation_id = installation_id
+        self.expire_in = expire_in
+        self.renew_before = datetime.timedelta(seconds=renew_before)
+        self.token = self.expires_at_str = self.expires_at = None
+        self._lock = threading.Lock()
+        self._jwt = jwt_provider
+        if json:
+            self._update(json)
+
+    def __repr__(self):
+        """Return a nice view of the token in use."""
+        return "renewing app installation token for installation {}".format(
+            self.installation_id
+        )
+
+    def _update(self, json):
+        self.token = json["token"]
+        self.expires_at_str = json["expires_at"]
+        self.expires_at = dateutil.parser.parse(json["expires_at"])
+
+    @property
+    def expiring(self):
+        """Indicate whether our token should be renewed."""
+        if self.expires_at is None:
+            return True
+        return _utcnow() + self.renew_before > self.expires_at
+
+    def renew(self, stale_token=None):
+        """Request a new installation token.
+
+        Threads calling this while a token is being requested wait for it
+        instead of requesting another.
+
+        :param str stale_token:
+            (optional), the token to replace. If the current token differs,
+            it was already renewed and no request is made. Default: renew an
+            expiring token
+        """
+        # Import here, because a toplevel import causes an import loop
+        from . import apps
+
+        with self._lock:
+            if stale_token is None and not self.expiring:
+                return
+            if stale_token is not None and stale_token != self.token:
+                return
+            if self._jwt is None:
+                self._jwt = apps.JWTProvider(
+                    self.private_key_pem, self.app_id, self.expire_in
+                )
+            jwt_token = self._jwt.token()
+            url = self.session.build_url(
+                "app",
+                "installations",
+                str(self.installation_id),
+                "access_tokens",
+            )
+            response = self.session.post(
+                url,
+                auth=AppBearerTokenAuth(jwt_token, self.expire_in),
+                headers=apps.APP_PREVIEW_HEADERS,
+            )
+            if response.status_code != 201:
+                raise exc.error_for(response)
+            self._update(response.json())
+            __logs__.info(
+                "Renewed the token of installation %s expiring at %s",
+                self.installation_id,
+                self.expires_at_str,
+            )
+
+    def _retry_unauthorized(self, response, **kwargs):
+        if response.status_code != 401:
+            return response
+        used = response.request.headers.get("Authorization", "")
+        self.renew(stale_token=used.split(" ", 1)[-1])
+        # Release the connection before sending the request again
+        response.content
+        response.close()
+        request = response.request.copy()
+        request.deregister_hook("response", self._retry_unauthorized)
+        TokenAuth.__call__(self, request)
+        new_response = response.connection.send(request, **kwargs)
+        new_response.history.append(response)
+        new_response.request = request
+        return new_response
+
+    def __call__(self, request):
+        """Renew the token if necessary and add the authorization header."""
+        if self.expiring:
+            self.renew()
+        request.register_hook("response", self._retry_unauthorized)
+        return super().__call__(request)
+
+
 class AppBearerTokenAuth(TokenAuth):
     """Use JWT authentication but throw an exception on expiration."""
 
@@ -317,3 +758,166 @@ class AppBearerTokenAuth(TokenAuth):
                 f"Your app token expired at {str(self.expires_at)}"
             )
         return super().__call__(request)
+
+
+#: Words in the message of a 403 refusing a request because of the token
+#: used, e.g., its rate limit or its permissions
+_TOKEN_REFUSALS = (
+    "rate limit",
+    "not accessible",
+    "saml",
+    "must have",
+    "permission",
+)
+
+
+def _refused_token(response):
+    """Tell whether another token may succeed where this response failed."""
+    request = response.request
+    if request.method not in ("GET", "HEAD"):
+        return False
+    if not getattr(request, "retry_with_other_tokens", True):
+        return False
+    if response.status_code == 404:
+        return True
+    if response.status_code != 403:
+        return False
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        return True
+    try:
+        message = str(response.json().get("message", ""))
+    except (AttributeError, ValueError):
+        return False
+    return any(word in message.lower() for word in _TOKEN_REFUSALS)
+
+
+#: The requests made with and the rate limit of a token in a
+#: :class:`TokenPoolAuth`
+TokenUsage = collections.namedtuple(
+    "TokenUsage", ["auth", "requests", "remaining", "reset"]
+)
+
+
+class TokenPoolAuth(requests.auth.AuthBase):
+    """Spread requests over several tokens by their remaining rate limit.
+
+    Each request is sent with the token with the most requests remaining
+    according to the rate limit headers of its latest response. A token
+    whose limit has reset, or which has not been used yet, is preferred.
+    A ``GET`` or ``HEAD`` request refused with a 404, or a 403 because of
+    the token's rate limit or permissions, e.g., because the token cannot
+    see a private repository, is sent once more with each other token
+    that has requests remaining until one succeeds. Use
+    :meth:`GitHubSession.no_token_retries` for requests whose 404 is their
+    answer.
+    """
+
+    def __init__(self, tokens):
+        """Set-up our authentication handler.
+
+        :param tokens:
+            the tokens as strings or other authentication handlers, e.g.,
+            :class:`RenewingAppInstallationTokenAuth`
+        """
+        self.auths = [
+            TokenAuth(token) if isinstance(token, str) else token
+            for token in tokens
+        ]
+        if not self.auths:
+            raise ValueError("At least one token is required")
+        self._lock = threading.Lock()
+        self._requests = [0] * len(self.auths)
+        self._remaining = [None] * len(self.auths)
+        self._reset = [0.0] * len(self.auths)
+
+    def __repr__(self):
+        """Return a nice view of the tokens in use."""
+        return "pool of {} tokens".format(len(self.auths))
+
+    def usage(self):
+        """Return the requests made with and rate limit of each token.
+
+        :returns:
+            the usage of each token, in the order they were given
+        :rtype:
+            list of :class:`TokenUsage`
+        """
+        with self._lock:
+            return [
+                TokenUsage(auth, requests, remaining, reset)
+                for auth, requests, remaining, reset in zip(
+                    self.auths, self._requests, self._remaining, self._reset
+                )
+            ]
+
+    def _headroom(self, index, now):
+        remaining = self._remaining[index]
+        if remaining is None or self._reset[index] <= now:
+            return float("inf")
+        return remaining
+
+    def _select(self, excluded):
+        """Choose the token with the most headroom and reserve a request."""
+        now = time.time()
+        with self._lock:
+            # Ties go to the least used, then the first given, token
+            index = max(
+                (i for i in range(len(self.auths)) if i not in excluded),
+                key=lambda i: (
+                    self._headroom(i, now),
+                    -self._requests[i],
+                    -i,
+                ),
+                default=None,
+            )
+            if index is None:
+                return None
+            headroom = self._headroom(index, now)
+            if excluded and headroom <= 0:
+                return None
+            self._requests[index] += 1
+            if self._remaining[index] is not None and headroom > 0:
+                self._remaining[index] -= 1
+            return index
+
+    def _apply(self, request, index, tried):
+        hook = functools.partial(self._handle_response, index, tried)
+        request = self.auths[index](request)
+        request.register_hook("response", hook)
+        return request
+
+    def _handle_response(self, index, tried, response, **kwargs):
+        headers = response.headers
+        if headers.get("X-RateLimit-Resource", "core") == "core":
+            try:
+                remaining = int(headers["X-RateLimit-Remaining"])
+                reset = float(headers["X-RateLimit-Reset"])
+            except (KeyError, ValueError):
+                pass
+            else:
+                with self._lock:
+                    self._remaining[index] = remaining
+                    self._reset[index] = reset
+        if not _refused_token(response):
+            return response
+        tried = tried | {index}
+        next_index = self._select(tried)
+        if next_index is None:
+            return response
+        __logs__.info(
+            "Retrying a %s response with another token", response.status_code
+        )
+        # Release the connection before sending the request again
+        response.content
+        response.close()
+        request = response.request.copy()
+        request.hooks = {"response": []}
+        request = self._apply(request, next_index, tried)
+        new_response = response.connection.send(request, **kwargs)
+        new_response.history.append(response)
+        new_response.request = request
+        return new_response
+
+    def __call__(self, request):
+        """Add the authorization of the token with the most headroom."""
+        return self._apply(request, self._select(frozenset()), frozenset())
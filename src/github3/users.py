@@ -355,7 +355,8 @@ class _User(models.GitHubCore):
         url = self._build_url(
             "repos", username, repository, "assignees", self.login
         )
-        return self._boolean(self._get(url), 204, 404)
+        with self.session.no_token_retries():
+            return self._boolean(self._get(url), 204, 404)
 
     def is_following(self, username):
         """Check if this user is following ``username``.
@@ -365,7 +366,8 @@ class _User(models.GitHubCore):
 
         """
         url = self.following_urlt.expand(other_user=username)
-        return self._boolean(self._get(url), 204, 404)
+        with self.session.no_token_retries():
+            return self._boolean(self._get(url), 204, 404)
 
     def events(self, public=False, number=-1, etag=None):
         r"""Iterate over events performed by this user.
@@ -2,7 +2,14 @@
 
 import collections.abc as abc_collections
 import datetime
+import hashlib
+import itertools
+import os
+import posixpath
 import re
+import tarfile
+import tempfile
+from concurrent import futures
 
 from requests import compat
 
@@ -88,3 +95,202 @@ def stream_response_to_file(response, path=None):
         fd.close()
 
     return filename
+
+
+def _archive_relative_path(name):
+    """Strip the top-level directory GitHub adds to archive member names.
+
+    GitHub wraps every archive in a directory named after the owner,
+    repository, and commit, e.g., ``sigmavirus24-github3.py-1a2b3c4/``.
+
+    :param str name: The name of the member in the archive
+    :returns: the path relative to the root of the repository
+    :rtype: str
+    """
+    _, _, relative = name.partition("/")
+    return relative.rstrip("/")
+
+
+def path_is_selected(path, paths):
+    """Check whether ``path`` lives within one of the requested ``paths``.
+
+    Parent directories of the requested ``paths`` are considered selected as
+    well. An empty list of ``paths`` selects everything.
+    """
+    if not paths:
+        return True
+    for prefix in paths:
+        prefix = prefix.strip("/")
+        if not prefix or path == prefix or path.startswith(prefix + "/"):
+            return True
+        # Keep parent directories of a requested path as well
+        if prefix.startswith(path + "/"):
+            return True
+    return False
+
+
+def iter_tarball_members(response, paths=None):
+    """Iterate over the members of a streamed tarball response.
+
+    The response body is decompressed and read as it arrives so the archive
+    never needs to be written to disk first. Names of the members yielded
+    are relative to the root of the repository, i.e., without the top-level
+    directory GitHub adds to the archive.
+
+    .. note::
+
+        The file object yielded for a member must be consumed before
+        advancing to the next member.
+
+    :param response: A streamed Response object from requests
+    :type response: requests.models.Response
+    :param paths: (optional), repository paths (files or directories) to
+        restrict the members to. Default: all members
+    :type paths: list
+    :returns: generator of tuples of the member and a file object for its
+        content (``None`` for anything that is not a regular file)
+    :rtype: tuple(:class:`tarfile.TarInfo`, file)
+    """
+    # Let urllib3 undo any Content-Encoding, tarfile handles the gzip layer
+    response.raw.decode_content = True
+    with tarfile.open(fileobj=response.raw, mode="r|gz") as archive:
+        for member in archive:
+            if member.type == tarfile.XGLTYPE:
+                continue
+            path = _archive_relative_path(member.name)
+            if not path or not path_is_selected(path, paths):
+                continue
+            member.name = path
+            fileobj = None
+            if member.isfile():
+                fileobj = archive.extractfile(member)
+            yield member, fileobj
+
+
+def symlink_is_contained(path, link_target):
+    """Check that a symbolic link stays within the directory it is in.
+
+    :param str path: The path of the link, relative to the directory
+    :param str link_target: Where the link points
+    :returns: False if ``link_target`` is absolute or, relative to ``path``,
+        points outside the directory
+    :rtype: bool
+    """
+    if posixpath.isabs(link_target):
+        return False
+    link = posixpath.normpath(
+        posixpath.join(posixpath.dirname(path), link_target)
+    )
+    return link != ".." and not link.startswith("../")
+
+
+def extract_tarball_response(response, directory, paths=None):
+    """Extract a streamed tarball response into ``directory``.
+
+    Only regular files, directories, and symbolic links which stay within
+    ``directory`` are extracted.
+
+    :param response: A streamed Response object from requests
+    :type response: requests.models.Response
+    :param str directory: The directory to extract the archive into
+    :param paths: (optional), repository paths (files or directories) to
+        restrict the extraction to. Default: extract everything
+    :type paths: list
+    :returns: the paths, relative to ``directory``, that were extracted
+    :rtype: list
+    """
+    root = os.path.realpath(directory)
+    extracted = []
+    for member, fileobj in iter_tarball_members(response, paths):
+        target = os.path.realpath(os.path.join(root, member.name))
+        if os.path.isabs(member.name) or not target.startswith(root + os.sep):
+            continue
+        if member.isdir():
+            os.makedirs(target, exist_ok=True)
+        elif member.isfile():
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as fd:
+                for chunk in iter(lambda: fileobj.read(65536), b""):
+                    fd.write(chunk)
+            os.chmod(target, member.mode & 0o777)
+        elif member.issym():
+            if not symlink_is_contained(member.name, member.linkname):
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if os.path.lexists(target):
+                os.remove(target)
+            os.symlink(member.linkname, target)
+        else:
+            continue
+        extracted.append(member.name)
+    return extracted
+
+
+def git_blob_sha(content):
+    """Compute the SHA git uses to address a blob with ``content``.
+
+    :param bytes content: The content of the blob
+    :returns: the hexadecimal SHA1 of the blob
+    :rtype: str
+    """
+    header = b"blob %d\0" % len(content)
+    return hashlib.sha1(header + content).hexdigest()
+
+
+def write_file_atomically(path, content, mode=None):
+    """Write ``content`` to ``path`` so readers never see a partial file.
+
+    The content is written to a temporary file in the same directory which
+    is then renamed over ``path``.
+
+    :param str path: The path of the file to write
+    :param bytes content: The content of the file
+    :param int mode: (optional), permission bits for the file
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".github3-")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(content)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def imap_unordered(func, iterable, max_workers=8):
+    """Call ``func`` on each item of ``iterable`` concurrently.
+
+    At most ``max_workers`` calls are made at a time and only a few more
+    items than that are taken from ``iterable`` ahead of time, so it can be
+    a lazy iterator over thousands of items, e.g., an organization's
+    repositories.
+
+    :param func: The callable to invoke with each item
+    :param iterable: The items to call ``func`` with
+    :param int max_workers: (optional), the number of concurrent calls
+    :returns: generator of tuples of each item and the value ``func``
+        returned for it, in the order the calls complete
+    :rtype: tuple
+    """
+    max_workers = max(1, int(max_workers))
+    items = iter(iterable)
+    with futures.ThreadPoolExecutor(max_workers) as executor:
+        pending = {}
+        for item in items:
+            pending[executor.submit(func, item)] = item
+            if len(pending) >= 2 * max_workers:
+                break
+        while pending:
+            done, _ = futures.wait(
+                pending, return_when=futures.FIRST_COMPLETED
+            )
+            for future in done:
+                item = pending.pop(future)
+                for next_item in itertools.islice(items, 1):
+                    pending[executor.submit(func, next_item)] = next_item
+                yield item, future.result()
@@ -0,0 +1,375 @@
+"""Tools for receiving and verifying webhook deliveries from GitHub.
+
+See also: https://docs.github.com/en/webhooks
+"""
+
+import hashlib
+import hmac
+import json as jsonlib
+import logging
+import queue
+import threading
+import typing as t
+
+from . import events
+
+LOG = logging.getLogger(__name__)
+
+_DIGESTS = {"sha256": hashlib.sha256, "sha1": hashlib.sha1}
+
+
+class SignatureVerifier:
+    """Verify the signatures GitHub sends with each webhook delivery.
+
+    The HMAC is keyed with the secret once and copied for each delivery, and
+    signatures are compared in constant time.
+
+    .. code-block:: python
+
+        verifier = SignatureVerifier(secret)
+        if not verifier.verify(body, headers["X-Hub-Signature-256"]):
+            ...
+
+    .. versionadded:: 4.1.0
+
+    :param secret:
+        the secret configured for the webhook
+    :type secret:
+        str or bytes
+    """
+
+    def __init__(self, secret: t.Union[str, bytes]) -> None:
+        if isinstance(secret, str):
+            secret = secret.encode("utf-8")
+        self._keyed = {
+            name: hmac.new(secret, digestmod=digest)
+            for name, digest in _DIGESTS.items()
+        }
+
+    def __repr__(self) -> str:
+        return "<SignatureVerifier>"
+
+    def signature(self, body: bytes, algorithm: str = "sha256") -> str:
+        """Compute the signature header value GitHub would send for body.
+
+        :param bytes body:
+            the raw body of the delivery
+        :param str algorithm:
+            (optional), ('sha256', 'sha1'). Default: 'sha256'
+        :returns:
+            the signature, e.g., ``"sha256=..."``
+        :rtype:
+            str
+        """
+        mac = self._keyed[algorithm].copy()
+        mac.update(body)
+        return f"{algorithm}={mac.hexdigest()}"
+
+    def verify(self, body: bytes, signature: t.Optional[str]) -> bool:
+        """Check the signature of a delivery.
+
+        :param bytes body:
+            the raw body of the delivery
+        :param str signature:
+            the value of the ``X-Hub-Signature-256`` (or the legacy
+            ``X-Hub-Signature``) header
+        :returns:
+            True if the signature matches, False otherwise
+        :rtype:
+            bool
+        """
+        if not signature:
+            return False
+        algorithm, _, _ = signature.partition("=")
+        if algorithm not in self._keyed:
+            return False
+        expected = self.signature(body, algorithm)
+        return hmac.compare_digest(expected.encode(), signature.encode())
+
+
+def verify_signature(
+    secret: t.Union[str, bytes], body: bytes, signature: t.Optional[str]
+) -> bool:
+    """Check the signature of a webhook delivery.
+
+    This is a shortcut for :meth:`SignatureVerifier.verify`. When verifying
+    many deliveries, create a :class:`SignatureVerifier` once instead.
+
+    .. versionadded:: 4.1.0
+
+    :param secret:
+        the secret configured for the webhook
+    :type secret:
+        str or bytes
+    :param bytes body:
+        the raw body of the delivery
+    :param str signature:
+        the value of the ``X-Hub-Signature-256`` header
+    :returns:
+        True if the signature matches, False otherwise
+    :rtype:
+        bool
+    """
+    return SignatureVerifier(secret).verify(body, signature)
+
+
+def _event_type(name):
+    """Map a webhook event name to the type used by the Events API."""
+    return "".join(part.title() for part in name.split("_")) + "Event"
+
+
+class Delivery:
+    """A single webhook delivery.
+
+    The body is only decoded, and the payload only converted into github3.py
+    objects, the first time they are accessed.
+
+    .. versionadded:: 4.1.0
+
+    This object has the following attributes:
+
+    .. attribute:: event
+
+        The name of the event from the ``X-GitHub-Event`` header, e.g.,
+        ``"pull_request"``.
+
+    .. attribute:: id
+
+        The unique identifier of the delivery from the ``X-GitHub-Delivery``
+        header.
+
+    .. attribute:: body
+
+        The raw body of the delivery.
+    """
+
+    def __init__(self, event, id, body, session=None):
+        self.event = event
+        self.id = id
+        self.body = body
+        self.session = session
+        self._json = None
+        self._payload = None
+
+    def __repr__(self):
+        return f"<Delivery [{self.event} {self.id}]>"
+
+    @property
+    def json(self):
+        """The decoded JSON body of the delivery."""
+        if self._json is None:
+            self._json = jsonlib.loads(self.body)
+        return self._json
+
+    @property
+    def action(self):
+        """The action that triggered the delivery, if any."""
+        return self.json.get("action")
+
+    @property
+    def payload(self):
+        """The body of the delivery with known objects converted.
+
+        For example, the ``pull_request`` of a ``pull_request`` event is an
+        :class:`~github3.events.EventPullRequest`, converted in the same way
+        as the payloads of :class:`~github3.events.Event`.
+        """
+        if self._payload is None:
+            handler = events._payload_handlers.get(
+                _event_type(self.event), events.identity
+            )
+            self._payload = handler(dict(self.json), self.session)
+        return self._payload
+
+
+class WebhookReceiver:
+    """A WSGI and ASGI application which receives webhook deliveries.
+
+    Deliveries with a valid signature are acknowledged immediately and put
+    on a bounded queue, from which a pool of worker threads passes them to
+    the registered handlers. When the queue is full, GitHub is told to try
+    again later with a 503.
+
+    .. code-block:: python
+
+        receiver = WebhookReceiver(secret)
+
+        @receiver.on("pull_request")
+        def handle(delivery):
+            print(delivery.action, delivery.payload["pull_request"])
+
+        receiver.start()
+        # Serve ``receiver`` with any WSGI server or ``receiver.asgi``
+        # with any ASGI server.
+
+    .. versionadded:: 4.1.0
+
+    :param secret:
+        the secret configured for the webhook
+    :type secret:
+        str or bytes
+    :param session:
+        (optional), the session given to objects created from payloads
+    :type session:
+        :class:`~github3.session.GitHubSession`
+    :param int max_workers:
+        (optional), the number of threads running handlers. Default: 4
+    :param int max_queue_size:
+        (optional), the number of deliveries that may wait for a worker.
+        Default: 1000
+    """
+
+    def __init__(
+        self, secret, session=None, max_workers=4, max_queue_size=1000
+    ):
+        self.verifier = SignatureVerifier(secret)
+        self.session = session
+        self.max_workers = max_workers
+        self.queue: "queue.Queue[t.Optional[Delivery]]" = queue.Queue(
+            max_queue_size
+        )
+        self._handlers: t.Dict[str, t.List[t.Callable]] = {}
+        self._workers: t.List[threading.Thread] = []
+
+    def __repr__(self):
+        return "<WebhookReceiver [{} workers, {} queued]>".format(
+            len(self._workers), self.queue.qsize()
+        )
+
+    def on(self, event, handler=None):
+        """Register ``handler`` for deliveries of ``event``.
+
+        This can be used as a decorator. Use ``"*"`` to receive every event.
+
+        :param str event:
+            the name of the event, e.g., ``"push"``
+        :param handler:
+            (optional), a callable accepting a :class:`Delivery`
+        """
+
+        def register(handler):
+            self._handlers.setdefault(event, []).append(handler)
+            return handler
+
+        if handler is None:
+            return register
+        return register(handler)
+
+    def dispatch(self, delivery):
+        """Call the handlers registered for a delivery in this thread.
+
+        :param delivery:
+            the delivery to handle
+        :type delivery:
+            :class:`Delivery`
+        """
+        handlers = self._handlers.get(delivery.event, [])
+        for handler in handlers + self._handlers.get("*", []):
+            try:
+                handler(delivery)
+            except Exception:
+                LOG.exception("Handler failed for delivery %s", delivery.id)
+
+    def start(self):
+        """Start the worker threads."""
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(target=self._work, daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self):
+        """Wait for the queued deliveries to be handled and stop the workers."""
+        for _ in self._workers:
+            self.queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+    def _work(self):
+        while True:
+            delivery = self.queue.get()
+            try:
+                if delivery is None:
+                    return
+                self.dispatch(delivery)
+            finally:
+                self.queue.task_done()
+
+    def receive(self, headers, body):
+        """Verify and enqueue a delivery.
+
+        :param headers:
+            the headers of the request, with lower-case names
+        :type headers:
+            dict
+        :param bytes body:
+            the raw body of the request
+        :returns:
+            the HTTP status code and message to respond with
+        :rtype:
+            tuple(int, str)
+        """
+        signature = headers.get("x-hub-signature-256") or headers.get(
+            "x-hub-signature"
+        )
+        if not self.verifier.verify(body, signature):
+            return 401, "Unauthorized"
+        event = headers.get("x-github-event")
+        if not event:
+            return 400, "Bad Request"
+        delivery = Delivery(
+            event, headers.get("x-github-delivery"), body, self.session
+        )
+        try:
+            self.queue.put_nowait(delivery)
+        except queue.Full:
+            return 503, "Service Unavailable"
+        return 202, "Accepted"
+
+    def __call__(self, environ, start_response):
+        """Handle a request as a WSGI application."""
+        if environ.get("REQUEST_METHOD") != "POST":
+            status, message = 405, "Method Not Allowed"
+        else:
+            headers = {
+                key[5:].replace("_", "-").lower(): value
+                for key, value in environ.items()
+                if key.startswith("HTTP_")
+            }
+            try:
+                length = int(environ.get("CONTENT_LENGTH") or 0)
+            except ValueError:
+                length = 0
+            body = environ["wsgi.input"].read(length) if length else b""
+            status, message = self.receive(headers, body)
+        start_response(
+            f"{status} {message}", [("Content-Type", "text/plain")]
+        )
+        return [message.encode()]
+
+    async def asgi(self, scope, receive, send):
+        """Handle a request as an ASGI application."""
+        if scope["type"] != "http":
+            return
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        if scope["method"] != "POST":
+            status, reason = 405, "Method Not Allowed"
+        else:
+            headers = {
+                key.decode("latin-1").lower(): value.decode("latin-1")
+                for key, value in scope.get("headers", [])
+            }
+            status, reason = self.receive(headers, body)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"text/plain")],
+            }
+        )
+        await send({"type": "http.response.body", "body": reason.encode()})
@@ -38,6 +38,20 @@ def betamax_simple_body(request):
     }
 
 
+@pytest.fixture(scope="session")
+def private_key_pem():
+    """Generate a private key for a GitHub App."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
 @pytest.fixture
 def enterprise_url(request):
     """Configure class with enterprise url."""
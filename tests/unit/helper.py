@@ -57,6 +57,31 @@ def enterprise_build_url_builder(enterprise_url):
     return enterprise_build_url
 
 
+def mock_response(status_code, json=None, headers=None, links=None):
+    """Build a mocked response returning ``json``."""
+    return unittest.mock.Mock(
+        status_code=status_code,
+        headers=headers or {},
+        links=links or {},
+        json=lambda: json,
+    )
+
+
+def mock_session():
+    """Auto-spec a GitHubSession which builds real URLs."""
+    session = unittest.mock.create_autospec(github3.session.GitHubSession)()
+    session.build_url.side_effect = github3.session.GitHubSession().build_url
+    return session
+
+
+def mock_repository(session=None):
+    """Build the example repository on a mocked session."""
+    return github3.repos.repo.Repository(
+        create_example_data_helper("repo_example")(),
+        session or mock_session(),
+    )
+
+
 class UnitHelper(unittest.TestCase):
     """Base class for unittests."""
 
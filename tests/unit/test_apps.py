@@ -0,0 +1,51 @@
+"""Unit tests for the helpers for GitHub Apps."""
+
+from unittest import mock
+
+import jwt
+import pytest
+
+from github3 import apps
+
+
+class TestJWTProvider:
+    def test_reuses_tokens_until_they_expire(self, private_key_pem):
+        provider = apps.JWTProvider(private_key_pem, 42, expire_in=600)
+
+        with mock.patch("time.time", return_value=1000):
+            first = provider.token()
+            assert provider.token() == first
+        with mock.patch("time.time", return_value=1539):
+            assert provider.token() == first
+        with mock.patch("time.time", return_value=1541):
+            renewed = provider.token()
+
+        assert renewed != first
+        claims = jwt.decode(renewed, options={"verify_signature": False})
+        assert claims == {"iat": 1541, "exp": 2141, "iss": "42"}
+
+    def test_limits_leeway_to_half_the_lifetime(self, private_key_pem):
+        provider = apps.JWTProvider(private_key_pem, 42, expire_in=30)
+
+        assert provider.leeway == 15
+
+    def test_headers(self, private_key_pem):
+        provider = apps.JWTProvider(private_key_pem, 42)
+
+        headers = provider.headers()
+
+        assert headers["Authorization"] == f"Bearer {provider.token()}"
+        assert headers["Accept"] == apps.APP_PREVIEW_HEADERS["Accept"]
+
+    def test_requires_bytes(self):
+        with pytest.raises(ValueError):
+            apps.JWTProvider("not bytes", 42)
+
+
+def test_create_token_parses_each_key_once(private_key_pem):
+    apps._load_private_key.cache_clear()
+
+    apps.create_token(private_key_pem, 42)
+    apps.create_token(private_key_pem, 42)
+
+    assert apps._load_private_key.cache_info().misses == 1
@@ -0,0 +1,58 @@
+"""Unit tests for the git object cache."""
+
+import os
+
+from github3.cache import ObjectCache
+from github3.cache import is_full_sha
+
+SHA = "7638417db6d59f3c431d3e1f261cc637155684cd"
+
+
+def test_is_full_sha():
+    assert is_full_sha(SHA) is True
+    assert is_full_sha("7638417") is False
+    assert is_full_sha("master") is False
+    assert is_full_sha(None) is False
+
+
+class TestObjectCache:
+    def test_get_and_set(self):
+        cache = ObjectCache()
+        assert cache.get("key") is None
+        cache.set("key", b"{}")
+        assert cache.get("key") == b"{}"
+        assert "key" in cache
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used_from_memory(self):
+        cache = ObjectCache(max_memory_size=10)
+        cache.set("a", b"aaaa")
+        cache.set("b", b"bbbb")
+        cache.get("a")
+        cache.set("c", b"cccc")
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_persists_to_disk(self, tmp_path):
+        ObjectCache(directory=str(tmp_path)).set("key", b"{}")
+
+        cache = ObjectCache(directory=str(tmp_path))
+        assert cache.get("key") == b"{}"
+
+    def test_evicts_from_disk(self, tmp_path):
+        cache = ObjectCache(directory=str(tmp_path), max_disk_size=10)
+        cache.set("a", b"aaaa")
+        os.utime(cache._path_for("a"), (0, 0))
+        cache.set("b", b"bbbb")
+        cache.set("c", b"cccc")
+        assert sorted(os.listdir(str(tmp_path))) == sorted(
+            os.path.basename(cache._path_for(key)) for key in ("b", "c")
+        )
+
+    def test_clear(self, tmp_path):
+        cache = ObjectCache(directory=str(tmp_path))
+        cache.set("key", b"{}")
+        cache.clear()
+        assert "key" not in cache
+        assert os.listdir(str(tmp_path)) == []
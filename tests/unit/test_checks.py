@@ -1,5 +1,7 @@
 """Unit tests around github3's Checks classes."""
 
+import json
+import unittest.mock
 from json import dumps
 
 import pytest
@@ -38,6 +40,62 @@ class TestCheckRun(UnitAppInstallHelper):
             headers=CheckRun.CUSTOM_HEADERS,
         )
 
+    def _uploads(self, *statuses):
+        """Make the session count the annotations it receives."""
+        uploaded = []
+        statuses = list(statuses)
+
+        def patch(url, data, headers):
+            status_code = statuses.pop(0) if statuses else 200
+            response = unittest.mock.Mock(
+                status_code=status_code,
+                headers={"Retry-After": "3"} if status_code == 403 else {},
+            )
+            if status_code == 200:
+                body = json.loads(data)
+                uploaded.append(len(body["output"]["annotations"]))
+                run = check_run_example_data()
+                run["output"]["annotations_count"] = sum(uploaded)
+                response.json.return_value = run
+            return response
+
+        self.session.patch.side_effect = patch
+        return uploaded
+
+    def test_upload_annotations(self):
+        """Show that annotations are uploaded in batches of 50."""
+        uploaded = self._uploads()
+        annotations = ({"path": str(i)} for i in range(120))
+
+        count = self.instance.upload_annotations(annotations, max_workers=2)
+
+        assert sorted(uploaded) == [20, 50, 50]
+        assert count == 120
+        assert self.instance.output.annotations_count == 120
+        _, kwargs = self.session.patch.call_args
+        output = json.loads(kwargs["data"])["output"]
+        assert output["title"] == self.instance.output.title
+
+    def test_upload_annotations_retries_rate_limits(self):
+        """Show that rate limited batches are retried."""
+        uploaded = self._uploads(403)
+
+        with unittest.mock.patch("time.sleep") as sleep:
+            count = self.instance.upload_annotations(
+                [{"path": "a"}], title="Lint", summary="1 finding"
+            )
+
+        assert count == 1
+        assert uploaded == [1]
+        sleep.assert_called_once_with(3.0)
+
+    def test_upload_annotations_raises_errors(self):
+        """Show that other errors are raised."""
+        self._uploads(422)
+
+        with pytest.raises(GitHubException):
+            self.instance.upload_annotations([{"path": "a"}])
+
     def test_check_run_types(self):
         """Check that we get the right types"""
 
@@ -49,10 +107,34 @@ class TestCheckRun(UnitAppInstallHelper):
         )
 
 
+@pytest.mark.parametrize(
+    "retry_after, delay",
+    [
+        ("3", 3.0),
+        ("Wed, 21 Oct 2015 07:28:30 GMT", 30.0),
+        ("Wed, 21 Oct 2015 07:27:00 GMT", 1.0),
+        ("Wed, 21 Oct 2015 07:28:10 -0000", 10.0),
+        ("soon", 120.0),
+    ],
+)
+def test_retry_delay(retry_after, delay):
+    response = unittest.mock.Mock(
+        status_code=429, headers={"Retry-After": retry_after}
+    )
+    # Wed, 21 Oct 2015 07:28:00 GMT
+    with unittest.mock.patch("time.time", return_value=1445412480.0):
+        assert github3.checks._retry_delay(response, 1) == delay
+
+
 class TestCheckRunRequiresAuth(UnitRequiresAuthenticationHelper):
     described_class = CheckRun
     example_data = check_run_example_data()
 
+    def test_upload_annotations_requires_auth(self):
+        """Show uploading annotations requires auth"""
+        with pytest.raises(GitHubException):
+            self.instance.upload_annotations([])
+
     def test_update_requires_auth(self):
         """Show updating a run requires auth"""
         with pytest.raises(GitHubException):
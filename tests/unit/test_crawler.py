@@ -0,0 +1,155 @@
+"""Unit tests for the organization crawler."""
+
+import unittest.mock
+
+import pytest
+
+import github3
+from github3.crawler import Crawler
+
+
+def repository(full_name):
+    return unittest.mock.Mock(full_name=full_name)
+
+
+def response(**headers):
+    return unittest.mock.Mock(headers=headers)
+
+
+def not_found():
+    return github3.exceptions.NotFoundError(
+        unittest.mock.Mock(status_code=404, json=lambda: {})
+    )
+
+
+@pytest.fixture
+def crawler():
+    return Crawler(github3.GitHub(), max_workers=1)
+
+
+class TestCrawler:
+    def test_runs_tasks_by_priority(self, crawler):
+        calls = []
+
+        @crawler.task(priority=1)
+        def branches(repository):
+            calls.append(("branches", repository.full_name))
+            return 1
+
+        @crawler.task(name="hooks", priority=0)
+        def list_hooks(repository):
+            calls.append(("hooks", repository.full_name))
+            return 2
+
+        results = crawler.run([repository("o/a"), repository("o/b")])
+
+        assert calls == [
+            ("hooks", "o/a"),
+            ("hooks", "o/b"),
+            ("branches", "o/a"),
+            ("branches", "o/b"),
+        ]
+        assert results == {
+            ("o/a", "hooks"): 2,
+            ("o/b", "hooks"): 2,
+            ("o/a", "branches"): 1,
+            ("o/b", "branches"): 1,
+        }
+        assert crawler.session.hooks["response"] == []
+
+    def test_sink(self):
+        collected = []
+        crawler = Crawler(
+            github3.GitHub(), sink=lambda *args: collected.append(args)
+        )
+        crawler.add_task(lambda repository: 1, name="one")
+        a = repository("o/a")
+
+        assert crawler.run([a]) == {}
+        assert collected == [(a, "one", 1)]
+
+    def test_resumes(self, tmp_path):
+        state_path = str(tmp_path / "crawl.jsonl")
+        calls = []
+
+        def hooks(repository):
+            calls.append(repository.full_name)
+            if repository.full_name == "o/b" and len(calls) < 3:
+                raise not_found()
+            return []
+
+        crawler = Crawler(github3.GitHub(), state_path=state_path)
+        crawler.add_task(hooks)
+        crawler.run([repository("o/a"), repository("o/b")])
+        assert list(crawler.errors) == [("o/b", "hooks")]
+
+        resumed = Crawler(github3.GitHub(), state_path=state_path)
+        resumed.add_task(hooks)
+        assert resumed.run([repository("o/a"), repository("o/b")]) == {
+            ("o/b", "hooks"): []
+        }
+        assert sorted(calls) == ["o/a", "o/b", "o/b"]
+
+    def test_records_connection_failures(self, crawler):
+        failure = github3.exceptions.TransportError(Exception("reset"))
+
+        @crawler.task()
+        def hooks(repository):
+            if repository.full_name == "o/a":
+                raise failure
+            return []
+
+        results = crawler.run([repository("o/a"), repository("o/b")])
+
+        assert results == {("o/b", "hooks"): []}
+        assert crawler.errors == {("o/a", "hooks"): failure}
+
+    def test_waits_for_reset_when_exhausted(self, crawler, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("time.time", lambda: 1000.0)
+        monkeypatch.setattr("time.sleep", sleeps.append)
+        crawler.reserve = 10
+
+        def observe(repository):
+            crawler.session.hooks["response"][0](
+                response(
+                    **{
+                        "X-RateLimit-Remaining": "5",
+                        "X-RateLimit-Reset": "1600",
+                    }
+                )
+            )
+
+        crawler.add_task(observe)
+        crawler.run([repository("o/a"), repository("o/b")])
+
+        assert sleeps == [600.0]
+
+    def test_spreads_calls_when_budget_is_short(self, crawler, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("time.time", lambda: 1000.0)
+        monkeypatch.setattr("time.sleep", sleeps.append)
+        crawler.reserve = 0
+        crawler._observe(
+            response(
+                **{
+                    "X-RateLimit-Remaining": "2",
+                    "X-RateLimit-Reset": "1600",
+                    "X-RateLimit-Resource": "core",
+                }
+            )
+        )
+        # Responses for other resources are ignored
+        crawler._observe(
+            response(
+                **{
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": "1600",
+                    "X-RateLimit-Resource": "search",
+                }
+            )
+        )
+        crawler.add_task(lambda repository: None, name="noop")
+        crawler.run([repository(f"o/{i}") for i in range(3)])
+
+        assert sleeps[0] == 300.0
@@ -0,0 +1,116 @@
+"""Unit tests for the streaming diff parser."""
+
+import unittest.mock
+
+import pytest
+
+from github3 import diffs
+
+DIFF = b"""\
+diff --git a/README.rst b/README.rst
+index 1a2b3c4..5d6e7f8 100644
+--- a/README.rst
++++ b/README.rst
+@@ -1,3 +1,4 @@ Title
+ github3.py
+--- not a header
++++ not a header either
++Added\r
+ last line
+\\ No newline at end of file
+diff --git a/new file.py b/new file.py
+new file mode 100755
+index 0000000..1111111
+--- /dev/null
++++ b/new file.py
+@@ -0,0 +1 @@
++print("hi")
+diff --git a/old.py b/new.py
+similarity index 90%
+rename from old.py
+rename to new.py
+index 2222222..3333333 100644
+--- a/old.py
++++ b/new.py
+@@ -10,2 +10,2 @@ def main():
+-    return 1
++    return 2
+     pass
+diff --git a/gone.txt b/gone.txt
+deleted file mode 100644
+index 4444444..0000000
+--- a/gone.txt
++++ /dev/null
+@@ -1,2 +0,0 @@
+-a
+-b
+diff --git a/logo.png b/logo.png
+index 5555555..6666666 100644
+Binary files a/logo.png and b/logo.png differ
+"""
+
+
+def lines():
+    return DIFF.split(b"\n")[:-1]
+
+
+class TestParseDiff:
+    def test_files(self):
+        files = list(diffs.parse_diff(lines()))
+
+        assert [(f.status, f.old_path, f.new_path) for f in files] == [
+            ("modified", "README.rst", "README.rst"),
+            ("added", None, "new file.py"),
+            ("renamed", "old.py", "new.py"),
+            ("removed", "gone.txt", None),
+            ("modified", "logo.png", "logo.png"),
+        ]
+        assert [(f.additions, f.deletions) for f in files] == [
+            (2, 1),
+            (1, 0),
+            (1, 1),
+            (0, 2),
+            (0, 0),
+        ]
+        assert files[1].new_mode == "100755"
+        assert files[3].path == "gone.txt"
+        assert files[4].is_binary is True
+
+    def test_hunks(self):
+        readme = next(diffs.parse_diff(lines()))
+
+        (hunk,) = readme.hunks
+        assert (hunk.old_start, hunk.old_count) == (1, 3)
+        assert (hunk.new_start, hunk.new_count) == (1, 4)
+        assert hunk.section == "Title"
+        assert hunk.lines[1:4] == [
+            "--- not a header",
+            "+++ not a header either",
+            "+Added\r",
+        ]
+
+    def test_without_hunks(self):
+        files = list(diffs.parse_diff(lines(), include_hunks=False))
+        assert all(f.hunks == [] for f in files)
+        assert files[0].additions == 2
+
+    def test_rejects_hunks_before_a_file_header(self):
+        with pytest.raises(ValueError):
+            list(diffs.parse_diff([b"@@ -1 +1 @@", b"+Added"]))
+
+    def test_summarize(self):
+        assert diffs.summarize_diff(lines()) == diffs.DiffSummary(5, 4, 4)
+
+
+def test_iter_lines():
+    response = unittest.mock.Mock()
+    response.iter_content.return_value = iter([b"a\nb", b"c\r\n", b"d"])
+    assert list(diffs.iter_lines(response)) == [b"a", b"bc\r", b"d"]
+
+
+def test_iter_lines_joins_lines_spanning_many_chunks():
+    response = unittest.mock.Mock()
+    response.iter_content.return_value = iter(
+        [b"x"] * 1000 + [b"\n", b"", b"y\n\nz", b"z"]
+    )
+    assert list(diffs.iter_lines(response)) == [b"x" * 1000, b"y", b"", b"zz"]
@@ -0,0 +1,158 @@
+"""Unit tests for the events firehose."""
+
+import json
+from unittest import mock
+
+import pytest
+
+import github3
+from github3 import events
+from github3.firehose import Firehose
+
+from .helper import create_example_data_helper
+
+get_event_example_data = create_example_data_helper("event_example")
+get_repo_example_data = create_example_data_helper("repo_example")
+
+
+def _event(event_id):
+    data = get_event_example_data()
+    data["id"] = str(event_id)
+    return events.Event(data, None)
+
+
+class _Events:
+    """Stand in for a method like Repository.events."""
+
+    def __init__(self, *pages, poll_interval="60"):
+        self.pages = list(pages)
+        self.calls = []
+        self.poll_interval = poll_interval
+
+    def __call__(self, number=-1, etag=None):
+        self.calls.append(etag)
+        ids = self.pages.pop(0) if self.pages else None
+        iterator = mock.Mock(
+            etag=f'"{len(self.calls)}"',
+            last_response=mock.Mock(
+                headers={"X-Poll-Interval": self.poll_interval}
+            ),
+        )
+        # An ETag match, i.e., a 304, yields nothing
+        iterator.__iter__ = lambda self: iter(
+            [_event(i) for i in sorted(ids or [], reverse=True)]
+        )
+        return iterator
+
+
+@pytest.fixture
+def monotonic():
+    with mock.patch("time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        yield monotonic
+
+
+class TestFirehose:
+    def test_poll_orders_and_deduplicates(self, monotonic):
+        firehose = Firehose()
+        firehose.add(_Events([5, 3, 1]), key="repo")
+        firehose.add(_Events([4, 3, 2]), key="org")
+
+        assert [e.id for e in firehose.poll()] == ["1", "2", "3", "4", "5"]
+
+    def test_poll_only_due_sources(self, monotonic):
+        repo = _Events([2, 1], [3])
+        firehose = Firehose(min_interval=60)
+        firehose.add(repo, key="repo")
+
+        assert len(firehose.poll()) == 2
+        assert firehose.poll() == []
+        assert len(repo.calls) == 1
+
+        monotonic.return_value += 60
+        assert [e.id for e in firehose.poll()] == ["3"]
+        assert repo.calls == [None, '"1"']
+
+    def test_stops_at_newest_seen_event(self, monotonic):
+        repo = _Events([2, 1], [4, 3, 2, 1])
+        firehose = Firehose()
+        firehose.add(repo, key="repo")
+        firehose.poll()
+        monotonic.return_value += 60
+
+        assert [e.id for e in firehose.poll()] == ["3", "4"]
+
+    def test_backs_off_inactive_sources(self, monotonic):
+        repo = _Events([1], [], [], [2], poll_interval="0")
+        firehose = Firehose(min_interval=10, max_interval=25)
+        firehose.add(repo, key="repo")
+
+        intervals = []
+        for _ in range(4):
+            firehose.poll()
+            interval = firehose._schedule[0][0] - monotonic.return_value
+            intervals.append(interval)
+            monotonic.return_value += interval
+        assert intervals == [10, 20, 25, 10]
+
+    def test_respects_poll_interval(self, monotonic):
+        firehose = Firehose(min_interval=10)
+        firehose.add(_Events([1], poll_interval="300"), key="repo")
+        firehose.poll()
+        assert firehose._schedule[0][0] == 1300
+
+    def test_failing_sources_are_skipped(self, monotonic):
+        def failing(number=-1, etag=None):
+            response = mock.Mock(status_code=404, headers={})
+            response.json.return_value = {}
+            raise github3.exceptions.NotFoundError(response)
+
+        firehose = Firehose(max_interval=600)
+        firehose.add(failing, key="gone")
+        firehose.add(_Events([1]), key="repo")
+
+        assert [e.id for e in firehose.poll()] == ["1"]
+
+    def test_unreachable_sources_back_off(self, monotonic):
+        def unreachable(number=-1, etag=None):
+            raise github3.exceptions.TransportError(Exception("reset"))
+
+        firehose = Firehose(min_interval=10, max_interval=25)
+        firehose.add(unreachable, key="down")
+
+        intervals = []
+        for _ in range(3):
+            assert firehose.poll() == []
+            interval = firehose._schedule[0][0] - monotonic.return_value
+            intervals.append(interval)
+            monotonic.return_value += interval
+        assert intervals == [10, 20, 25]
+
+    def test_state_survives_restart(self, monotonic, tmp_path):
+        state_path = str(tmp_path / "firehose.json")
+        firehose = Firehose(state_path=state_path)
+        firehose.add(_Events([2, 1]), key="repo")
+        firehose.poll()
+        firehose.save()
+
+        with open(state_path) as fd:
+            assert json.load(fd)["repo"]["cursor"] == 2
+
+        repo = _Events([3, 2, 1])
+        restarted = Firehose(state_path=state_path)
+        restarted.add(repo, key="repo")
+        assert [e.id for e in restarted.poll()] == ["3"]
+        assert repo.calls == ['"1"']
+
+    def test_key_from_bound_method(self, monotonic):
+        repository = github3.repos.Repository(get_repo_example_data(), None)
+        firehose = Firehose()
+        firehose.add(repository.events)
+        firehose.add(repository.events)
+        assert len(firehose) == 1
+        assert list(firehose._sources) == [
+            "https://api.github.com/repos/octocat/Hello-World#events"
+        ]
+
+        with pytest.raises(ValueError):
+            firehose.add(_Events())
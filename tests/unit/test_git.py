@@ -1,3 +1,5 @@
+import unittest.mock
+
 import github3
 
 from .helper import UnitHelper
@@ -50,6 +52,86 @@ class TestTree(UnitHelper):
             url_for(), params={"recursive": "1"}
         )
 
+    def tree_response(self, entries, truncated=False):
+        return unittest.mock.Mock(
+            status_code=200,
+            headers={},
+            json=lambda: {
+                "sha": "sha",
+                "url": url_for(),
+                "tree": [dict(entry) for entry in entries],
+                "truncated": truncated,
+            },
+        )
+
+    def test_truncated(self):
+        """Assert that truncated is read from the JSON."""
+        assert self.instance.truncated is False
+
+    def test_walk(self):
+        """Assert that a complete recursive listing is used as is."""
+        self.session.get.return_value = self.tree_response(
+            [
+                {"path": "a", "mode": "040000", "type": "tree", "sha": "1"},
+                {
+                    "path": "a/b",
+                    "mode": "100644",
+                    "type": "blob",
+                    "sha": "2",
+                    "size": 3,
+                },
+                {
+                    "path": "vendor",
+                    "mode": "040000",
+                    "type": "tree",
+                    "sha": "4",
+                },
+            ]
+        )
+
+        entries = list(self.instance.walk(prune=["vendor/"]))
+
+        assert entries == [
+            github3.git.TreeEntry("a", "040000", "tree", "1", None),
+            github3.git.TreeEntry("a/b", "100644", "blob", "2", 3),
+        ]
+        self.session.get.assert_called_once_with(
+            url_for(), params={"recursive": "1"}
+        )
+
+    def test_walk_truncated(self):
+        """Assert that subtrees are listed when the listing is truncated."""
+        subtree_url = url_for().rsplit("/", 1)[0] + "/1"
+        responses = {
+            (url_for(), True): self.tree_response([], truncated=True),
+            (url_for(), False): self.tree_response(
+                [
+                    {
+                        "path": "a",
+                        "mode": "040000",
+                        "type": "tree",
+                        "sha": "1",
+                    },
+                    {
+                        "path": "v",
+                        "mode": "040000",
+                        "type": "tree",
+                        "sha": "4",
+                    },
+                ]
+            ),
+            (subtree_url, False): self.tree_response(
+                [{"path": "b", "mode": "100644", "type": "blob", "sha": "2"}]
+            ),
+        }
+        self.session.get.side_effect = lambda url, params: responses[
+            (url, params is not None)
+        ]
+
+        entries = list(self.instance.walk(prune=["v"]))
+
+        assert [entry.path for entry in entries] == ["a", "a/b"]
+
 
 class TestCommit(UnitHelper):
     """Commit unit test."""
@@ -97,3 +179,80 @@ class TestReference(UnitHelper):
             self.session.patch.assert_called_once_with(
                 reference_url_for(), data='{"sha": "fakesha", "force": true}'
             )
+
+
+class TestTreeIndex:
+    """TreeIndex unit tests."""
+
+    entries = [
+        github3.git.TreeEntry("docs", "040000", "tree", "1" * 40, None),
+        github3.git.TreeEntry(
+            "docs/index.rst", "100644", "blob", "2" * 40, 3
+        ),
+        github3.git.TreeEntry("src", "040000", "tree", "3" * 40, None),
+        github3.git.TreeEntry("src/a.py", "100644", "blob", "4" * 40, 5),
+        github3.git.TreeEntry("src/pkg", "040000", "tree", "5" * 40, None),
+        github3.git.TreeEntry("src/pkg/b.py", "100644", "blob", "6" * 40, 7),
+        github3.git.TreeEntry("src-old.py", "100644", "blob", "7" * 40, 11),
+    ]
+
+    def setup_method(self):
+        self.index = github3.git.TreeIndex(reversed(self.entries))
+
+    def test_from_tree(self):
+        tree = github3.git.Tree(get_example_data(), None)
+        index = tree.index()
+        assert len(index) == 3
+        assert index.lookup("file.rb").size == 30
+
+    def test_iter(self):
+        assert [e.path for e in self.index] == sorted(
+            e.path for e in self.entries
+        )
+
+    def test_lookup(self):
+        assert self.index.lookup("src/pkg/b.py") == self.entries[5]
+        assert self.index.lookup("src/missing.py") is None
+        assert "src/pkg" in self.index
+
+    def test_listdir(self):
+        assert [e.path for e in self.index.listdir("src")] == [
+            "src/a.py",
+            "src/pkg",
+        ]
+        assert [e.path for e in self.index.listdir("src", True)] == [
+            "src/a.py",
+            "src/pkg",
+            "src/pkg/b.py",
+        ]
+        assert [e.path for e in self.index.listdir()] == [
+            "docs",
+            "src",
+            "src-old.py",
+        ]
+
+    def test_glob(self):
+        assert [e.path for e in self.index.glob("src/*.py")] == ["src/a.py"]
+        assert [e.path for e in self.index.glob("**/*.py")] == [
+            "src-old.py",
+            "src/a.py",
+            "src/pkg/b.py",
+        ]
+        assert [e.path for e in self.index.glob("src/**")] == [
+            "src/a.py",
+            "src/pkg",
+            "src/pkg/b.py",
+        ]
+        assert [e.path for e in self.index.glob("[!s]*/*.rst")] == [
+            "docs/index.rst"
+        ]
+
+    def test_directory_size(self):
+        assert self.index.directory_size("src") == 12
+        assert self.index.directory_size("src/pkg/") == 7
+        assert self.index.directory_size() == 26
+        assert self.index.directory_sizes() == {
+            "docs": 3,
+            "src": 12,
+            "src/pkg": 7,
+        }
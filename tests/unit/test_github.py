@@ -4,7 +4,9 @@ import pytest
 
 from github3 import GitHubEnterprise
 from github3 import GitHubError
+from github3.cache import ObjectCache
 from github3.github import GitHub
+from github3.notifications import NotificationSync
 from github3.projects import Project
 
 from . import helper
@@ -723,6 +725,11 @@ class TestGitHub(helper.UnitHelper):
 
         self.session.get.assert_called_once_with(url_for("user/10"))
 
+    def test_set_object_cache(self):
+        cache = ObjectCache()
+        self.instance.set_object_cache(cache)
+        assert self.session.object_cache is cache
+
     def test_set_user_agent_required_user_agent(self):
         self.instance.set_user_agent("")
 
@@ -1029,6 +1036,15 @@ class TestGitHubIterators(helper.UnitIteratorHelper):
             url_for("licenses"), params={"per_page": 100}, headers={}
         )
 
+    def test_notification_sync(self):
+        """Show that a user can create a sync of their notifications."""
+        sync = self.instance.notification_sync(participating=True)
+
+        assert isinstance(sync, NotificationSync)
+        assert sync._api == url_for("notifications")
+        assert sync.participating is True
+        self.session.get.assert_not_called()
+
     def test_notifications(self):
         """
         Show that an authenticated user can iterate over their notifications.
@@ -1516,6 +1532,10 @@ class TestGitHubRequiresAuthentication(
         """Show that GitHub#me requires authentication."""
         self.assert_requires_auth(self.instance.me)
 
+    def test_notification_sync(self):
+        """Show that one needs to authenticate to sync notifications."""
+        self.assert_requires_auth(self.instance.notification_sync)
+
     def test_notifications(self):
         """Show that one needs to authenticate to use #gists."""
         self.assert_requires_auth(self.instance.notifications)
@@ -1,4 +1,7 @@
+import datetime
+import time
 import unittest.mock
+from concurrent import futures
 
 try:
     import cPickle as pickle
@@ -269,17 +272,23 @@ class TestGitHubSession:
         """Test that temporary_basic_auth resets old auth."""
         s = self.build_session()
         s.basic_auth("foo", "bar")
+        req = requests.Request("GET", "https://api.github.com/")
         with s.temporary_basic_auth("temp", "pass"):
-            assert s.auth != session.BasicAuth("foo", "bar")
+            pr = s.prepare_request(req)
+            assert pr.headers["Authorization"] != self.basic("foo", "bar")
 
+        pr = s.prepare_request(req)
+        assert pr.headers["Authorization"] == self.basic("foo", "bar")
         assert s.auth == session.BasicAuth("foo", "bar")
 
     def test_temporary_basic_auth_replaces_auth(self):
         """Test that temporary_basic_auth sets the proper credentials."""
         s = self.build_session()
         s.basic_auth("foo", "bar")
+        req = requests.Request("GET", "https://api.github.com/")
         with s.temporary_basic_auth("temp", "pass"):
-            assert s.auth == session.BasicAuth("temp", "pass")
+            pr = s.prepare_request(req)
+            assert pr.headers["Authorization"] == self.basic("temp", "pass")
 
     def test_no_auth(self):
         """Verify that no_auth removes existing authentication."""
@@ -290,12 +299,54 @@ class TestGitHubSession:
         with s.no_auth():
             pr = s.prepare_request(req)
             assert "Authorization" not in pr.headers
-            assert s.auth is None
 
         pr = s.prepare_request(req)
         assert "Authorization" in pr.headers
         assert s.auth == session.BasicAuth("user", "password")
 
+    def test_no_auth_only_affects_the_current_thread(self):
+        """Verify that no_auth does not change other threads' requests."""
+        s = self.build_session()
+        s.token_auth("token")
+        req = requests.Request("GET", "https://api.github.com/")
+
+        with s.no_auth():
+            with futures.ThreadPoolExecutor(1) as executor:
+                pr = executor.submit(s.prepare_request, req).result()
+
+        assert pr.headers["Authorization"] == "token token"
+
+    def test_counts_requests_from_many_threads(self):
+        s = self.build_session()
+        response = unittest.mock.Mock(status_code=200, headers={})
+        with unittest.mock.patch.object(
+            requests.Session, "request", return_value=response
+        ):
+            with futures.ThreadPoolExecutor(8) as executor:
+                list(executor.map(s.get, ["https://example.com"] * 400))
+
+        assert s.request_counter == 400
+
+    def test_pool_maxsize(self):
+        s = session.GitHubSession(pool_maxsize=32)
+
+        assert s.get_adapter("https://api.github.com")._pool_maxsize == 32
+
+    def test_handle_two_factor_auth_copies_headers(self):
+        s = self.build_session()
+        s.two_factor_auth_callback(lambda: "123456")
+        headers = {"Accept": "application/json"}
+        with unittest.mock.patch.object(requests.Session, "request"):
+            s.handle_two_factor_auth(
+                ("GET", "https://api.github.com"), {"headers": headers}
+            )
+
+        assert headers == {"Accept": "application/json"}
+
+    @staticmethod
+    def basic(username, password):
+        return requests.auth._basic_auth_str(username, password)
+
     def test_retrieve_client_credentials_when_set(self):
         """Test that retrieve_client_credentials will return the credentials.
 
@@ -324,3 +375,238 @@ class TestGitHubSession:
 
         assert loaded.base_url == s.base_url
         assert loaded.two_factor_auth_cb == s.two_factor_auth_cb
+        with loaded.no_auth():
+            loaded.prepare_request(requests.Request("GET", s.base_url))
+
+
+def _token_json(token, seconds):
+    expires_at = session._utcnow() + datetime.timedelta(seconds=seconds)
+    return {"token": token, "expires_at": expires_at.isoformat()}
+
+
+class TestRenewingAppInstallationTokenAuth:
+    def build_auth(self, private_key_pem, json=None):
+        s = session.GitHubSession()
+        s.post = unittest.mock.Mock()
+        return session.RenewingAppInstallationTokenAuth(
+            s, private_key_pem, 1, 2, json
+        )
+
+    def prepare(self, auth, method="GET"):
+        request = requests.Request(method, "https://api.github.com/user")
+        return auth(request.prepare())
+
+    def test_uses_a_valid_token(self, private_key_pem):
+        auth = self.build_auth(private_key_pem, _token_json("v1.abc", 3600))
+
+        request = self.prepare(auth)
+
+        assert request.headers["Authorization"] == "token v1.abc"
+        auth.session.post.assert_not_called()
+
+    def test_renews_an_expiring_token_once(self, private_key_pem):
+        auth = self.build_auth(private_key_pem, _token_json("v1.old", 60))
+
+        def post(url, **kwargs):
+            time.sleep(0.05)
+            return unittest.mock.Mock(
+                status_code=201, json=lambda: _token_json("v1.new", 3600)
+            )
+
+        auth.session.post.side_effect = post
+        with futures.ThreadPoolExecutor(8) as executor:
+            requests_ = list(
+                executor.map(lambda _: self.prepare(auth), range(8))
+            )
+
+        assert auth.session.post.call_count == 1
+        url = auth.session.post.call_args[0][0]
+        assert url.endswith("/app/installations/2/access_tokens")
+        bearer = auth.session.post.call_args[1]["auth"]
+        assert isinstance(bearer, session.AppBearerTokenAuth)
+        assert {r.headers["Authorization"] for r in requests_} == {
+            "token v1.new"
+        }
+
+    def test_retries_unauthorized_requests(self, private_key_pem):
+        auth = self.build_auth(private_key_pem, _token_json("v1.old", 3600))
+        auth.session.post.return_value = unittest.mock.Mock(
+            status_code=201, json=lambda: _token_json("v1.new", 3600)
+        )
+        request = self.prepare(auth)
+        retried = unittest.mock.Mock(status_code=200, history=[])
+        refused = unittest.mock.Mock(status_code=401, request=request)
+        refused.connection.send.return_value = retried
+
+        response = requests.hooks.dispatch_hook(
+            "response", request.hooks, refused, timeout=5
+        )
+
+        assert response is retried
+        assert response.history == [refused]
+        sent = refused.connection.send.call_args[0][0]
+        assert sent.headers["Authorization"] == "token v1.new"
+        assert sent.hooks["response"] == []
+        assert refused.connection.send.call_args[1] == {"timeout": 5}
+
+
+def _rate_limited(status_code, remaining, reset=None):
+    reset = reset or time.time() + 3600
+    return unittest.mock.Mock(
+        status_code=status_code,
+        headers={
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset),
+        },
+        history=[],
+    )
+
+
+class TestTokenPoolAuth:
+    def prepare(self, auth, method="GET"):
+        request = requests.Request(method, "https://api.github.com/user")
+        return auth(request.prepare())
+
+    def respond(self, request, response):
+        response.request = request
+        return requests.hooks.dispatch_hook(
+            "response", request.hooks, response
+        )
+
+    def test_requires_tokens(self):
+        with pytest.raises(ValueError):
+            session.TokenPoolAuth([])
+
+    def test_routes_to_the_token_with_most_headroom(self):
+        auth = session.TokenPoolAuth(["a" * 8, "b" * 8])
+
+        first = self.prepare(auth)
+        assert first.headers["Authorization"] == "token aaaaaaaa"
+        self.respond(first, _rate_limited(200, 10))
+        second = self.prepare(auth)
+        assert second.headers["Authorization"] == "token bbbbbbbb"
+        self.respond(second, _rate_limited(200, 4000))
+
+        assert self.prepare(auth).headers["Authorization"] == "token bbbbbbbb"
+        usage = auth.usage()
+        assert [u.requests for u in usage] == [1, 2]
+        assert [u.remaining for u in usage] == [10, 3999]
+
+    def test_prefers_tokens_whose_limit_reset(self):
+        auth = session.TokenPoolAuth(["a" * 8, "b" * 8])
+        self.respond(self.prepare(auth), _rate_limited(200, 0, reset=1))
+        self.respond(self.prepare(auth), _rate_limited(200, 100))
+
+        assert self.prepare(auth).headers["Authorization"] == "token aaaaaaaa"
+
+    def test_retries_refused_requests_with_other_tokens(self):
+        auth = session.TokenPoolAuth(["a" * 8, "b" * 8, "c" * 8])
+        request = self.prepare(auth)
+        refused = _rate_limited(404, 100)
+        retried = _rate_limited(200, 100)
+        refused.connection.send.return_value = retried
+
+        response = self.respond(request, refused)
+
+        assert response is retried
+        assert response.history == [refused]
+        sent = refused.connection.send.call_args[0][0]
+        assert sent.headers["Authorization"] == "token bbbbbbbb"
+        assert [u.requests for u in auth.usage()] == [1, 1, 0]
+
+    def test_does_not_retry_with_exhausted_tokens(self):
+        auth = session.TokenPoolAuth(["a" * 8, "b" * 8])
+        self.respond(self.prepare(auth), _rate_limited(200, 100))
+        self.respond(self.prepare(auth), _rate_limited(200, 0))
+        request = self.prepare(auth)
+        refused = _rate_limited(403, 0)
+
+        assert self.respond(request, refused) is refused
+        refused.connection.send.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "method, status_code, message, retried",
+        [
+            ("GET", 403, "Resource not accessible by integration", True),
+            ("HEAD", 404, "Not Found", True),
+            ("GET", 403, "Repository access blocked", False),
+            ("POST", 404, "Not Found", False),
+            ("DELETE", 403, "Resource not accessible by integration", False),
+        ],
+    )
+    def test_only_retries_reads_refused_for_the_token(
+        self, method, status_code, message, retried
+    ):
+        auth = session.TokenPoolAuth(["a" * 8, "b" * 8])
+        request = self.prepare(auth, method)
+        refused = _rate_limited(status_code, 100)
+        refused.json.return_value = {"message": message}
+
+        response = self.respond(request, refused)
+
+        assert refused.connection.send.called is retried
+        assert (response is refused) is not retried
+
+    def test_no_token_retries(self):
+        s = session.GitHubSession()
+        s.token_pool_auth(["a" * 8, "b" * 8])
+        with s.no_token_retries():
+            request = s.prepare_request(
+                requests.Request("GET", "https://api.github.com/user")
+            )
+        refused = _rate_limited(404, 100)
+
+        assert self.respond(request, refused) is refused
+        refused.connection.send.assert_not_called()
+
+    def test_token_pool_auth(self):
+        s = session.GitHubSession()
+        s.token_pool_auth(["a" * 8, "b" * 8])
+
+        assert isinstance(s.auth, session.TokenPoolAuth)
+
+
+class TestTransport:
+    url = "https://api.github.com"
+
+    def test_sessions_share_connections(self):
+        transport = session.Transport(pool_maxsize=32, pool_block=True)
+        first = session.GitHubSession(transport=transport)
+        second = session.GitHubSession(transport=transport)
+        first.token_auth("first")
+        second.token_auth("second")
+
+        assert first.get_adapter(self.url) is transport.adapter
+        assert second.get_adapter(self.url) is transport.adapter
+        assert transport.adapter._pool_maxsize == 32
+        assert first.auth != second.auth
+
+    def test_closing_a_session_keeps_shared_connections(self):
+        transport = session.Transport()
+        s = session.GitHubSession(transport=transport)
+        with unittest.mock.patch.object(transport.adapter, "close") as close:
+            s.close()
+            assert close.called is False
+            transport.close()
+            assert close.called is True
+
+    def test_clone(self):
+        s = session.GitHubSession(default_read_timeout=30)
+        s.base_url = "https://github.example.com/api/v3"
+        s.headers["X-GitHub-Api-Version"] = "2022-11-28"
+        s.token_auth("token")
+        s.verify = False
+
+        clone = s.clone()
+
+        assert clone.get_adapter(self.url) is s.get_adapter(self.url)
+        assert clone.base_url == s.base_url
+        assert clone.headers["X-GitHub-Api-Version"] == "2022-11-28"
+        assert clone.timeout == (4, 30)
+        assert clone.verify is False
+        assert clone.auth is None
+        with unittest.mock.patch.object(
+            s.get_adapter(self.url), "close"
+        ) as close:
+            clone.close()
+            assert close.called is False
@@ -0,0 +1,88 @@
+"""Unit tests for the installation broker."""
+
+import datetime
+import json
+import os
+from unittest import mock
+
+import pytest
+
+from github3 import session
+from github3.installations import InstallationBroker
+
+
+def _token_json(token, seconds=3600):
+    expires_at = session._utcnow() + datetime.timedelta(seconds=seconds)
+    return {"token": token, "expires_at": expires_at.isoformat()}
+
+
+@pytest.fixture
+def post():
+    with mock.patch.object(session.GitHubSession, "post") as post:
+        post.side_effect = lambda url, **kwargs: mock.Mock(
+            status_code=201,
+            json=lambda: _token_json("v1." + url.split("/")[-2]),
+        )
+        yield post
+
+
+class TestInstallationBroker:
+    def test_clients_share_connections_and_tokens(
+        self, private_key_pem, post
+    ):
+        broker = InstallationBroker(private_key_pem, 1)
+
+        first = broker.client(10)
+        assert broker.client("10") is first
+        second = broker.client(20)
+
+        adapter = broker.session.get_adapter("https://api.github.com")
+        assert first.session.get_adapter("https://api.github.com") is adapter
+        assert second.session.get_adapter("https://api.github.com") is adapter
+        assert first.session.auth is not second.session.auth
+        post.assert_not_called()
+        assert broker.token(10) == "v1.10"
+        assert broker.token(10) == "v1.10"
+        assert broker.token(20) == "v1.20"
+        assert post.call_count == 2
+        bearers = {c[1]["auth"].token for c in post.call_args_list}
+        assert len(bearers) == 1
+
+    def test_evicts_least_recently_used(self, private_key_pem):
+        broker = InstallationBroker(private_key_pem, 1, max_size=2)
+
+        first = broker.client(1)
+        broker.client(2)
+        broker.client(1)
+        broker.client(3)
+
+        assert 2 not in broker
+        assert broker.client(1) is first
+        assert len(broker) == 2
+        broker.discard(1)
+        assert 1 not in broker
+
+    def test_saves_and_restores_tokens(self, private_key_pem, post, tmpdir):
+        path = str(tmpdir.join("tokens.json"))
+        broker = InstallationBroker(private_key_pem, 1, state_path=path)
+        broker.token(10)
+        broker.client(20)
+        broker.save()
+
+        with open(path) as fd:
+            assert list(json.load(fd)) == ["10"]
+        assert os.stat(path).st_mode & 0o777 == 0o600
+
+        restored = InstallationBroker(private_key_pem, 1, state_path=path)
+        assert restored.token(10) == "v1.10"
+        assert post.call_count == 1
+
+    def test_renews_expired_restored_tokens(
+        self, private_key_pem, post, tmpdir
+    ):
+        path = tmpdir.join("tokens.json")
+        path.write(json.dumps({"10": _token_json("v1.old", -60)}))
+
+        broker = InstallationBroker(private_key_pem, 1, state_path=str(path))
+
+        assert broker.token(10) == "v1.10"
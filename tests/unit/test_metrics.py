@@ -0,0 +1,238 @@
+"""Unit tests for request metrics and tracing."""
+
+from unittest import mock
+
+import pytest
+import requests
+
+from github3 import metrics
+from github3 import session
+
+
+@pytest.mark.parametrize(
+    "url, template",
+    [
+        (
+            "https://api.github.com/repos/o/r/issues/1?page=2",
+            "/repos/{owner}/{repo}/issues/{number}",
+        ),
+        (
+            "https://api.github.com/repos/o/r/contents/docs/index.rst",
+            "/repos/{owner}/{repo}/contents/{path}",
+        ),
+        (
+            "https://api.github.com/repos/o/r/commits/" + "a" * 40,
+            "/repos/{owner}/{repo}/commits/{ref}",
+        ),
+        (
+            "https://api.github.com/repos/o/r/commits/main/check-runs",
+            "/repos/{owner}/{repo}/commits/{ref}/check-runs",
+        ),
+        (
+            "https://api.github.com/repos/o/r/git/trees/feature/x",
+            "/repos/{owner}/{repo}/git/trees/{ref}",
+        ),
+        (
+            "https://api.github.com/repos/o/r/branches/feature/x",
+            "/repos/{owner}/{repo}/branches/{branch}",
+        ),
+        (
+            "https://api.github.com/repos/o/r/branches/feature/x/protection"
+            "/required_status_checks",
+            "/repos/{owner}/{repo}/branches/{branch}/protection"
+            "/required_status_checks",
+        ),
+        (
+            "https://api.github.com/repos/o/r/git/blobs/" + "a" * 40,
+            "/repos/{owner}/{repo}/git/blobs/{sha}",
+        ),
+        (
+            "https://api.github.com/repos/o/r/actions/secrets/public-key",
+            "/repos/{owner}/{repo}/actions/secrets/public-key",
+        ),
+        (
+            "https://api.github.com/orgs/o/teams/t/members/u",
+            "/orgs/{org}/teams/{team_slug}/members/{username}",
+        ),
+        (
+            "https://api.github.com/user/starred/o/r",
+            "/user/starred/{owner}/{repo}",
+        ),
+        (
+            "https://github.example.com/api/v3/users/u/events/public",
+            "/users/{username}/events/public",
+        ),
+        ("https://api.github.com", "/"),
+    ],
+)
+def test_url_template(url, template):
+    base_url = "https://github.example.com/api/v3"
+    assert metrics.url_template(url, base_url) == template
+
+
+def _response(status_code=200, request_headers=None, body=None, **headers):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    response._content = b"{}"
+    response._content_consumed = True
+    response.request = requests.Request(
+        "POST",
+        "https://api.github.com/user",
+        headers=request_headers,
+        data=body,
+    ).prepare()
+    return response
+
+
+class TestRequestEvent:
+    def test_reads_the_response(self):
+        response = _response(
+            304,
+            {"If-None-Match": '"abc"'},
+            body="ü",
+            **{
+                "X-RateLimit-Remaining": "4999",
+                "X-RateLimit-Resource": "search",
+            },
+        )
+        response.history = [mock.Mock()]
+
+        event = metrics.RequestEvent("post", "/user", 0.5, response)
+
+        assert event.method == "POST"
+        assert event.status == 304
+        assert event.cache == "hit"
+        assert event.bytes_sent == 2
+        assert event.bytes_received == 2
+        assert event.retries == 1
+        assert event.rate_limit_resource == "search"
+        assert event.rate_limit_remaining == 4999
+
+    def test_unconditional_request(self):
+        event = metrics.RequestEvent("get", "/user", 0.5, _response())
+
+        assert event.cache is None
+        assert event.rate_limit_remaining is None
+
+
+class TestRegistry:
+    def test_renders_prometheus_text(self):
+        registry = metrics.Registry()
+        counter = registry.counter("requests_total", "Requests", ["path"])
+        counter.inc(path='/a"b')
+        counter.inc(2, path='/a"b')
+        histogram = registry.histogram(
+            "duration_seconds", "Duration", buckets=[0.1, 1]
+        )
+        histogram.observe(0.05)
+        histogram.observe(5)
+
+        assert registry.render() == (
+            "# HELP duration_seconds Duration\n"
+            "# TYPE duration_seconds histogram\n"
+            'duration_seconds_bucket{le="0.1"} 1\n'
+            'duration_seconds_bucket{le="1.0"} 1\n'
+            'duration_seconds_bucket{le="+Inf"} 2\n'
+            "duration_seconds_sum 5.05\n"
+            "duration_seconds_count 2\n"
+            "# HELP requests_total Requests\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{path="/a\\"b"} 3\n'
+        )
+
+    def test_returns_existing_metrics(self):
+        registry = metrics.Registry()
+        counter = registry.counter("requests_total", "Requests")
+
+        assert registry.counter("requests_total", "Requests") is counter
+        with pytest.raises(ValueError):
+            registry.gauge("requests_total", "Requests")
+        with pytest.raises(ValueError):
+            counter.inc(path="/")
+
+
+class TestSessionInstrumentation:
+    def request(self, s, response):
+        with mock.patch.object(
+            requests.Session, "request", return_value=response
+        ) as request:
+            s.get("https://api.github.com/repos/o/r/pulls/7")
+        return request
+
+    def test_observers_and_tracers(self):
+        s = session.GitHubSession()
+        recorder = metrics.RequestMetrics(labels={"job": "crawler"})
+        s.add_request_observer(recorder)
+        spans = []
+
+        def tracer(method, template, headers):
+            headers["traceparent"] = "00-trace"
+            spans.append((method, template))
+            return spans.append
+
+        s.add_request_tracer(tracer)
+        request = self.request(
+            s, _response(200, **{"X-RateLimit-Remaining": "10"})
+        )
+
+        assert request.call_args[1]["headers"] == {"traceparent": "00-trace"}
+        assert spans[0] == ("GET", "/repos/{owner}/{repo}/pulls/{number}")
+        assert spans[1].status == 200
+        labels = {
+            "job": "crawler",
+            "method": "GET",
+            "template": "/repos/{owner}/{repo}/pulls/{number}",
+        }
+        assert recorder.requests.value(status=200, **labels) == 1
+        assert recorder.duration.count(**labels) == 1
+        assert (
+            recorder.rate_limit_remaining.value(
+                job="crawler", resource="core"
+            )
+            == 10
+        )
+        assert "github3_requests_total{job=" in recorder.registry.render()
+        assert s.clone().request_observers == [recorder]
+
+    def test_reports_errors(self):
+        s = session.GitHubSession()
+        events = []
+        s.add_request_observer(events.append)
+        with mock.patch.object(
+            requests.Session,
+            "request",
+            side_effect=requests.exceptions.ConnectionError(),
+        ):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                s.get("https://api.github.com/user")
+
+        assert events[0].status is None
+        assert isinstance(
+            events[0].error, requests.exceptions.ConnectionError
+        )
+
+    def test_failing_observers_do_not_fail_requests(self):
+        s = session.GitHubSession()
+        s.add_request_observer(mock.Mock(side_effect=RuntimeError()))
+        response = _response()
+
+        self.request(s, response)
+
+        assert s.request_counter == 1
+
+    def test_failing_tracers_do_not_fail_requests(self):
+        s = session.GitHubSession()
+        events = []
+        s.add_request_tracer(mock.Mock(side_effect=RuntimeError()))
+        s.add_request_tracer(
+            lambda method, template, headers: mock.Mock(
+                side_effect=RuntimeError()
+            )
+        )
+        s.add_request_observer(events.append)
+
+        self.request(s, _response())
+
+        assert s.request_counter == 1
+        assert events[0].status == 200
@@ -1,10 +1,17 @@
 """Unit tests around the Thread class."""
 
+import copy
+import json
+
+import pytest
+
 import github3
 
 from .helper import UnitHelper
 from .helper import create_example_data_helper
 from .helper import create_url_helper
+from .helper import mock_response
+from .helper import mock_session
 
 get_example_data = create_example_data_helper("notification_example")
 url_for = create_url_helper("https://api.github.com/notifications/threads/1")
@@ -57,3 +64,153 @@ class TestThread(UnitHelper):
         self.instance.subscription()
 
         self.session.get.assert_called_once_with(url_for("subscription"))
+
+
+def thread_data(id, repository="octocat/Hello-World", updated_at="1", **kw):
+    data = copy.deepcopy(get_example_data())
+    data.update(
+        id=id,
+        url=f"https://api.github.com/notifications/threads/{id}",
+        updated_at=f"2014-11-07T22:0{updated_at}:48Z",
+        unread=True,
+        **kw,
+    )
+    data["repository"]["url"] = f"https://api.github.com/repos/{repository}"
+    return data
+
+
+@pytest.fixture
+def session():
+    return mock_session()
+
+
+@pytest.fixture
+def sync(session):
+    return github3.notifications.NotificationSync(
+        "https://api.github.com/notifications", session
+    )
+
+
+class TestNotificationSync:
+    def test_fetch(self, session, sync):
+        session.get.side_effect = [
+            mock_response(
+                200,
+                [thread_data("1", updated_at="1")],
+                headers={
+                    "Last-Modified": "Fri, 07 Nov 2014 22:01:48 GMT",
+                    "X-Poll-Interval": "120",
+                },
+                links={"next": {"url": "https://api.github.com/page2"}},
+            ),
+            mock_response(200, [thread_data("2", updated_at="3")]),
+        ]
+
+        assert [thread.id for thread in sync.fetch()] == ["1", "2"]
+        assert sorted(sync.threads) == ["1", "2"]
+        assert sync.since == "2014-11-07T22:03:48Z"
+        assert sync.last_modified == "Fri, 07 Nov 2014 22:01:48 GMT"
+        assert sync.poll_interval == 120
+        # Only the first page is conditional
+        session.get.assert_called_with("https://api.github.com/page2")
+
+    def test_fetch_is_incremental(self, session, sync):
+        session.get.side_effect = [
+            mock_response(
+                200,
+                [thread_data("1", updated_at="1")],
+                headers={"Last-Modified": "Fri, 07 Nov 2014 22:01:48 GMT"},
+            ),
+            mock_response(304),
+            mock_response(
+                200,
+                [
+                    thread_data("2", updated_at="5"),
+                    thread_data("1", updated_at="1"),
+                ],
+            ),
+        ]
+        sync.fetch()
+
+        assert sync.fetch() == []
+        session.get.assert_called_with(
+            "https://api.github.com/notifications",
+            params={"since": "2014-11-07T22:01:48Z"},
+            headers={"If-Modified-Since": "Fri, 07 Nov 2014 22:01:48 GMT"},
+        )
+        assert [thread.id for thread in sync.fetch()] == ["2"]
+
+    def test_mark_read_everything(self, session, sync):
+        session.get.return_value = mock_response(
+            200,
+            [
+                thread_data("1", updated_at="1"),
+                thread_data("2", "octocat/other", updated_at="2"),
+            ],
+        )
+        session.put.return_value = mock_response(205)
+        threads = sync.fetch()
+
+        assert sync.mark_read(threads) is True
+        session.put.assert_called_once_with(
+            "https://api.github.com/notifications",
+            data=json.dumps({"last_read_at": "2014-11-07T22:02:48Z"}),
+        )
+        assert sync.threads == {}
+
+    def test_mark_read_by_repository(self, session, sync):
+        session.get.return_value = mock_response(
+            200,
+            [
+                thread_data("1", updated_at="1"),
+                thread_data("2", updated_at="2"),
+                thread_data("3", "octocat/other", updated_at="3"),
+                thread_data("4", "octocat/other", updated_at="4"),
+            ],
+        )
+        session.put.return_value = mock_response(202)
+        session.patch.return_value = mock_response(205)
+        threads = {thread.id: thread for thread in sync.fetch()}
+
+        assert sync.mark_read([threads["1"], threads["2"], threads["3"]])
+        session.put.assert_called_once_with(
+            "https://api.github.com/repos/octocat/Hello-World/notifications",
+            data=json.dumps({"last_read_at": "2014-11-07T22:02:48Z"}),
+        )
+        session.patch.assert_called_once_with(
+            "https://api.github.com/notifications/threads/3"
+        )
+        assert list(sync.threads) == ["4"]
+
+    def test_mark_read_participating(self, session):
+        sync = github3.notifications.NotificationSync(
+            "https://api.github.com/notifications",
+            session,
+            participating=True,
+        )
+        session.get.return_value = mock_response(200, [thread_data("1")])
+        session.patch.return_value = mock_response(205)
+
+        assert sync.mark_read(sync.fetch()) is True
+        session.put.assert_not_called()
+        session.patch.assert_called_once_with(
+            "https://api.github.com/notifications/threads/1"
+        )
+
+    def test_mark_read_resumed(self, session):
+        sync = github3.notifications.NotificationSync(
+            "https://api.github.com/notifications",
+            session,
+            since="2014-11-07T22:01:48Z",
+        )
+        # Threads not updated since the previous sync are not listed
+        session.get.return_value = mock_response(
+            200, [thread_data("2", updated_at="2")]
+        )
+        session.patch.return_value = mock_response(205)
+
+        assert sync.mark_read(sync.fetch()) is True
+        session.put.assert_not_called()
+        session.patch.assert_called_once_with(
+            "https://api.github.com/notifications/threads/2"
+        )
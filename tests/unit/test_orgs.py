@@ -1,10 +1,13 @@
 """Organization unit tests."""
 
+import unittest.mock
+
 import pytest
 
 from github3 import GitHubError
 from github3.orgs import Organization
 from github3.orgs import OrganizationHook
+from github3.orgs import PermissionMatrix
 from github3.projects import Project
 
 from . import helper
@@ -350,6 +353,11 @@ class TestOrganizationRequiresAuth(helper.UnitRequiresAuthenticationHelper):
         with pytest.raises(GitHubError):
             self.instance.add_repository("foo", 10)
 
+    def test_permission_matrix(self):
+        """Show that one must be authenticated to build a permission matrix."""
+        with pytest.raises(GitHubError):
+            self.instance.permission_matrix()
+
     def test_block(self):
         """Show we must be authenticated to block users."""
         with pytest.raises(GitHubError):
@@ -569,6 +577,26 @@ class TestOrganizationIterator(helper.UnitIteratorHelper):
             url_for("repos"), params={"per_page": 100}, headers={}
         )
 
+    def test_traffic(self):
+        """Show that traffic is collected from the org's repositories."""
+        table = self.instance.traffic(type="sources")
+
+        assert table.repositories == []
+        self.session.get.assert_called_once_with(
+            url_for("repos"),
+            params={"type": "sources", "per_page": 100},
+            headers={},
+        )
+
+    def test_permission_matrix(self):
+        """Show that the permission matrix is built from team listings."""
+        matrix = self.instance.permission_matrix()
+
+        assert matrix.teams == []
+        self.session.get.assert_called_once_with(
+            url_for("teams"), params={"per_page": 100}, headers={}
+        )
+
     def test_respositories_accepts_type(self):
         """Show that one can pass a repository type."""
         i = self.instance.repositories("all")
@@ -617,6 +645,80 @@ class TestOrganizationIterator(helper.UnitIteratorHelper):
         )
 
 
+def _team(slug, repositories, logins=()):
+    team = unittest.mock.Mock(slug=slug)
+    team.repositories.return_value = [
+        unittest.mock.Mock(full_name=name, permissions=permissions)
+        for name, permissions in repositories.items()
+    ]
+    team.members.return_value = [
+        unittest.mock.Mock(login=login) for login in logins
+    ]
+    return team
+
+
+class TestPermissionMatrix(helper.UnitHelper):
+    """Unit tests for Organization.permission_matrix."""
+
+    described_class = Organization
+    example_data = get_org_example_data()
+
+    def test_permission_matrix(self):
+        """Show that the matrix combines the listings of every team."""
+        pull = {"pull": True, "push": False, "admin": False}
+        push = {"pull": True, "push": True, "admin": False}
+        admin = {"pull": True, "push": True, "admin": True}
+        teams = [
+            _team("dev", {"o/a": push, "o/b": pull}, ["alice", "bob"]),
+            _team("ops", {"o/b": admin, "o/c": pull}, ["bob"]),
+            _team("empty", {}),
+        ]
+        with unittest.mock.patch.object(
+            Organization, "teams", return_value=teams
+        ):
+            matrix = self.instance.permission_matrix(members=True)
+
+        assert matrix.teams == ["dev", "empty", "ops"]
+        assert matrix.repositories == ["o/a", "o/b", "o/c"]
+        assert matrix.permission("dev", "o/a") == "push"
+        assert matrix.permission("dev", "o/c") is None
+        assert matrix.permission("missing", "o/a") is None
+        assert matrix.repositories_for("ops") == {
+            "o/b": "admin",
+            "o/c": "pull",
+        }
+        assert matrix.teams_for("o/b") == {"dev": "pull", "ops": "admin"}
+        assert matrix.permissions_for_user("bob") == {
+            "o/a": "push",
+            "o/b": "admin",
+            "o/c": "pull",
+        }
+        assert matrix.permissions_for_user("alice") == {
+            "o/a": "push",
+            "o/b": "pull",
+        }
+        assert repr(matrix) == (
+            "<PermissionMatrix [3 teams x 3 repositories]>"
+        )
+
+    def test_without_members(self):
+        """Show that members are only listed when requested."""
+        team = _team("dev", {"o/a": {"pull": True}})
+        with unittest.mock.patch.object(
+            Organization, "teams", return_value=[team]
+        ):
+            matrix = self.instance.permission_matrix()
+
+        team.members.assert_not_called()
+        assert matrix.members == {}
+        assert matrix.permissions_for_user("alice") == {}
+
+    def test_from_listings(self):
+        """Show that a matrix can be built from existing listings."""
+        matrix = PermissionMatrix({"dev": {"o/a": "maintain"}})
+        assert matrix.permission("dev", "o/a") == "maintain"
+
+
 class TestOrganizationHook(helper.UnitHelper):
     """Test methods on OrganizationHook class."""
 
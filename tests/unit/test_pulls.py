@@ -1,5 +1,7 @@
 """Unit tests for the github3.pulls module."""
 
+import unittest.mock
+
 import pytest
 
 from github3 import GitHubError
@@ -108,6 +110,27 @@ class TestPullRequest(helper.UnitHelper):
             url_for(), headers={"Accept": "application/vnd.github.diff"}
         )
 
+    def test_diff_files(self):
+        """Show that a user can stream the diff of a Pull Request."""
+        list(self.instance.diff_files())
+
+        self.session.get.assert_called_once_with(
+            url_for(),
+            headers={"Accept": "application/vnd.github.diff"},
+            stream=True,
+        )
+
+    def test_diff_summary(self):
+        """Show that a user can summarize the diff of a Pull Request."""
+        self.session.get.return_value = unittest.mock.Mock(
+            status_code=200,
+            iter_content=lambda chunk_size: iter(
+                [b"diff --git a/x b/x\n@@ -1 +1 @@\n-a\n+b\n"]
+            ),
+        )
+
+        assert self.instance.diff_summary() == (1, 1, 1)
+
     def test_is_merged_request(self):
         """Show that a user can request the merge status of a PR."""
         self.instance.merged = False
@@ -1,6 +1,10 @@
 """Unit tests for methods implemented on Branch Protection."""
 
+import pytest
+
 import github3
+from github3.repos.branch import audit_protection
+from github3.repos.branch import effective_protection
 
 from . import helper
 
@@ -254,3 +258,159 @@ class TestProtectionRequiredStatusChecks(helper.UnitHelper):
         """Verify the request to delete required status checks."""
         self.instance.delete()
         self.delete_called_with(protection_required_status_checks_url_for())
+
+
+@pytest.fixture
+def repository():
+    return helper.mock_repository()
+
+
+def audit(repository, policy, current, apply=False):
+    repository.session.get.return_value = current
+    return list(
+        audit_protection([(repository, "master")], policy, apply=apply)
+    )[0]
+
+
+class TestAuditProtection:
+    """Unit tests for auditing and applying protection in bulk."""
+
+    def test_effective_protection(self):
+        policy = effective_protection(protection_example_data())
+
+        assert policy["enforce_admins"] is True
+        assert policy["required_status_checks"] == {
+            "strict": False,
+            "contexts": ["continuous-integration/travis-ci"],
+        }
+        reviews = policy["required_pull_request_reviews"]
+        assert reviews["required_approving_review_count"] == 2
+        assert reviews["dismissal_restrictions"] == {
+            "users": ["octocat"],
+            "teams": ["justice-league"],
+            "apps": [],
+        }
+        assert policy["required_linear_history"] is True
+        assert policy["required_signatures"] is False
+        assert effective_protection(None) is None
+
+    def test_compliant(self, repository):
+        result = audit(
+            repository,
+            {"enforce_admins": True, "required_linear_history": True},
+            helper.mock_response(200, protection_example_data()),
+        )
+
+        assert result.compliant
+        assert result.requests == []
+
+    def test_single_change_uses_its_endpoint(self, repository):
+        repository.session.patch.return_value = helper.mock_response(200, {})
+        result = audit(
+            repository,
+            {
+                "required_pull_request_reviews": {
+                    "dismiss_stale_reviews": False
+                }
+            },
+            helper.mock_response(200, protection_example_data()),
+            apply=True,
+        )
+
+        assert list(result.changes) == ["required_pull_request_reviews"]
+        assert result.applied is True
+        url, body = repository.session.patch.call_args
+        assert url == (protection_url_for("required_pull_request_reviews"),)
+        assert body["json"]["dismiss_stale_reviews"] is False
+        assert body["json"]["required_approving_review_count"] == 2
+        repository.session.put.assert_not_called()
+
+    def test_many_changes_replace_protection(self, repository):
+        repository.session.put.return_value = helper.mock_response(200, {})
+        result = audit(
+            repository,
+            {
+                "enforce_admins": False,
+                "allow_force_pushes": False,
+                "required_linear_history": True,
+            },
+            helper.mock_response(200, protection_example_data()),
+            apply=True,
+        )
+
+        assert sorted(result.changes) == [
+            "allow_force_pushes",
+            "enforce_admins",
+        ]
+        repository.session.put.assert_called_once()
+        url, body = repository.session.put.call_args
+        assert url == (protection_url_for(),)
+        assert body["json"]["enforce_admins"] is False
+        assert body["json"]["allow_force_pushes"] is False
+        assert body["json"]["required_linear_history"] is True
+        assert body["json"]["required_status_checks"] == {
+            "strict": False,
+            "contexts": ["continuous-integration/travis-ci"],
+        }
+        repository.session.delete.assert_not_called()
+
+    def test_replacing_protection_keeps_other_settings(self, repository):
+        current = protection_example_data()
+        for name in ("lock_branch", "block_creations", "allow_fork_syncing"):
+            current[name] = {"enabled": True}
+        current["required_status_checks"]["checks"] = [
+            {"context": "continuous-integration/travis-ci", "app_id": 15368}
+        ]
+        repository.session.put.return_value = helper.mock_response(200, {})
+        result = audit(
+            repository,
+            {
+                "enforce_admins": False,
+                "allow_force_pushes": False,
+                "required_status_checks": {
+                    "contexts": ["continuous-integration/travis-ci", "lint"]
+                },
+            },
+            helper.mock_response(200, current),
+            apply=True,
+        )
+
+        assert result.current["lock_branch"] is True
+        _, body = repository.session.put.call_args
+        assert body["json"]["lock_branch"] is True
+        assert body["json"]["block_creations"] is True
+        assert body["json"]["allow_fork_syncing"] is True
+        assert body["json"]["required_status_checks"] == {
+            "strict": False,
+            "checks": [
+                {
+                    "context": "continuous-integration/travis-ci",
+                    "app_id": 15368,
+                },
+                {"context": "lint"},
+            ],
+        }
+
+    def test_unprotected_branch(self, repository):
+        result = audit(
+            repository,
+            {"enforce_admins": True, "required_signatures": True},
+            helper.mock_response(404, {"message": "Branch not protected"}),
+        )
+
+        assert result.current is None
+        assert result.applied is False
+        assert [(method, url) for method, url, _ in result.requests] == [
+            ("put", protection_url_for()),
+            ("post", protection_url_for("required_signatures")),
+        ]
+
+    def test_errors_are_recorded(self, repository):
+        result = audit(
+            repository,
+            {"enforce_admins": True},
+            helper.mock_response(404, {"message": "Not Found"}),
+        )
+
+        assert isinstance(result.error, github3.exceptions.NotFoundError)
+        assert not result.compliant
@@ -62,6 +62,28 @@ class TestRelease(UnitHelper):
             stream=True,
         )
 
+    def test_archive_members(self):
+        """Verify that we stream the tarball for the release."""
+        list(self.instance.archive_members())
+
+        self.session.get.assert_called_once_with(
+            "https://api.github.com/repos/sigmavirus24/github3.py/"
+            "tarball/v0.7.1",
+            allow_redirects=True,
+            stream=True,
+        )
+
+    def test_extract_archive(self):
+        """Verify that we stream the tarball for the release."""
+        assert self.instance.extract_archive("some/directory") == []
+
+        self.session.get.assert_called_once_with(
+            "https://api.github.com/repos/sigmavirus24/github3.py/"
+            "tarball/v0.7.1",
+            allow_redirects=True,
+            stream=True,
+        )
+
     def test_unsupported_archive(self):
         """Do not make a request if the archive format is unsupported."""
         self.instance.archive(format="clearly fake")
@@ -165,9 +187,12 @@ class TestAsset(UnitHelper):
                     "Accept": "application/octet-stream",
                 },
                 "stream": True,
+                "auth": unittest.mock.ANY,
             }
             assert get.call_count == 2
             get.assert_any_call("https://fakeurl", **data)
+            auth = get.call_args[1]["auth"]
+            assert isinstance(auth, github3.session.NoAuth)
 
     def test_edit_without_label(self):
         self.instance.edit("new name")
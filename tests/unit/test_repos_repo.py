@@ -1,14 +1,18 @@
 """Unit tests for Repositories."""
 
 import datetime
+import os
+import tempfile
 import unittest.mock
 from base64 import b64encode
 
 import pytest
 
 from github3 import GitHubError
+from github3.cache import ObjectCache
 from github3.exceptions import GitHubException
 from github3.models import GitHubCore
+from github3.notifications import NotificationSync
 from github3.projects import Project
 from github3.repos.comment import RepoComment
 from github3.repos.commit import RepoCommit
@@ -17,6 +21,7 @@ from github3.repos.contents import Contents
 from github3.repos.hook import Hook
 from github3.repos.repo import Repository
 from github3.repos.repo import ShortRepository
+from github3.utils import git_blob_sha
 
 from . import helper
 
@@ -98,6 +103,14 @@ class TestRepository(helper.UnitHelper):
 
         assert self.session.put.called is False
 
+    def test_extract_archive(self):
+        """Verify the request for streaming a tarball archive."""
+        assert self.instance.extract_archive("some/directory", ref="v1") == []
+
+        self.session.get.assert_called_once_with(
+            url_for("tarball/v1"), allow_redirects=True, stream=True
+        )
+
     def test_asset(self):
         """Test retrieving an asset uses the right headers.
 
@@ -556,6 +569,124 @@ class TestRepository(helper.UnitHelper):
 
         assert self.session.get.called is False
 
+    def test_download_tree(self):
+        """Verify that only missing or changed blobs are downloaded."""
+        # git hash-object of b"same\n"
+        same_sha = "1275430f1765c63e539cb0452565563bd6aef6a6"
+        tree = [
+            {"path": "README", "mode": "100644", "sha": "1" * 40},
+            {"path": "bin/run", "mode": "100755", "sha": same_sha},
+            {"path": "docs/index.rst", "mode": "100644", "sha": "3" * 40},
+        ]
+        for entry in tree:
+            entry["type"] = "blob"
+
+        def get(url, params=None, headers=None):
+            if url == url_for("git/trees/main"):
+                return unittest.mock.Mock(
+                    status_code=200,
+                    headers={},
+                    json=lambda: {"truncated": False, "tree": tree},
+                )
+            return unittest.mock.Mock(status_code=200, content=b"new")
+
+        self.session.get.side_effect = get
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(os.path.join(directory, "bin"))
+            with open(os.path.join(directory, "bin", "run"), "wb") as fd:
+                fd.write(b"same\n")
+
+            written = self.instance.download_tree(
+                "main", directory, paths=["README", "bin"]
+            )
+
+            assert written == ["README"]
+            with open(os.path.join(directory, "README"), "rb") as fd:
+                assert fd.read() == b"new"
+            assert not os.path.exists(os.path.join(directory, "docs"))
+
+        assert self.session.get.call_count == 2
+        self.session.get.assert_called_with(
+            url_for("git/blobs/" + "1" * 40),
+            headers={"Accept": "application/vnd.github.raw"},
+        )
+
+    def test_download_tree_skips_escaping_symlinks(self):
+        """Verify that symbolic links outside the directory are skipped."""
+        targets = {
+            "1" * 40: b"../README",
+            "2" * 40: b"../../etc/passwd",
+            "3" * 40: b"/etc/passwd",
+        }
+        tree = [
+            {"path": "docs/readme", "sha": "1" * 40},
+            {"path": "docs/parent", "sha": "2" * 40},
+            {"path": "absolute", "sha": "3" * 40},
+        ]
+        for entry in tree:
+            entry.update(type="blob", mode="120000")
+
+        def get(url, params=None, headers=None):
+            if url == url_for("git/trees/main"):
+                return unittest.mock.Mock(
+                    status_code=200,
+                    headers={},
+                    json=lambda: {"truncated": False, "tree": tree},
+                )
+            sha = url.rsplit("/", 1)[-1]
+            return unittest.mock.Mock(status_code=200, content=targets[sha])
+
+        self.session.get.side_effect = get
+        with tempfile.TemporaryDirectory() as directory:
+            written = self.instance.download_tree("main", directory)
+
+            assert written == ["docs/readme"]
+            link = os.path.join(directory, "docs", "readme")
+            assert os.readlink(link) == "../README"
+            assert not os.path.lexists(os.path.join(directory, "absolute"))
+            assert not os.path.lexists(
+                os.path.join(directory, "docs", "parent")
+            )
+
+    def test_download_tree_twice_keeps_link_targets(self):
+        """Verify that links written by a previous download are not followed."""
+        blobs = {
+            git_blob_sha(b"readme\n"): b"readme\n",
+            git_blob_sha(b"../README"): b"../README",
+        }
+        tree = [
+            {"path": "README", "mode": "100644"},
+            {"path": "docs/readme", "mode": "120000"},
+        ]
+        for entry, blob_sha in zip(tree, blobs):
+            entry.update(type="blob", sha=blob_sha)
+
+        def get(url, params=None, headers=None):
+            if url == url_for("git/trees/main"):
+                return unittest.mock.Mock(
+                    status_code=200,
+                    headers={},
+                    json=lambda: {"truncated": False, "tree": tree},
+                )
+            blob_sha = url.rsplit("/", 1)[-1]
+            return unittest.mock.Mock(
+                status_code=200, content=blobs[blob_sha]
+            )
+
+        self.session.get.side_effect = get
+        with tempfile.TemporaryDirectory() as directory:
+            first = self.instance.download_tree("main", directory)
+            second = self.instance.download_tree("main", directory)
+
+            assert first == ["README", "docs/readme"]
+            assert second == []
+            readme = os.path.join(directory, "README")
+            assert not os.path.islink(readme)
+            with open(readme, "rb") as fd:
+                assert fd.read() == b"readme\n"
+            link = os.path.join(directory, "docs", "readme")
+            assert os.readlink(link) == "../README"
+
     def test_edit(self):
         """Verify the request for editing a repository."""
         data = {
@@ -629,6 +760,26 @@ class TestRepository(helper.UnitHelper):
             url_for("git/commits/fake-sha")
         )
 
+    def test_git_commit_uses_object_cache(self):
+        """Verify a git commit requested by full SHA is cached."""
+        sha = "7638417db6d59f3c431d3e1f261cc637155684cd"
+        self.session.object_cache = ObjectCache()
+        self.session.get.return_value = unittest.mock.Mock(
+            status_code=200,
+            headers={},
+            json=lambda: helper.create_example_data_helper(
+                "git_commit_example"
+            )(),
+        )
+
+        first = self.instance.git_commit(sha)
+        second = self.instance.git_commit(sha)
+
+        self.session.get.assert_called_once_with(
+            url_for("git/commits/" + sha)
+        )
+        assert first.sha == second.sha
+
     def test_hook(self):
         """Verify the request for retrieving a hook on a repository."""
         self.instance.hook(1)
@@ -725,6 +876,7 @@ class TestRepository(helper.UnitHelper):
         self.session.get.assert_called_once_with(
             url_for("collaborators/octocat")
         )
+        self.session.no_token_retries.assert_called_once_with()
 
     def test_issue(self):
         """Verify the request for retrieving an issue on a repository."""
@@ -969,6 +1121,19 @@ class TestRepository(helper.UnitHelper):
             url_for("git/trees/fake-sha"), params={"recursive": 1}
         )
 
+    def test_walk_tree(self):
+        """Verify the request for walking a tree."""
+        list(self.instance.walk_tree("fake-sha"))
+
+        self.session.get.assert_called_once_with(
+            url_for("git/trees/fake-sha"), params={"recursive": "1"}
+        )
+
+    def test_walk_tree_required_sha(self):
+        """Verify walking a tree requires a sha."""
+        assert list(self.instance.walk_tree("")) == []
+        assert self.session.get.called is False
+
     def test_str(self):
         """Verify instance string is formatted correctly."""
         owner = self.instance.owner
@@ -1326,6 +1491,14 @@ class TestRepositoryIterator(helper.UnitIteratorHelper):
             headers={},
         )
 
+    def test_notification_sync(self):
+        """Test the ability to sync the notifications for a repository."""
+        sync = self.instance.notification_sync(since="2014-11-07T22:01:48Z")
+
+        assert isinstance(sync, NotificationSync)
+        assert sync._api == url_for("notifications")
+        assert sync.since == "2014-11-07T22:01:48Z"
+
     def test_notifications(self):
         """Test the ability to iterate over the notifications for a repo."""
         i = self.instance.notifications()
@@ -1674,6 +1847,11 @@ class TestRepositoryRequiresAuth(helper.UnitRequiresAuthenticationHelper):
         with pytest.raises(GitHubError):
             self.instance.merge("master", "octocat/feature")
 
+    def test_notification_sync(self):
+        """Show that a user must be authenticated to sync notifications."""
+        with pytest.raises(GitHubError):
+            self.instance.notification_sync()
+
     def test_notifications(self):
         """Show that a user must be authenticated to list notifications."""
         with pytest.raises(GitHubError):
@@ -1965,6 +2143,16 @@ class TestComparison(helper.UnitHelper):
             headers={"Accept": "application/vnd.github.diff"},
         )
 
+    def test_diff_files(self):
+        """Verify the request for streaming the diff for this comparison."""
+        list(self.instance.diff_files())
+
+        self.session.get.assert_called_once_with(
+            compare_url_for(),
+            headers={"Accept": "application/vnd.github.diff"},
+            stream=True,
+        )
+
     def test_patch(self):
         """Verify the request for retrieving a diff for this comparison."""
         self.instance.patch()
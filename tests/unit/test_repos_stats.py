@@ -0,0 +1,156 @@
+"""Unit tests for repository statistics."""
+
+import pytest
+
+import github3
+from github3.repos import stats
+
+from . import helper
+
+repo_example_data = helper.create_example_data_helper("repo_example")()
+
+
+@pytest.fixture
+def session():
+    return helper.mock_session()
+
+
+@pytest.fixture
+def repository(session):
+    return helper.mock_repository(session)
+
+
+@pytest.fixture(autouse=True)
+def no_sleeping(monkeypatch):
+    monkeypatch.setattr(stats.time, "sleep", lambda seconds: None)
+
+
+class TestFetchStatistics:
+    def test_polls_until_ready(self, session, repository):
+        session.get.side_effect = [
+            helper.mock_response(202),
+            helper.mock_response(202),
+            helper.mock_response(200, {"all": [1], "owner": [0]}),
+        ]
+
+        results = list(
+            stats.fetch_statistics(
+                [repository], "participation", initial_delay=0
+            )
+        )
+
+        assert results == [(repository, {"all": [1], "owner": [0]})]
+        assert session.get.call_count == 3
+        session.get.assert_called_with(
+            repository._api + "/stats/participation"
+        )
+
+    def test_builds_contributor_stats(self, session, repository):
+        session.get.return_value = helper.mock_response(
+            200,
+            [
+                {
+                    "author": repo_example_data["owner"],
+                    "total": 1,
+                    "weeks": [],
+                }
+            ],
+        )
+
+        ((_, contributors),) = stats.fetch_statistics([repository])
+
+        assert isinstance(contributors[0], stats.ContributorStats)
+
+    def test_gives_up_after_timeout(self, session, repository):
+        session.get.return_value = helper.mock_response(202)
+
+        results = list(
+            stats.fetch_statistics([repository], "code_frequency", timeout=0)
+        )
+
+        assert results == [(repository, None)]
+
+    def test_reports_failed_repositories(self, session, repository):
+        other = github3.repos.repo.Repository(
+            dict(repo_example_data, url=repository._api + "-other"), session
+        )
+        failure = github3.exceptions.TransportError(Exception("reset"))
+
+        def get(url):
+            if url.startswith(other._api + "/"):
+                raise failure
+            return helper.mock_response(200, {"all": [1], "owner": [0]})
+
+        session.get.side_effect = get
+        errors = {}
+
+        results = list(
+            stats.fetch_statistics(
+                [other, repository], "participation", errors=errors
+            )
+        )
+
+        assert results == [(repository, {"all": [1], "owner": [0]})]
+        assert errors == {other: failure}
+
+    def test_rejects_unknown_statistics(self):
+        with pytest.raises(ValueError):
+            list(stats.fetch_statistics([], "stargazers"))
+
+
+def contributor(login, weeks):
+    author = dict(repo_example_data["owner"], login=login)
+    return stats.ContributorStats(
+        {
+            "author": author,
+            "total": sum(c for _, _, _, c in weeks),
+            "weeks": [
+                {"w": w, "a": a, "d": d, "c": c} for w, a, d, c in weeks
+            ],
+        },
+        None,
+    )
+
+
+class TestContributorStats:
+    def test_alternate_weeks_are_lazy(self):
+        stat = contributor("octocat", [(1367712000, 1, 2, 3)])
+        assert stat._alternate_weeks is None
+        assert stat.alternate_weeks[0]["commits"] == 3
+        assert stat.alt_weeks is stat.alternate_weeks
+
+
+class TestContributorStatsTable:
+    def setup_method(self):
+        self.table = stats.ContributorStatsTable(
+            [
+                contributor("octocat", [(100, 1, 2, 3), (200, 4, 5, 6)]),
+                contributor("hubot", [(100, 10, 0, 1), (200, 0, 10, 1)]),
+                # The same author in another repository
+                contributor("octocat", [(200, 1, 1, 1), (300, 2, 2, 2)]),
+            ]
+        )
+
+    def test_layout(self):
+        assert self.table.authors == ["octocat", "hubot"]
+        assert list(self.table.weeks) == [100, 200, 300]
+        assert list(self.table.additions) == [1, 5, 2, 10, 0, 0]
+        assert list(self.table.commits) == [3, 7, 2, 1, 1, 0]
+
+    def test_totals_by_author(self):
+        assert self.table.totals_by_author() == {
+            "octocat": (8, 10, 12),
+            "hubot": (10, 10, 2),
+        }
+        assert self.table.totals_by_author(since=200, until=300) == {
+            "octocat": (5, 6, 7),
+            "hubot": (0, 10, 1),
+        }
+
+    def test_totals_by_week(self):
+        totals = self.table.totals_by_week(self.table.deletions)
+        assert list(totals) == [2, 16, 2]
+
+    def test_churn(self):
+        assert self.table.churn() == 38
+        assert self.table.churn(since=300) == 4
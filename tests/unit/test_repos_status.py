@@ -1,7 +1,15 @@
+from unittest import mock
+
+import pytest
+
 import github3
+from github3.repos.status import StatusPoller
 
 from .helper import UnitHelper
 from .helper import create_example_data_helper
+from .helper import mock_repository
+from .helper import mock_response
+from .helper import mock_session
 
 get_combined_status_example_data = create_example_data_helper(
     "repos_combined_status_example"
@@ -19,3 +27,177 @@ class TestCombinedStatus(UnitHelper):
 
     def test_statuses(self):
         assert len(self.instance.statuses) == self.instance.total_count
+
+
+def _combined(*states):
+    return {
+        "state": "pending",
+        "statuses": [
+            {"context": f"ci/{i}", "state": state}
+            for i, state in enumerate(states)
+        ],
+    }
+
+
+def _runs(*runs):
+    return {
+        "total_count": len(runs),
+        "check_runs": [
+            {"name": name, "status": status, "conclusion": conclusion}
+            for name, status, conclusion in runs
+        ],
+    }
+
+
+@pytest.fixture
+def session():
+    return mock_session()
+
+
+@pytest.fixture
+def repository(session):
+    return mock_repository(session)
+
+
+class TestStatusPoller:
+    def respond(self, session, responses):
+        def get(url, **kwargs):
+            return responses[url.rsplit("/", 1)[-1]].pop(0)
+
+        session.get.side_effect = get
+
+    def test_summarizes_and_deduplicates(self, session, repository):
+        self.respond(
+            session,
+            {
+                "status": [mock_response(200, _combined("success"))],
+                "check-runs": [
+                    mock_response(
+                        200,
+                        _runs(("build", "completed", "success")),
+                        links={"next": {"url": "https://next/check-runs"}},
+                    ),
+                    mock_response(200, _runs(("lint", "in_progress", None))),
+                ],
+            },
+        )
+
+        summaries = StatusPoller().poll(
+            [(repository, "abc"), (repository, "abc")]
+        )
+
+        assert session.get.call_count == 3
+        summary = summaries[("octocat/Hello-World", "abc")]
+        assert summary.state == "pending"
+        assert summary.statuses == {"ci/0": "success"}
+        assert summary.check_runs == {
+            "build": "success",
+            "lint": "in_progress",
+        }
+
+    def test_uses_conditional_requests(self, session, repository):
+        self.respond(
+            session,
+            {
+                "status": [
+                    mock_response(
+                        200, _combined("success"), headers={"ETag": '"s"'}
+                    ),
+                    mock_response(304),
+                ],
+                "check-runs": [
+                    mock_response(
+                        200,
+                        _runs(("build", "completed", "success")),
+                        headers={"ETag": '"c"'},
+                    ),
+                    mock_response(
+                        200,
+                        _runs(("build", "completed", "failure")),
+                        headers={"ETag": '"d"'},
+                    ),
+                ],
+            },
+        )
+        poller = StatusPoller()
+        first = poller.poll([(repository, "abc")])
+        second = poller.poll([(repository, "abc")])
+
+        key = ("octocat/Hello-World", "abc")
+        assert first[key].state == "success"
+        assert second[key].state == "failure"
+        assert second[key].statuses == {"ci/0": "success"}
+        headers = [c[1]["headers"] for c in session.get.call_args_list]
+        assert "If-None-Match" not in headers[0]
+        assert {h.get("If-None-Match") for h in headers[2:]} == {'"s"', '"c"'}
+
+    def test_records_errors(self, session, repository):
+        self.respond(
+            session,
+            {"status": [mock_response(404, {"message": "Not Found"})]},
+        )
+        poller = StatusPoller()
+
+        assert poller.poll([(repository, "abc")]) == {}
+        assert isinstance(
+            poller.errors[("octocat/Hello-World", "abc")],
+            github3.exceptions.NotFoundError,
+        )
+
+    def test_records_connection_errors(self, session, repository):
+        error = github3.exceptions.ConnectionError(Exception("reset"))
+        session.get.side_effect = error
+        poller = StatusPoller()
+
+        assert poller.poll([(repository, "abc")]) == {}
+        assert poller.errors == {("octocat/Hello-World", "abc"): error}
+
+    def test_follows_pages_of_statuses(self, session, repository):
+        self.respond(
+            session,
+            {
+                "status": [
+                    mock_response(
+                        200,
+                        _combined("success"),
+                        links={"next": {"url": "https://next/status"}},
+                    ),
+                    mock_response(
+                        200,
+                        {
+                            "state": "failure",
+                            "statuses": [
+                                {"context": "ci/deploy", "state": "failure"}
+                            ],
+                        },
+                    ),
+                ],
+                "check-runs": [mock_response(200, _runs())],
+            },
+        )
+
+        summaries = StatusPoller().poll([(repository, "abc")])
+
+        summary = summaries[("octocat/Hello-World", "abc")]
+        assert summary.state == "failure"
+        assert summary.statuses == {"ci/0": "success", "ci/deploy": "failure"}
+
+    @pytest.mark.parametrize(
+        "statuses, runs, state",
+        [
+            ((), (), "pending"),
+            (("success",), (), "success"),
+            (("error",), (("build", "completed", "success"),), "failure"),
+            ((), (("build", "completed", "timed_out"),), "failure"),
+            ((), (("build", "completed", "skipped"),), "success"),
+            (("pending",), (("build", "completed", "success"),), "pending"),
+        ],
+    )
+    def test_state(self, statuses, runs, state):
+        summary = github3.repos.status._summarize(
+            mock.Mock(full_name="o/r"),
+            "abc",
+            _combined(*statuses),
+            _runs(*runs)["check_runs"],
+        )
+        assert summary.state == state
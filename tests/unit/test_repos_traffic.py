@@ -0,0 +1,64 @@
+"""Unit tests for repository traffic."""
+
+import unittest.mock
+
+import pytest
+
+from github3 import exceptions
+from github3.repos import traffic
+
+
+def views(count, uniques, points):
+    return traffic.ViewsStats(
+        {
+            "count": count,
+            "uniques": uniques,
+            "views": [
+                {
+                    "timestamp": f"2024-01-0{day}T00:00:00Z",
+                    "count": c,
+                    "uniques": u,
+                }
+                for day, c, u in points
+            ],
+        },
+        None,
+    )
+
+
+def repository(name, stat=None, error=None):
+    repo = unittest.mock.Mock(views=unittest.mock.Mock(return_value=stat))
+    repo.__str__ = lambda self: name
+    if error is not None:
+        repo.views.side_effect = error
+    return repo
+
+
+class TestFetchTraffic:
+    def test_aligns_timestamps(self):
+        forbidden = exceptions.ForbiddenError(
+            unittest.mock.Mock(status_code=403, json=lambda: {})
+        )
+        table = traffic.fetch_traffic(
+            [
+                repository("org/b", views(5, 2, [(2, 3, 1), (3, 2, 1)])),
+                repository("org/a", views(4, 1, [(1, 4, 1)])),
+                repository("org/c", error=forbidden),
+            ]
+        )
+
+        assert table.repositories == ["org/a", "org/b"]
+        assert table.failed == ["org/c"]
+        assert len(table.timestamps) == 3
+        assert list(table.counts) == [4, 0, 0, 0, 3, 2]
+        assert list(table.uniques) == [1, 0, 0, 0, 1, 1]
+        assert list(table.total_counts) == [4, 5]
+        assert list(table.totals_by_timestamp()) == [4, 3, 2]
+        counts, uniques = table.row("org/b")
+        assert list(counts) == [0, 3, 2]
+
+    def test_validates_arguments(self):
+        with pytest.raises(ValueError):
+            traffic.fetch_traffic([], kind="stars")
+        with pytest.raises(ValueError):
+            traffic.fetch_traffic([], per="month")
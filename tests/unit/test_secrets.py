@@ -1,5 +1,9 @@
 """Secret unit tests."""
 
+import base64
+import datetime
+import unittest.mock
+
 import pytest
 
 import github3
@@ -120,3 +124,111 @@ class TestOrganizationSecretIterators(helper.UnitIteratorHelper):
             params={"per_page": 100},
             headers={},
         )
+
+
+class TestPublicKey:
+    def test_encrypt(self):
+        public = pytest.importorskip("nacl.public")
+        private_key = public.PrivateKey.generate()
+        key = github3.actions.PublicKey(
+            {
+                "key_id": "1",
+                "key": base64.b64encode(
+                    bytes(private_key.public_key)
+                ).decode(),
+            },
+            None,
+        )
+
+        sealed = base64.b64decode(key.encrypt("hunter2"))
+
+        assert public.SealedBox(private_key).decrypt(sealed) == b"hunter2"
+
+
+@pytest.fixture
+def repository():
+    repository = helper.mock_repository()
+    repository.public_key = unittest.mock.Mock(
+        side_effect=lambda: unittest.mock.Mock(
+            key_id="568250167242549743",
+            encrypt=lambda value: "sealed " + value,
+        )
+    )
+    return repository
+
+
+secret_url = (
+    "https://api.github.com/repos/octocat/Hello-World/actions/secrets/TOKEN"
+)
+
+
+class TestSecretsManager:
+    def test_update_repository(self, repository):
+        manager = github3.actions.SecretsManager(github3.GitHub())
+        repository.session.put.return_value = helper.mock_response(204)
+
+        assert (
+            manager.update_repository(repository, "TOKEN", "1") == "updated"
+        )
+        assert (
+            manager.update_repository(repository, "TOKEN", "2") == "updated"
+        )
+
+        repository.session.put.assert_called_with(
+            secret_url,
+            json={
+                "encrypted_value": "sealed 2",
+                "key_id": "568250167242549743",
+            },
+        )
+        # The public key is cached
+        assert repository.public_key.call_count == 1
+
+    def test_update_repository_skips_updated_secrets(self, repository):
+        manager = github3.actions.SecretsManager(github3.GitHub())
+        repository.session.get.return_value = helper.mock_response(
+            200, get_secret_examlple_data()
+        )
+        since = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+        result = manager.update_repository(
+            repository, "TOKEN", "1", not_updated_since=since
+        )
+
+        assert result == "skipped"
+        repository.session.put.assert_not_called()
+
+    def test_update_repository_refreshes_stale_keys(self, repository):
+        manager = github3.actions.SecretsManager(github3.GitHub())
+        repository.session.put.side_effect = [
+            helper.mock_response(422),
+            helper.mock_response(201),
+        ]
+
+        assert (
+            manager.update_repository(repository, "TOKEN", "1") == "updated"
+        )
+        assert repository.public_key.call_count == 2
+
+    def test_update_repositories(self, repository):
+        manager = github3.actions.SecretsManager(github3.GitHub())
+        failing = unittest.mock.Mock(full_name="octocat/failing")
+        failing._api = "https://api.github.com/repos/octocat/failing"
+        failing._build_url.return_value = secret_url
+        error = github3.exceptions.NotFoundError(
+            helper.mock_response(404, {})
+        )
+        failing._put.side_effect = error
+        failing.public_key.return_value = unittest.mock.Mock(
+            key_id="1", encrypt=str
+        )
+        repository.session.put.return_value = helper.mock_response(201)
+
+        results = manager.update_repositories(
+            [repository, failing], "TOKEN", "1"
+        )
+
+        assert results == {
+            "octocat/Hello-World": "updated",
+            "octocat/failing": error,
+        }
@@ -1,10 +1,15 @@
 import io
+import os
+import tarfile
 import unittest.mock
 from datetime import datetime
 
 import pytest
 import requests
 
+from github3.utils import extract_tarball_response
+from github3.utils import imap_unordered
+from github3.utils import iter_tarball_members
 from github3.utils import stream_response_to_file
 from github3.utils import timestamp_parameter
 
@@ -93,3 +98,84 @@ class TestStreamingDownloads:
         mocked_open.assert_called_once_with("a_file_name", "wb")
         mocked_open().write.assert_called_once_with(b"fake data")
         mocked_open().close.assert_called_once_with()
+
+
+def build_tarball(members):
+    """Build a gzipped tarball like the ones GitHub generates."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as archive:
+        for name, data in members:
+            info = tarfile.TarInfo("octocat-Hello-World-7fd1a60/" + name)
+            if data is None:
+                info.type = tarfile.DIRTYPE
+                archive.addfile(info)
+            elif isinstance(data, tuple):
+                info.type = tarfile.SYMTYPE
+                info.linkname = data[0]
+                archive.addfile(info)
+            else:
+                info.size = len(data)
+                archive.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+@pytest.fixture
+def tarball_response():
+    r = requests.Response()
+    r.raw = unittest.mock.Mock(
+        wraps=io.BytesIO(
+            build_tarball(
+                [
+                    ("README", b"Hello World!"),
+                    ("src", None),
+                    ("src/main.py", b"print('hi')"),
+                    ("vendor", None),
+                    ("vendor/lib.py", b"pass"),
+                    ("link", ("README",)),
+                    ("escape", ("../../etc/passwd",)),
+                ]
+            )
+        )
+    )
+    return r
+
+
+class TestStreamingTarballs:
+    def test_iter_members_strips_top_level_directory(self, tarball_response):
+        members = [
+            (member.name, fd.read() if fd else None)
+            for member, fd in iter_tarball_members(tarball_response)
+        ]
+        assert members[:3] == [
+            ("README", b"Hello World!"),
+            ("src", None),
+            ("src/main.py", b"print('hi')"),
+        ]
+
+    def test_iter_members_filters_paths(self, tarball_response):
+        names = [
+            member.name
+            for member, _ in iter_tarball_members(
+                tarball_response, paths=["src/"]
+            )
+        ]
+        assert names == ["src", "src/main.py"]
+
+    def test_extract(self, tarball_response, tmp_path):
+        extracted = extract_tarball_response(
+            tarball_response, str(tmp_path), paths=["README", "src", "link"]
+        )
+        assert extracted == ["README", "src", "src/main.py", "link"]
+        assert (tmp_path / "src" / "main.py").read_bytes() == b"print('hi')"
+        assert os.readlink(str(tmp_path / "link")) == "README"
+        assert not (tmp_path / "vendor").exists()
+
+    def test_extract_skips_escaping_links(self, tarball_response, tmp_path):
+        extracted = extract_tarball_response(tarball_response, str(tmp_path))
+        assert "escape" not in extracted
+        assert not os.path.lexists(str(tmp_path / "escape"))
+
+
+def test_imap_unordered():
+    results = imap_unordered(lambda x: x * 2, iter(range(50)), max_workers=3)
+    assert sorted(results) == [(x, x * 2) for x in range(50)]
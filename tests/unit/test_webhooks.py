@@ -0,0 +1,217 @@
+"""Unit tests for the webhooks module."""
+
+import asyncio
+import io
+import json
+import threading
+import wsgiref.simple_server
+
+import requests
+
+from github3 import events
+from github3.webhooks import Delivery
+from github3.webhooks import SignatureVerifier
+from github3.webhooks import WebhookReceiver
+from github3.webhooks import verify_signature
+
+from .helper import create_example_data_helper
+
+get_pull_request_example_data = create_example_data_helper(
+    "pull_request_example"
+)
+
+SECRET = "It's a Secret to Everybody"
+BODY = b"Hello, World!"
+# Example from GitHub's documentation on validating webhook deliveries
+SIGNATURE = (
+    "sha256=757107ea0eb2509fc211221cce984b8a37570b6d7586c22c46f4379c8b043e17"
+)
+
+
+def _payload(**kwargs):
+    return json.dumps(kwargs).encode()
+
+
+def _headers(body, event="ping", verifier=SignatureVerifier(SECRET)):
+    return {
+        "x-github-event": event,
+        "x-github-delivery": "72d3162e",
+        "x-hub-signature-256": verifier.signature(body),
+    }
+
+
+class TestSignatureVerifier:
+    def test_verify(self):
+        verifier = SignatureVerifier(SECRET)
+        assert verifier.signature(BODY) == SIGNATURE
+        assert verifier.verify(BODY, SIGNATURE) is True
+        # The keyed HMAC must not be consumed by a verification
+        assert verifier.verify(BODY, SIGNATURE) is True
+
+    def test_verify_rejects_bad_signatures(self):
+        verifier = SignatureVerifier(SECRET.encode())
+        assert verifier.verify(BODY + b"!", SIGNATURE) is False
+        assert verifier.verify(BODY, SIGNATURE[:-1]) is False
+        assert verifier.verify(BODY, "md5=" + SIGNATURE[7:]) is False
+        assert verifier.verify(BODY, None) is False
+
+    def test_verify_legacy_sha1(self):
+        verifier = SignatureVerifier(SECRET)
+        signature = verifier.signature(BODY, "sha1")
+        assert signature.startswith("sha1=")
+        assert verifier.verify(BODY, signature) is True
+
+    def test_verify_signature(self):
+        assert verify_signature(SECRET, BODY, SIGNATURE) is True
+        assert verify_signature("other", BODY, SIGNATURE) is False
+
+
+class TestDelivery:
+    def test_payload(self):
+        body = _payload(
+            action="opened", pull_request=get_pull_request_example_data()
+        )
+        delivery = Delivery("pull_request", "1", body)
+        assert delivery.action == "opened"
+        payload = delivery.payload
+        assert isinstance(payload["pull_request"], events.EventPullRequest)
+        assert payload["pull_request"].number == 1347
+        # The decoded JSON is left as it was
+        assert isinstance(delivery.json["pull_request"], dict)
+
+    def test_payload_for_unknown_events(self):
+        delivery = Delivery("check_suite", "1", _payload(action="completed"))
+        assert delivery.payload == {"action": "completed"}
+
+
+class TestWebhookReceiver:
+    def test_dispatch(self):
+        receiver = WebhookReceiver(SECRET)
+        seen = []
+        receiver.on("push", lambda delivery: seen.append(("push", delivery)))
+
+        @receiver.on("*")
+        def everything(delivery):
+            seen.append(("*", delivery))
+
+        push = Delivery("push", "1", b"{}")
+        ping = Delivery("ping", "2", b"{}")
+        receiver.dispatch(push)
+        receiver.dispatch(ping)
+        assert seen == [("push", push), ("*", push), ("*", ping)]
+
+    def test_dispatch_continues_after_failing_handler(self):
+        receiver = WebhookReceiver(SECRET)
+        seen = []
+        receiver.on("push", lambda delivery: 1 / 0)
+        receiver.on("push", seen.append)
+        delivery = Delivery("push", "1", b"{}")
+        receiver.dispatch(delivery)
+        assert seen == [delivery]
+
+    def test_receive(self):
+        receiver = WebhookReceiver(SECRET)
+        body = _payload(zen="Keep it logically awesome.")
+        assert receiver.receive(_headers(body), body) == (202, "Accepted")
+        delivery = receiver.queue.get_nowait()
+        assert (delivery.event, delivery.id) == ("ping", "72d3162e")
+
+    def test_receive_rejects_bad_signatures(self):
+        receiver = WebhookReceiver(SECRET)
+        headers = _headers(BODY)
+        assert receiver.receive(headers, b"forged")[0] == 401
+        del headers["x-hub-signature-256"]
+        assert receiver.receive(headers, BODY)[0] == 401
+        assert receiver.queue.empty()
+
+    def test_receive_when_queue_is_full(self):
+        receiver = WebhookReceiver(SECRET, max_queue_size=1)
+        assert receiver.receive(_headers(BODY), BODY)[0] == 202
+        assert receiver.receive(_headers(BODY), BODY)[0] == 503
+
+    def test_workers(self):
+        receiver = WebhookReceiver(SECRET, max_workers=2)
+        seen = []
+        receiver.on("ping", seen.append)
+        receiver.start()
+        for _ in range(5):
+            receiver.receive(_headers(BODY), BODY)
+        receiver.stop()
+        assert len(seen) == 5
+
+    def test_wsgi(self):
+        receiver = WebhookReceiver(SECRET)
+        responses = []
+        environ = {
+            "REQUEST_METHOD": "POST",
+            "CONTENT_LENGTH": str(len(BODY)),
+            "wsgi.input": io.BytesIO(BODY),
+            "HTTP_X_GITHUB_EVENT": "ping",
+            "HTTP_X_HUB_SIGNATURE_256": SIGNATURE,
+        }
+        body = receiver(environ, lambda *args: responses.append(args))
+        assert responses[0][0] == "202 Accepted"
+        assert body == [b"Accepted"]
+
+        receiver(
+            {"REQUEST_METHOD": "GET"}, lambda *args: responses.append(args)
+        )
+        assert responses[1][0] == "405 Method Not Allowed"
+
+    def test_wsgi_local_server(self):
+        receiver = WebhookReceiver(SECRET)
+        seen = []
+        receiver.on("ping", seen.append)
+        receiver.start()
+        server = wsgiref.simple_server.make_server(
+            "127.0.0.1", 0, receiver, handler_class=_QuietHandler
+        )
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = "http://127.0.0.1:{}/".format(server.server_port)
+            headers = {
+                "X-GitHub-Event": "ping",
+                "X-GitHub-Delivery": "72d3162e",
+                "X-Hub-Signature-256": SIGNATURE,
+            }
+            assert requests.post(url, data=BODY, headers=headers).ok
+            headers["X-Hub-Signature-256"] = "sha256=0"
+            response = requests.post(url, data=BODY, headers=headers)
+            assert response.status_code == 401
+        finally:
+            server.shutdown()
+            server.server_close()
+            receiver.stop()
+        assert [delivery.body for delivery in seen] == [BODY]
+
+    def test_asgi(self):
+        receiver = WebhookReceiver(SECRET)
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "headers": [
+                (b"X-GitHub-Event", b"ping"),
+                (b"X-Hub-Signature-256", SIGNATURE.encode()),
+            ],
+        }
+        messages = [
+            {"type": "http.request", "body": BODY[:5], "more_body": True},
+            {"type": "http.request", "body": BODY[5:]},
+        ]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(receiver.asgi(scope, receive, send))
+        assert sent[0]["status"] == 202
+        assert receiver.queue.get_nowait().body == BODY
+
+
+class _QuietHandler(wsgiref.simple_server.WSGIRequestHandler):
+    def log_message(self, *args):
+        pass